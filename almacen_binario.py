@@ -0,0 +1,180 @@
+import mmap
+import struct
+
+from cartilla import Cartilla
+from gestor_json import GestorJSON
+
+# Cabecera: firma, versión, bytes del código, reservado, cantidad de cartillas
+_CABECERA = struct.Struct("<4sBBHI")
+_FIRMA = b"BNGO"
+_VERSION = 1
+TAMAÑO_CODIGO = 32
+
+
+class AlmacenBinario:
+    """
+    Almacén compacto de cartillas en registros de tamaño fijo:
+    código (32 bytes UTF-8), 25 bytes de números y 4 bytes con los bits de marcados.
+    La lectura usa mmap, así que abrir el archivo es inmediato y el sistema
+    operativo trae a memoria solo las páginas de las cartillas que se leen.
+    """
+
+    def __init__(self, archivo="cartillas.bin"):
+        self.archivo = archivo
+        self._archivo_abierto = None
+        self._mapa = None
+        self._registro = None
+        self.total = 0
+        self._indices = None
+
+    # ---------- Escritura ----------
+
+    def guardar(self, cartillas, tamaño_codigo=TAMAÑO_CODIGO):
+        """
+        Escribe cartillas en formato binario
+
+        Args:
+            cartillas: Iterable de objetos Cartilla (puede ser un generador)
+            tamaño_codigo (int): Bytes reservados para el código de cada cartilla
+
+        Returns:
+            int: Cantidad de cartillas escritas
+        """
+        registros = ((cartilla.codigo, cartilla.numeros, cartilla.obtener_mascara())
+                     for cartilla in cartillas)
+        return self.guardar_registros(registros, tamaño_codigo)
+
+    def guardar_registros(self, registros, tamaño_codigo=TAMAÑO_CODIGO):
+        """
+        Escribe registros ya armados, sin crear objetos Cartilla (generación masiva)
+
+        Args:
+            registros: Iterable de (codigo, numeros, marcas) con numeros como 25 bytes
+            tamaño_codigo (int): Bytes reservados para el código de cada cartilla
+
+        Returns:
+            int: Cantidad de cartillas escritas
+        """
+        registro = struct.Struct(f"<{tamaño_codigo}s25sI")
+        total = 0
+        with open(self.archivo, 'wb') as f:
+            f.write(_CABECERA.pack(_FIRMA, _VERSION, tamaño_codigo, 0, 0))
+            for codigo_texto, numeros, marcas in registros:
+                codigo = str(codigo_texto).encode('utf-8')
+                if len(codigo) > tamaño_codigo:
+                    raise ValueError(f"El código '{codigo_texto}' supera {tamaño_codigo} bytes")
+                f.write(registro.pack(codigo, numeros, marcas))
+                total += 1
+            # Completar la cabecera con la cantidad final
+            f.seek(0)
+            f.write(_CABECERA.pack(_FIRMA, _VERSION, tamaño_codigo, 0, total))
+        return total
+
+    # ---------- Lectura con mmap ----------
+
+    def abrir(self):
+        """
+        Mapea el archivo en memoria y lee la cabecera
+
+        Raises:
+            ValueError: Si el archivo está vacío, no es un almacén o le faltan registros
+        """
+        self._archivo_abierto = open(self.archivo, 'rb')
+        try:
+            self._mapa = mmap.mmap(self._archivo_abierto.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # mmap no puede mapear un archivo vacío
+            self.cerrar()
+            raise ValueError(f"'{self.archivo}' está vacío") from None
+        if len(self._mapa) < _CABECERA.size:
+            self.cerrar()
+            raise ValueError(f"'{self.archivo}' no es un almacén de cartillas válido")
+        firma, version, tamaño_codigo, _, total = _CABECERA.unpack_from(self._mapa, 0)
+        if firma != _FIRMA or version != _VERSION:
+            self.cerrar()
+            raise ValueError(f"'{self.archivo}' no es un almacén de cartillas válido")
+        self._registro = struct.Struct(f"<{tamaño_codigo}s25sI")
+        if len(self._mapa) < _CABECERA.size + total * self._registro.size:
+            self.cerrar()
+            raise ValueError(f"'{self.archivo}' está truncado: la cabecera indica {total} cartillas")
+        self.total = total
+        self._indices = None
+        return self
+
+    def cerrar(self):
+        """Libera el mapa de memoria y el archivo"""
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+        if self._archivo_abierto is not None:
+            self._archivo_abierto.close()
+            self._archivo_abierto = None
+
+    def __enter__(self):
+        return self.abrir()
+
+    def __exit__(self, *args):
+        self.cerrar()
+
+    def __len__(self):
+        return self.total
+
+    def leer(self, indice):
+        """
+        Lee un registro sin tocar el resto del archivo
+
+        Args:
+            indice (int): Posición de la cartilla (0 a total-1)
+
+        Returns:
+            tuple: (codigo, numeros, marcas) con numeros como bytes de 25 valores
+        """
+        if not 0 <= indice < self.total:
+            raise IndexError(f"Cartilla {indice} fuera de rango (total: {self.total})")
+        desplazamiento = _CABECERA.size + indice * self._registro.size
+        codigo, numeros, marcas = self._registro.unpack_from(self._mapa, desplazamiento)
+        return codigo.rstrip(b"\0").decode('utf-8'), numeros, marcas
+
+    def __iter__(self):
+        for indice in range(self.total):
+            yield self.leer(indice)
+
+    def cartilla(self, indice):
+        """Construye la Cartilla del registro indicado"""
+        return Cartilla.desde_registro(*self.leer(indice))
+
+    def buscar(self, codigo):
+        """
+        Busca la posición de una cartilla por código
+        El índice de códigos se construye la primera vez que se usa
+
+        Returns:
+            int: Posición de la cartilla, o None si no existe
+        """
+        if self._indices is None:
+            self._indices = {registro[0]: indice for indice, registro in enumerate(self)}
+        return self._indices.get(codigo)
+
+
+def convertir_json_a_binario(archivo_json="cartillas.json", archivo_binario="cartillas.bin"):
+    """
+    Convierte cartillas.json al formato binario (leyendo el JSON en streaming)
+
+    Returns:
+        int: Cantidad de cartillas convertidas
+    """
+    cartillas = (Cartilla.desde_json(codigo, datos)
+                 for codigo, datos in GestorJSON(archivo_json).iterar_cartillas())
+    return AlmacenBinario(archivo_binario).guardar(cartillas)
+
+
+def convertir_binario_a_json(archivo_binario="cartillas.bin", archivo_json="cartillas.json"):
+    """
+    Convierte un almacén binario al formato de cartillas.json (escribiendo cartilla por cartilla)
+
+    Returns:
+        int: Cantidad de cartillas convertidas
+    """
+    with AlmacenBinario(archivo_binario) as almacen:
+        return GestorJSON(archivo_json).escribir_cartillas(
+            (codigo, Cartilla.desde_registro(codigo, numeros, marcas)) for codigo, numeros, marcas in almacen
+        )
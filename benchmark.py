@@ -0,0 +1,168 @@
+"""
+Mediciones del camino crítico del juego (sortear, marcar, verificar) y de la persistencia.
+Todo es reproducible: las cartillas y el orden de las bolas salen de la semilla.
+
+Uso: python benchmark.py [--cartillas 1000,10000,100000] [--motores python,numpy]
+                         [--semilla 0] [--salida benchmark.json]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+
+from cartilla import Cartilla
+from generador_cartillas import GeneradorCartillas
+from gestor_json import GestorJSON
+from juego_bingo import JuegoBingo
+from patrones import PATRONES
+
+# Cartillas usadas para medir verificar_patron (el costo por llamada no depende del total)
+MUESTRA_PATRONES = 10000
+
+
+def _estadisticas(tiempos):
+    """Resumen en milisegundos de una lista de tiempos en segundos"""
+    ordenados = sorted(tiempos)
+    n = len(ordenados)
+    return {
+        "total_ms": 1000 * sum(ordenados),
+        "media_ms": 1000 * sum(ordenados) / n,
+        "p50_ms": 1000 * ordenados[n // 2],
+        "p95_ms": 1000 * ordenados[min(n - 1, int(n * 0.95))],
+        "max_ms": 1000 * ordenados[-1],
+    }
+
+
+def _version():
+    """Commit actual, para comparar resultados entre versiones"""
+    try:
+        salida = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), timeout=5)
+        return salida.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def medir(cantidad, motor, semilla=0):
+    """
+    Mide un tamaño de pozo con un motor
+
+    Args:
+        cantidad (int): Cartillas del pozo
+        motor (str): Motor de JuegoBingo ('python' o 'numpy')
+        semilla (int): Semilla de las cartillas y del orden de las bolas
+
+    Returns:
+        dict: Tiempos de cada operación
+    """
+    cartillas = [(codigo, list(numeros)) for codigo, numeros in GeneradorCartillas(semilla).generar(cantidad)]
+    bolas = random.Random(semilla).sample(range(1, 91), 90)
+    resultado = {"cartillas": cantidad, "motor": motor}
+
+    # Armar el juego cartilla por cartilla
+    inicio = time.perf_counter()
+    juego = JuegoBingo(motor, cargar_cartillas=False)
+    for codigo, numeros in cartillas:
+        juego.agregar_cartilla(codigo, numeros)
+    resultado["agregar_s"] = time.perf_counter() - inicio
+    # El generador no repite cartillas: si alguna se rechazó, los tiempos no son comparables
+    assert len(juego.cartillas) == cantidad
+
+    # Sorteo completo: cada bola marca y verifica ganadores (sin pasar de ronda)
+    tiempos = []
+    resultado["primer_ganador_bola"] = None
+    for orden, numero in enumerate(bolas, 1):
+        inicio = time.perf_counter()
+        juego.ingresar_numero(numero)
+        tiempos.append(time.perf_counter() - inicio)
+        if resultado["primer_ganador_bola"] is None and juego.cartillas_ganadoras:
+            resultado["primer_ganador_bola"] = orden
+    resultado["bola"] = _estadisticas(tiempos)
+
+    # Verificación completa de todas las cartillas (sin contadores de las bolas tocadas)
+    todas = list(juego.cartillas.values())
+    inicio = time.perf_counter()
+    juego._verificar_ganadores_automatico(todas, avanzar_rondas=False)
+    resultado["verificar_todas_ms"] = 1000 * (time.perf_counter() - inicio)
+
+    # Reiniciar el sorteo (cambio de ronda)
+    inicio = time.perf_counter()
+    juego.reiniciar_sorteo()
+    resultado["reiniciar_sorteo_ms"] = 1000 * (time.perf_counter() - inicio)
+
+    # Cartilla.verificar_patron por patrón, sobre una muestra con media cartilla marcada
+    muestra = [Cartilla(codigo, numeros) for codigo, numeros in cartillas[:MUESTRA_PATRONES]]
+    mitad = set(bolas[:45])
+    for cartilla in muestra:
+        for posicion, numero in enumerate(cartilla.numeros):
+            if numero in mitad:
+                cartilla.marcar_posicion(posicion)
+    resultado["verificar_patron_us"] = {}
+    for patron in PATRONES:
+        inicio = time.perf_counter()
+        for cartilla in muestra:
+            cartilla.verificar_patron(patron)
+        resultado["verificar_patron_us"][patron] = 1e6 * (time.perf_counter() - inicio) / len(muestra)
+
+    # Guardar y cargar cartillas.json
+    with tempfile.TemporaryDirectory() as carpeta:
+        archivo = os.path.join(carpeta, "cartillas.json")
+        gestor = GestorJSON(archivo)
+        with contextlib.redirect_stdout(io.StringIO()):
+            inicio = time.perf_counter()
+            gestor.guardar_cartillas(juego.cartillas)
+            resultado["guardar_json_s"] = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            cargadas = [Cartilla.desde_json(codigo, datos) for codigo, datos in gestor.iterar_cartillas()]
+            resultado["cargar_json_s"] = time.perf_counter() - inicio
+        resultado["json_bytes"] = os.path.getsize(archivo)
+    assert len(cargadas) == cantidad
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del juego de bingo")
+    parser.add_argument("--cartillas", default="1000,10000,100000",
+                        help="Tamaños de pozo separados por comas (ej. 1000,10000,100000,1000000)")
+    parser.add_argument("--motores", default="python,numpy", help="Motores a comparar")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--salida", default="benchmark.json", help="Archivo JSON de resultados")
+    argumentos = parser.parse_args()
+
+    informe = {
+        "fecha": datetime.now().isoformat(),
+        "version": _version(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "semilla": argumentos.semilla,
+        "resultados": [],
+        "omitidos": [],
+    }
+    for cantidad in (int(c) for c in argumentos.cartillas.split(",")):
+        for motor in argumentos.motores.split(","):
+            try:
+                resultado = medir(cantidad, motor, argumentos.semilla)
+            except ImportError as e:
+                informe["omitidos"].append({"cartillas": cantidad, "motor": motor, "motivo": str(e)})
+                print(f"⚠️  {motor} omitido: {e}")
+                continue
+            informe["resultados"].append(resultado)
+            bola = resultado["bola"]
+            print(f"⏱️  {cantidad:>8} cartillas [{motor}] agregar {resultado['agregar_s']:.2f}s · "
+                  f"bola media {bola['media_ms']:.3f}ms p95 {bola['p95_ms']:.3f}ms · "
+                  f"JSON guardar {resultado['guardar_json_s']:.2f}s cargar {resultado['cargar_json_s']:.2f}s")
+
+    with open(argumentos.salida, 'w', encoding='utf-8') as f:
+        json.dump(informe, f, indent=2, ensure_ascii=False)
+    print(f"✅ Resultados guardados en '{argumentos.salida}'")
+
+
+if __name__ == "__main__":
+    main()
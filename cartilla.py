@@ -1,5 +1,27 @@
+from contexto_ronda import ContextoRonda
+from patrones import (PATRONES, CELDAS_PATRONES, CENTRO, contar_bits,
+                      mascara_desde_matriz, matriz_desde_mascara)
+
+
+# Contexto de las cartillas sueltas, fuera de un juego (su época nunca cambia)
+RONDA_LIBRE = ContextoRonda()
+
+# Texto de cada celda según su número, compartido por todas las cartillas
+CELDA_LIBRE = tuple(f" {n:2d}  " for n in range(256))
+CELDA_MARCADA = tuple(f"[{n:2d}] " for n in range(256))
+BORDE_SUPERIOR = "┌─────────────────────────────┐"
+BORDE_INFERIOR = "└─────────────────────────────┘"
+
+
 class Cartilla:
-    """Clase para representar una cartilla de bingo (5x5)"""
+    """
+    Clase para representar una cartilla de bingo (5x5)
+    Sin __dict__: los 25 números van en bytes y las marcas en un entero de 25 bits;
+    `matriz` y `marcados` se construyen al pedirlos
+    """
+    
+    __slots__ = ("codigo", "_numeros", "_marcas", "_patron", "_faltantes", "_celdas_patron",
+                 "_contexto", "_epoca")
     
     def __init__(self, codigo, numeros):
         """
@@ -7,23 +29,162 @@ class Cartilla:
         
         Args:
             codigo (str): Identificador único de la cartilla
-            numeros (list): Lista de 25 números en una matriz 5x5
+            numeros (list): Lista de 25 números en una matriz 5x5 (o bytes)
         """
         self.codigo = codigo
-        self.matriz = self._convertir_a_matriz(numeros)
-        self.marcados = [[False for _ in range(5)] for _ in range(5)]
-        # Marcar el centro (posición 2,2) como especial
-        self.marcados[2][2] = True  # Centro es automático en bingo tradicional
+        self._numeros = self._convertir_a_bytes(numeros)
+        # Marcados como entero de 25 bits (bit fila*5 + columna)
+        # Centro es automático en bingo tradicional
+        self._marcas = CENTRO
+        # Patrón seguido y celdas sin marcar que le faltan a cada alternativa
+        self._patron = None
+        self._faltantes = None
+        self._celdas_patron = None
+        # Ronda a la que pertenecen las marcas: si el contexto ya va por otra época, las marcas
+        # y los contadores se descartan la próxima vez que se toca la cartilla
+        self._contexto = RONDA_LIBRE
+        self._epoca = 0
+    
+    def usar_contexto(self, contexto):
+        """
+        Une la cartilla a la ronda de un juego conservando sus marcas actuales
+        
+        Args:
+            contexto (ContextoRonda): Contexto compartido por las cartillas del juego
+        """
+        self._contexto = contexto
+        self._epoca = contexto.epoca
+    
+    def _ponerse_al_dia(self):
+        """Empieza la ronda del contexto: solo el centro marcado y el patrón de la ronda"""
+        contexto = self._contexto
+        self._epoca = contexto.epoca
+        self._marcas = CENTRO
+        self._patron = contexto.patron
+        self._celdas_patron = contexto.celdas
+        self._faltantes = None if contexto.faltantes_iniciales is None else list(contexto.faltantes_iniciales)
+    
+    @property
+    def numeros(self):
+        """Los 25 números fila por fila (bytes, solo lectura)"""
+        return self._numeros
+    
+    @property
+    def matriz(self):
+        """Matriz 5x5 de números (se construye en cada consulta; para recorrer, usar `numeros`)"""
+        numeros = self.numeros
+        return [list(numeros[i*5:(i+1)*5]) for i in range(5)]
+    
+    @property
+    def marcados(self):
+        """Matriz 5x5 de booleanos derivada de los bits (solo lectura, se construye al pedirla)"""
+        return matriz_desde_mascara(self.obtener_mascara())
+    
+    @marcados.setter
+    def marcados(self, matriz):
+        if self._epoca != self._contexto.epoca:
+            self._ponerse_al_dia()
+        self._marcas = mascara_desde_matriz(matriz)
+        self._recalcular_faltantes()
+    
+    def reiniciar_marcados(self):
+        """Desmarca todas las celdas excepto el centro"""
+        if self._epoca != self._contexto.epoca:
+            self._ponerse_al_dia()
+            return
+        self._marcas = CENTRO
+        self._recalcular_faltantes()
+    
+    def seguir_patron(self, patron):
+        """
+        Activa los contadores de celdas faltantes para un patrón
+        A partir de aquí cada marca solo actualiza las alternativas que incluyen esa celda
+        
+        Args:
+            patron (str): Patrón a seguir (None para desactivar)
+        """
+        if self._epoca != self._contexto.epoca:
+            self._ponerse_al_dia()
+        patron = patron.upper() if patron else None
+        self._patron = patron if patron in PATRONES else None
+        self._celdas_patron = CELDAS_PATRONES.get(self._patron)
+        self._recalcular_faltantes()
+    
+    def _recalcular_faltantes(self):
+        """Recalcula desde los bits las celdas faltantes de cada alternativa del patrón seguido"""
+        if self._patron is None:
+            self._faltantes = None
+            return
+        libres = ~self._marcas
+        self._faltantes = [contar_bits(mascara & libres) for mascara in PATRONES[self._patron]]
+    
+    def completo_patron(self):
+        """
+        Indica si el patrón seguido ya está completo (sin recorrer la cartilla)
+        
+        Returns:
+            bool: True si alguna alternativa no tiene celdas faltantes
+        """
+        if self._epoca != self._contexto.epoca:
+            self._ponerse_al_dia()
+        return self._faltantes is not None and 0 in self._faltantes
+    
+    def faltantes_patron(self):
+        """
+        Cantidad mínima de celdas que faltan para completar el patrón seguido
+        
+        Returns:
+            int: Celdas faltantes, o None si no se sigue ningún patrón
+        """
+        if self._epoca != self._contexto.epoca:
+            self._ponerse_al_dia()
+        if self._faltantes is None:
+            return None
+        return min(self._faltantes)
     
-    def _convertir_a_matriz(self, numeros):
-        """Convierte lista de 25 números en matriz 5x5"""
+    @classmethod
+    def desde_json(cls, codigo, datos, con_marcados=True):
+        """
+        Crea una cartilla a partir de su entrada en cartillas.json
+        
+        Args:
+            codigo (str): Identificador de la cartilla
+            datos (dict): Entrada con "matriz" 5x5 y opcionalmente "marcados" 5x5
+            con_marcados (bool): Si es False, la cartilla empieza solo con el centro marcado
+            
+        Returns:
+            Cartilla: Nueva cartilla
+        """
+        cartilla = cls(codigo, [n for fila in datos["matriz"] for n in fila])
+        if con_marcados and datos.get("marcados") is not None:
+            cartilla.marcados = datos["marcados"]
+        return cartilla
+    
+    @classmethod
+    def desde_registro(cls, codigo, numeros, marcas):
+        """
+        Crea una cartilla a partir de un registro del almacén binario
+        
+        Args:
+            codigo (str): Identificador de la cartilla
+            numeros (bytes): Los 25 números en orden fila por fila
+            marcas (int): Bits de marcados (bit fila*5 + columna)
+            
+        Returns:
+            Cartilla: Nueva cartilla
+        """
+        cartilla = cls(codigo, numeros)
+        cartilla._marcas = marcas
+        return cartilla
+    
+    def _convertir_a_bytes(self, numeros):
+        """Convierte la lista de 25 números en 25 bytes (fila por fila)"""
         if len(numeros) != 25:
             raise ValueError("La cartilla debe tener exactamente 25 números")
-        matriz = []
-        for i in range(5):
-            fila = numeros[i*5:(i+1)*5]
-            matriz.append(fila)
-        return matriz
+        try:
+            return bytes(numeros)
+        except (TypeError, ValueError):
+            raise ValueError("Los números de la cartilla deben ser enteros entre 0 y 255") from None
     
     def marcar_numero(self, numero):
         """
@@ -35,182 +196,180 @@ class Cartilla:
         Returns:
             bool: True si el número fue encontrado y marcado
         """
-        for i in range(5):
-            for j in range(5):
-                if self.matriz[i][j] == numero:
-                    self.marcados[i][j] = True
-                    return True
-        return False
+        if not isinstance(numero, int) or not 0 <= numero <= 255:
+            return False
+        posicion = self.numeros.find(numero)
+        if posicion < 0:
+            return False
+        self.marcar_posicion(posicion)
+        return True
+    
+    def marcar_posicion(self, posicion):
+        """
+        Marca directamente una celda de la cartilla
+        
+        Args:
+            posicion (int): Índice de la celda (fila*5 + columna)
+            
+        Returns:
+            bool: True si la celda no estaba marcada
+        """
+        if self._epoca != self._contexto.epoca:
+            self._ponerse_al_dia()
+        bit = 1 << posicion
+        if self._marcas & bit:
+            return False
+        self._marcas |= bit
+        if self._faltantes is not None:
+            for k in self._celdas_patron[posicion]:
+                self._faltantes[k] -= 1
+        return True
+    
+    def desmarcar_posicion(self, posicion):
+        """
+        Desmarca directamente una celda de la cartilla (el centro nunca se desmarca)
+        
+        Args:
+            posicion (int): Índice de la celda (fila*5 + columna)
+            
+        Returns:
+            bool: True si la celda estaba marcada
+        """
+        if self._epoca != self._contexto.epoca:
+            self._ponerse_al_dia()
+        bit = 1 << posicion
+        if posicion == 12 or not self._marcas & bit:
+            return False
+        self._marcas &= ~bit
+        if self._faltantes is not None:
+            for k in self._celdas_patron[posicion]:
+                self._faltantes[k] += 1
+        return True
     
     def obtener_estado(self):
         """Retorna el estado actual de marcados"""
         return self.marcados
     
-    def verificar_linea(self):
-        """Verifica si hay una línea completa (horizontal)"""
-        for fila in self.marcados:
-            if all(fila):
+    def obtener_mascara(self):
+        """Retorna los marcados como entero de 25 bits (bit fila*5 + columna)"""
+        if self._epoca != self._contexto.epoca:
+            self._ponerse_al_dia()
+        return self._marcas
+    
+    def _cumple(self, alternativas):
+        """Verifica si alguna máscara alternativa está completamente marcada"""
+        if self._epoca != self._contexto.epoca:
+            self._ponerse_al_dia()
+        marcas = self._marcas
+        for mascara in alternativas:
+            if marcas & mascara == mascara:
                 return True
         return False
     
+    def verificar_linea(self):
+        """Verifica si hay una línea completa (horizontal)"""
+        return self._cumple(PATRONES['LINEA'])
+    
     def verificar_columna(self):
         """Verifica si hay una columna completa (vertical)"""
-        for j in range(5):
-            if all(self.marcados[i][j] for i in range(5)):
-                return True
-        return False
+        return self._cumple(PATRONES['COLUMNA'])
     
     def verificar_diagonal(self):
         """Verifica diagonales completas"""
-        # Diagonal principal (arriba-izquierda a abajo-derecha)
-        if all(self.marcados[i][i] for i in range(5)):
-            return True
-        # Diagonal secundaria (arriba-derecha a abajo-izquierda)
-        if all(self.marcados[i][4-i] for i in range(5)):
-            return True
-        return False
+        return self._cumple(PATRONES['DIAGONAL'])
     
     def verificar_x(self):
         """Verifica si forma una X (ambas diagonales)"""
-        diagonal1 = all(self.marcados[i][i] for i in range(5))
-        diagonal2 = all(self.marcados[i][4-i] for i in range(5))
-        return diagonal1 and diagonal2
+        return self._cumple(PATRONES['X'])
     
     def verificar_l(self):
         """Verifica si forma una L (última fila + última columna)"""
-        ultima_fila = all(self.marcados[4])
-        ultima_columna = all(self.marcados[i][4] for i in range(5))
-        return ultima_fila and ultima_columna
+        return self._cumple(PATRONES['L'])
     
     def verificar_z(self):
         """Verifica si forma una Z (primera fila + última fila + diagonal)"""
-        primera_fila = all(self.marcados[0])
-        ultima_fila = all(self.marcados[4])
-        diagonal = all(self.marcados[i][4-i] for i in range(5))
-        return primera_fila and ultima_fila and diagonal
+        return self._cumple(PATRONES['Z'])
     
     def verificar_b(self):
-        """Verifica si forma una B (primera columna + líneas interiores)"""
-        primera_columna = all(self.marcados[i][0] for i in range(5))
-        if not primera_columna:
-            return False
-        
-        # Verificar si hay línea en la fila 2 (medio)
-        fila_media = all(self.marcados[2])
-        
-        # Primera mitad (filas 0-1)
-        mitad_superior = all(self.marcados[i][4] for i in range(3))
-        
-        # Segunda mitad (filas 3-4)
-        mitad_inferior = all(self.marcados[i][4] for i in range(2, 5))
-        
-        return primera_columna and fila_media and mitad_superior and mitad_inferior
+        """Verifica si forma una B (primera columna + fila media + última columna)"""
+        return self._cumple(PATRONES['B'])
     
     def verificar_u(self):
         """Verifica si forma una U (columna izq + fila inferior + columna der)"""
-        columna_izq = all(self.marcados[i][0] for i in range(5))
-        fila_inferior = all(self.marcados[4])
-        columna_der = all(self.marcados[i][4] for i in range(5))
-        
-        return columna_izq and fila_inferior and columna_der
+        return self._cumple(PATRONES['U'])
     
     def verificar_t(self):
         """Verifica si forma una T (fila superior + columna central)"""
-        fila_superior = all(self.marcados[0])
-        columna_central = all(self.marcados[i][2] for i in range(5))
-        
-        return fila_superior and columna_central
+        return self._cumple(PATRONES['T'])
     
     def verificar_e(self):
         """Verifica si forma una E (primera columna + 3 líneas horizontales)"""
-        primera_columna = all(self.marcados[i][0] for i in range(5))
-        fila_superior = all(self.marcados[0])
-        fila_media = all(self.marcados[2])
-        fila_inferior = all(self.marcados[4])
-        
-        return primera_columna and fila_superior and fila_media and fila_inferior
+        return self._cumple(PATRONES['E'])
     
     def verificar_c(self):
         """Verifica si forma una C (primera columna + fila superior + fila inferior)"""
-        primera_columna = all(self.marcados[i][0] for i in range(5))
-        fila_superior = all(self.marcados[0])
-        fila_inferior = all(self.marcados[4])
-        
-        return primera_columna and fila_superior and fila_inferior
+        return self._cumple(PATRONES['C'])
     
     def verificar_cartilla_llena(self):
         """Verifica si toda la cartilla está marcada (apagón)"""
-        for fila in self.marcados:
-            if not all(fila):
-                return False
-        return True
+        return self._cumple(PATRONES['APAGON'])
     
     def verificar_patron(self, patron):
         """
-        Verifica un patrón específico
+        Verifica un patrón específico con sus máscaras precalculadas
         
         Args:
             patron (str): 'LINEA', 'COLUMNA', 'DIAGONAL', 'X', 'L', 'Z', 'B', 'U', 'T', 'E', 'C', 'APAGON'
+                o cualquier patrón registrado en patrones.PATRONES
             
         Returns:
             bool: True si se cumple el patrón
         """
-        patron = patron.upper()
-        
-        if patron == 'LINEA':
-            return self.verificar_linea()
-        elif patron == 'COLUMNA':
-            return self.verificar_columna()
-        elif patron == 'DIAGONAL':
-            return self.verificar_diagonal()
-        elif patron == 'X':
-            return self.verificar_x()
-        elif patron == 'L':
-            return self.verificar_l()
-        elif patron == 'Z':
-            return self.verificar_z()
-        elif patron == 'B':
-            return self.verificar_b()
-        elif patron == 'U':
-            return self.verificar_u()
-        elif patron == 'T':
-            return self.verificar_t()
-        elif patron == 'E':
-            return self.verificar_e()
-        elif patron == 'C':
-            return self.verificar_c()
-        elif patron == 'APAGON':
-            return self.verificar_cartilla_llena()
-        else:
+        alternativas = PATRONES.get(patron.upper())
+        if alternativas is None:
             return False
+        return self._cumple(alternativas)
+    
+    def texto_fila(self, fila, marcas=None, numeros=None):
+        """
+        Texto de una fila del recuadro de __str__
+        
+        Args:
+            fila (int): Fila (0-4)
+            marcas (int): Marcas a dibujar (por defecto las actuales)
+            numeros (bytes): Números de la cartilla, si ya se tienen a mano
+            
+        Returns:
+            str: La fila con sus bordes, con [nn] en las celdas marcadas
+        """
+        if marcas is None:
+            marcas = self.obtener_mascara()
+        if numeros is None:
+            numeros = self.numeros
+        inicio = fila * 5
+        return "│ " + "".join(
+            CELDA_MARCADA[numeros[p]] if marcas >> p & 1 else CELDA_LIBRE[numeros[p]]
+            for p in range(inicio, inicio + 5)
+        ) + "│"
     
     def __str__(self):
         """Representación en string de la cartilla"""
-        resultado = f"\n╔ Cartilla {self.codigo} ╗\n"
-        resultado += "┌─────────────────────────────┐\n"
-        
-        for i in range(5):
-            resultado += "│ "
-            for j in range(5):
-                num = self.matriz[i][j]
-                if self.marcados[i][j]:
-                    resultado += f"[{num:2d}] "
-                else:
-                    resultado += f" {num:2d}  "
-            resultado += "│\n"
-        
-        resultado += "└─────────────────────────────┘"
-        return resultado
+        numeros = self.numeros
+        marcas = self.obtener_mascara()
+        return "\n".join((f"\n╔ Cartilla {self.codigo} ╗", BORDE_SUPERIOR,
+                          *(self.texto_fila(i, marcas, numeros) for i in range(5)), BORDE_INFERIOR))
     
     def mostrar_simple(self):
         """Mostración simplificada de la cartilla"""
         print(f"\n📋 Cartilla {self.codigo}:")
         print("┌───────────────────────────┐")
+        numeros = self.numeros
+        marcas = self.obtener_mascara()
         for i in range(5):
             print("│", end="")
             for j in range(5):
-                num = self.matriz[i][j]
-                if self.marcados[i][j]:
+                num = numeros[i*5 + j]
+                if marcas >> (i*5 + j) & 1:
                     print(f" ✓{num:2d}", end="")
                 else:
                     print(f"  {num:2d}", end="")
@@ -0,0 +1,46 @@
+class ConjuntoOrdenado:
+    """
+    Conjunto que recuerda el orden de inserción (dict sin valores): `in`, agregar y quitar
+    son O(1) y al recorrerlo los elementos salen en el orden en que se agregaron.
+    Tiene la misma interfaz de lista que usa el juego (append, remove, join, len).
+    """
+
+    def __init__(self, elementos=()):
+        """
+        Args:
+            elementos (iterable): Elementos iniciales, en orden (los repetidos se ignoran)
+        """
+        self._elementos = dict.fromkeys(elementos)
+
+    def append(self, elemento):
+        """Agrega un elemento al final (si ya estaba, no cambia nada)"""
+        self._elementos[elemento] = None
+
+    def remove(self, elemento):
+        """Quita un elemento (ValueError si no estaba, como list.remove)"""
+        if elemento not in self._elementos:
+            raise ValueError(f"{elemento!r} no está en el conjunto")
+        del self._elementos[elemento]
+
+    def discard(self, elemento):
+        """Quita un elemento si estaba"""
+        self._elementos.pop(elemento, None)
+
+    def clear(self):
+        """Vacía el conjunto"""
+        self._elementos = {}
+
+    def __contains__(self, elemento):
+        return elemento in self._elementos
+
+    def __iter__(self):
+        return iter(self._elementos)
+
+    def __len__(self):
+        return len(self._elementos)
+
+    def __getitem__(self, indice):
+        return list(self._elementos)[indice]
+
+    def __repr__(self):
+        return repr(list(self._elementos))
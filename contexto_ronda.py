@@ -0,0 +1,48 @@
+from patrones import PATRONES, CELDAS_PATRONES, CENTRO, contar_bits
+
+
+class ContextoRonda:
+    """
+    Época de la ronda compartida por todas las cartillas de un juego. Empezar una ronda
+    solo incrementa la época (O(1)); cada cartilla compara su época con la del contexto
+    la próxima vez que se toca y, si quedó atrás, descarta sus marcas y adopta el patrón
+    de la ronda en ese momento. Así no se recorren ni se reconstruyen todas las cartillas
+    entre rondas.
+    """
+
+    def __init__(self, patron=None):
+        """
+        Args:
+            patron (str): Patrón que siguen las cartillas al ponerse al día (None = ninguno)
+        """
+        self.epoca = 0
+        self._fijar_patron(patron)
+
+    def _fijar_patron(self, patron):
+        patron = patron.upper() if patron else None
+        self.patron = patron if patron in PATRONES else None
+        self.celdas = CELDAS_PATRONES.get(self.patron)
+        # Celdas faltantes de cada alternativa con solo el centro marcado
+        if self.patron is None:
+            self.faltantes_iniciales = None
+        else:
+            self.faltantes_iniciales = tuple(contar_bits(mascara & ~CENTRO) for mascara in PATRONES[self.patron])
+
+    def nueva_ronda(self, patron=None):
+        """
+        Deja todas las cartillas sin marcas (salvo el centro) siguiendo un patrón, en O(1)
+
+        Args:
+            patron (str): Patrón de la nueva ronda (None para no seguir ninguno)
+        """
+        self.epoca += 1
+        self._fijar_patron(patron)
+
+    def distancia_inicial(self):
+        """
+        Returns:
+            int: Celdas que le faltan a una cartilla recién reiniciada, o None sin patrón
+        """
+        if self.faltantes_iniciales is None:
+            return None
+        return min(self.faltantes_iniciales)
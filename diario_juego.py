@@ -0,0 +1,74 @@
+import json
+import os
+import time
+
+
+class DiarioJuego:
+    """
+    Diario de eventos del juego, solo de escritura al final (una línea JSON por evento).
+    Cada evento se entrega al sistema operativo al escribirse; el fsync a disco se hace
+    por lotes (cada `lote` eventos o cada `intervalo` segundos) para no frenar cada bola.
+    """
+
+    def __init__(self, archivo="juego_diario.log", lote=32, intervalo=1.0, continuar=False):
+        """
+        Args:
+            archivo (str): Archivo del diario
+            lote (int): Eventos pendientes que fuerzan un fsync
+            intervalo (float): Segundos máximos entre fsync
+            continuar (bool): Si es True agrega al diario existente en lugar de empezar uno nuevo
+        """
+        self.archivo = archivo
+        self.lote = lote
+        self.intervalo = intervalo
+        self._f = open(archivo, 'a' if continuar else 'w', encoding='utf-8')
+        self._pendientes = 0
+        self._ultimo_fsync = time.monotonic()
+
+    def registrar(self, evento, **datos):
+        """
+        Agrega un evento al diario
+
+        Args:
+            evento (str): Tipo de evento ('snapshot', 'cartilla', 'numero', 'eliminar',
+                'ganador', 'ronda', 'patron', 'reinicio', 'reinicio_sorteo')
+            **datos: Campos propios del evento
+        """
+        datos["evento"] = evento
+        self._f.write(json.dumps(datos, ensure_ascii=False) + "\n")
+        self._f.flush()
+        self._pendientes += 1
+        if self._pendientes >= self.lote or time.monotonic() - self._ultimo_fsync >= self.intervalo:
+            self.sincronizar()
+
+    def sincronizar(self):
+        """Fuerza la escritura a disco de los eventos pendientes"""
+        if self._pendientes:
+            self._f.flush()
+            os.fsync(self._f.fileno())
+            self._pendientes = 0
+        self._ultimo_fsync = time.monotonic()
+
+    def cerrar(self):
+        """Sincroniza y cierra el diario"""
+        if not self._f.closed:
+            self.sincronizar()
+            self._f.close()
+
+    @staticmethod
+    def leer(archivo="juego_diario.log"):
+        """
+        Lee los eventos de un diario en orden
+        Una última línea incompleta (corte durante la escritura) se descarta
+
+        Args:
+            archivo (str): Archivo del diario
+
+        Yields:
+            dict: Cada evento con su campo 'evento'
+        """
+        with open(archivo, 'r', encoding='utf-8') as f:
+            for linea in f:
+                if not linea.endswith("\n"):
+                    return
+                yield json.loads(linea)
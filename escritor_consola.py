@@ -0,0 +1,50 @@
+import queue
+import sys
+import threading
+
+
+class EscritorConsola:
+    """
+    Escribe en la consola desde un hilo aparte: quien avisa deja el texto en una cola y
+    sigue sin esperar a la terminal. Lo que se acumula mientras se escribe sale junto en
+    una sola escritura.
+    """
+
+    def __init__(self, salida=None):
+        """
+        Args:
+            salida: Archivo de salida (por defecto sys.stdout en el momento de escribir)
+        """
+        self.salida = salida
+        self._cola = queue.Queue()
+        self._hilo = threading.Thread(target=self._escribir_pendientes, daemon=True)
+        self._hilo.start()
+
+    def escribir(self, texto):
+        """Deja el texto para escribir (incluir el salto de línea final)"""
+        self._cola.put(texto)
+
+    def _escribir_pendientes(self):
+        while True:
+            partes = [self._cola.get()]
+            try:
+                while True:
+                    partes.append(self._cola.get_nowait())
+            except queue.Empty:
+                pass
+            salida = self.salida or sys.stdout
+            salida.write("".join(parte for parte in partes if parte is not None))
+            salida.flush()
+            for _ in partes:
+                self._cola.task_done()
+            if None in partes:
+                return
+
+    def esperar(self):
+        """Espera a que se haya escrito todo lo pendiente (antes de pedir datos al operador)"""
+        self._cola.join()
+
+    def cerrar(self):
+        """Escribe lo pendiente y detiene el hilo"""
+        self._cola.put(None)
+        self._hilo.join()
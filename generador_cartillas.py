@@ -0,0 +1,170 @@
+import random
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se ordena en Python (mismas cartillas)
+    np = None
+
+from almacen_binario import AlmacenBinario
+from cartilla import Cartilla
+from gestor_json import GestorJSON
+from huellas_cartillas import huella_posicional
+from patrones import CENTRO
+
+
+def _generar_lote(semilla, cantidad, maximo):
+    """
+    Genera un lote de cartillas aleatorias (se ejecuta en un proceso trabajador)
+    El azar sale siempre de random.Random(semilla): por cada celda candidata se sortea una
+    clave de 32 bits y cada columna toma las 5 claves menores (orden estable). NumPy solo
+    acelera el ordenamiento, así que la misma semilla da las mismas cartillas con o sin él.
+
+    Returns:
+        bytes: cantidad * 25 números, fila por fila, con 0 en el centro
+    """
+    ancho = maximo // 5
+    datos = random.Random(semilla).randbytes(cantidad * 5 * ancho * 4)
+    if np is not None:
+        claves = np.frombuffer(datos, dtype='<u4').reshape(cantidad, 5, ancho)
+        # Por cada cartilla y columna, 5 números distintos del rango de la columna
+        columnas = claves.argsort(axis=2, kind='stable')[:, :, :5].astype(np.uint8)
+        columnas += (1 + ancho * np.arange(5, dtype=np.uint8))[None, :, None]
+        cartillas = columnas.transpose(0, 2, 1).reshape(cantidad, 25)
+        cartillas[:, 12] = 0
+        return cartillas.tobytes()
+
+    claves = array('I', datos)
+    if sys.byteorder == 'big':
+        claves.byteswap()  # Las claves se leen siempre en little endian, como en NumPy
+    clave = claves.__getitem__
+    salida = bytearray()
+    for inicio in range(0, len(claves), 5 * ancho):
+        numeros = [0] * 25
+        for c in range(5):
+            base = inicio + c * ancho
+            for f, indice in enumerate(sorted(range(base, base + ancho), key=clave)[:5]):
+                numeros[f * 5 + c] = 1 + ancho * c + indice - base
+        numeros[12] = 0
+        salida += bytes(numeros)
+    return bytes(salida)
+
+
+class GeneradorCartillas:
+    """
+    Genera cartillas B-I-N-G-O válidas en cantidad: cada columna toma números distintos
+    de su rango (con 90 bolas: 1-18, 19-36, 37-54, 55-72, 73-90) y el centro es 0.
+    Los lotes se generan en paralelo con semillas derivadas de la semilla general, así que
+    el resultado es el mismo con cualquier cantidad de procesos. Las cartillas repetidas
+    se descartan comparando una huella de 8 bytes de sus números.
+    """
+
+    def __init__(self, semilla=0, maximo=90, unicas=True, prefijo="G", tamaño_lote=10000):
+        """
+        Args:
+            semilla (int): Semilla general (misma semilla → mismas cartillas)
+            maximo (int): Número más alto de las cartillas (90, o 75 para el bingo clásico)
+            unicas (bool): Descartar cartillas repetidas
+            prefijo (str): Prefijo de los códigos generados
+            tamaño_lote (int): Cartillas por tarea enviada a un proceso
+        """
+        if maximo % 5 or not 25 <= maximo <= 255:
+            raise ValueError("El número máximo debe ser múltiplo de 5 entre 25 y 255")
+        self.semilla = semilla
+        self.maximo = maximo
+        self.unicas = unicas
+        self.prefijo = prefijo
+        self.tamaño_lote = tamaño_lote
+
+    def _lotes(self, procesos):
+        """Genera lotes sin fin; en paralelo salvo que se pida un solo proceso"""
+        if procesos == 1:
+            indice = 0
+            while True:
+                yield _generar_lote(self.semilla * 1000003 + indice, self.tamaño_lote, self.maximo)
+                indice += 1
+        with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+            indice = 0
+            while True:
+                # Unos lotes por adelantado para que todos los procesos trabajen
+                tanda = [ejecutor.submit(_generar_lote, self.semilla * 1000003 + i, self.tamaño_lote, self.maximo)
+                         for i in range(indice, indice + 2 * (procesos or 4))]
+                indice += len(tanda)
+                for futuro in tanda:
+                    yield futuro.result()
+
+    def generar(self, cantidad, procesos=1):
+        """
+        Genera cartillas una por una
+
+        Args:
+            cantidad (int): Cantidad de cartillas
+            procesos (int): Procesos a usar (1 = en este mismo proceso; None = todos los núcleos)
+
+        Yields:
+            tuple: (codigo, numeros) con numeros como 25 bytes fila por fila
+        """
+        if cantidad <= 0:
+            return
+        ancho = len(str(cantidad))
+        vistas = set()
+        generadas = 0
+        lotes = self._lotes(procesos)
+        try:
+            for lote in lotes:
+                antes = generadas
+                for inicio in range(0, len(lote), 25):
+                    numeros = lote[inicio:inicio + 25]
+                    if self.unicas:
+                        huella = huella_posicional(numeros)
+                        if huella in vistas:
+                            continue
+                        vistas.add(huella)
+                    generadas += 1
+                    yield f"{self.prefijo}{generadas:0{ancho}d}", numeros
+                    if generadas == cantidad:
+                        return
+                if generadas == antes:
+                    raise ValueError(f"No hay {cantidad} cartillas distintas posibles con números hasta {self.maximo}")
+        finally:
+            lotes.close()
+
+    def guardar_binario(self, cantidad, archivo="cartillas.bin", procesos=1):
+        """
+        Genera cartillas directamente en un almacén binario
+
+        Returns:
+            int: Cantidad de cartillas escritas
+        """
+        registros = ((codigo, numeros, CENTRO) for codigo, numeros in self.generar(cantidad, procesos))
+        return AlmacenBinario(archivo).guardar_registros(registros)
+
+    def guardar_json(self, cantidad, archivo="cartillas.json", procesos=1):
+        """
+        Genera cartillas directamente en el formato de cartillas.json
+
+        Returns:
+            int: Cantidad de cartillas escritas
+        """
+        cartillas = ((codigo, Cartilla.desde_registro(codigo, numeros, CENTRO))
+                     for codigo, numeros in self.generar(cantidad, procesos))
+        return GestorJSON(archivo).escribir_cartillas(cartillas)
+
+
+if __name__ == "__main__":
+    # Uso: python generador_cartillas.py cantidad archivo(.json o .bin) [semilla] [procesos]
+    if len(sys.argv) < 3:
+        print("Uso: python generador_cartillas.py cantidad archivo(.json o .bin) [semilla] [procesos]")
+        sys.exit(1)
+    cantidad = int(sys.argv[1])
+    archivo = sys.argv[2]
+    semilla = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    procesos = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    generador = GeneradorCartillas(semilla)
+    if archivo.endswith(".bin"):
+        total = generador.guardar_binario(cantidad, archivo, procesos)
+    else:
+        total = generador.guardar_json(cantidad, archivo, procesos)
+    print(f"✅ {total} cartillas generadas en '{archivo}'")
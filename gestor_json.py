@@ -2,11 +2,21 @@ import json
 import os
 from datetime import datetime
 
+_decodificador = json.JSONDecoder()
+
+
 class GestorJSON:
     """Clase para gestionar la persistencia de datos en JSON"""
     
-    def __init__(self, archivo="cartillas.json"):
+    def __init__(self, archivo="cartillas.json", avisar=print):
+        """
+        Args:
+            archivo (str): Archivo de cartillas
+            avisar (callable): Recibe los avisos de carga y guardado (None = no avisar nada).
+                JuegoBingo los envía a su observador
+        """
         self.archivo = archivo
+        self.avisar = avisar or (lambda texto: None)
     
     def guardar_cartillas(self, cartillas_dict):
         """Guarda todas las cartillas en JSON"""
@@ -21,31 +31,118 @@ class GestorJSON:
         with open(self.archivo, 'w', encoding='utf-8') as f:
             json.dump(datos, f, indent=2, ensure_ascii=False)
         
-        print(f"✅ Cartillas guardadas en '{self.archivo}'")
+        self.avisar(f"✅ Cartillas guardadas en '{self.archivo}'")
+    
+    def escribir_cartillas(self, cartillas):
+        """
+        Guarda cartillas en el formato de cartillas.json escribiendo una por una,
+        sin armar el diccionario completo en memoria (conversiones y generación masiva)
+        
+        Args:
+            cartillas: Iterable de (codigo, objeto con matriz y marcados)
+            
+        Returns:
+            int: Cantidad de cartillas escritas
+        """
+        total = 0
+        with open(self.archivo, 'w', encoding='utf-8') as f:
+            f.write("{")
+            for codigo, cartilla in cartillas:
+                datos = {"codigo": codigo, "matriz": cartilla.matriz, "marcados": cartilla.marcados}
+                bloque = json.dumps(datos, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+                f.write(("," if total else "") + f"\n  {json.dumps(codigo, ensure_ascii=False)}: {bloque}")
+                total += 1
+            f.write("\n}" if total else "}")
+        return total
     
     def cargar_cartillas(self):
         """Carga cartillas desde JSON"""
         if not os.path.exists(self.archivo):
-            print(f"⚠️  Archivo '{self.archivo}' no encontrado")
+            self.avisar(f"⚠️  Archivo '{self.archivo}' no encontrado")
             return {}
         
         try:
             with open(self.archivo, 'r', encoding='utf-8') as f:
                 datos = json.load(f)
             
-            print(f"✅ Cartillas cargadas desde '{self.archivo}'")
+            self.avisar(f"✅ Cartillas cargadas desde '{self.archivo}'")
             return datos
         except json.JSONDecodeError:
-            print(f"❌ Error al decodificar '{self.archivo}'")
+            self.avisar(f"❌ Error al decodificar '{self.archivo}'")
             return {}
     
+    def iterar_cartillas(self, progreso=None, tamaño_bloque=1 << 16):
+        """
+        Lee cartillas.json cartilla por cartilla sin cargar el archivo completo en memoria
+        
+        Args:
+            progreso (callable): Función opcional progreso(cartillas, bytes_leidos, bytes_totales)
+            tamaño_bloque (int): Bytes leídos del disco en cada paso
+            
+        Yields:
+            tuple: (codigo, datos) de cada cartilla válida, en el orden del archivo
+            
+        Raises:
+            json.JSONDecodeError: Si el archivo está dañado (quien consume decide qué hacer
+                con lo ya leído)
+        """
+        if not os.path.exists(self.archivo):
+            self.avisar(f"⚠️  Archivo '{self.archivo}' no encontrado")
+            return
+        
+        total_bytes = os.path.getsize(self.archivo)
+        cargadas = 0
+        invalidas = 0
+        
+        with open(self.archivo, 'r', encoding='utf-8') as f:
+            lector = _LectorIncremental(f, tamaño_bloque)
+            try:
+                for codigo, datos in lector.pares_objeto():
+                    if not self._cartilla_valida(datos):
+                        invalidas += 1
+                        continue
+                    cargadas += 1
+                    yield codigo, datos
+                    if progreso:
+                        progreso(cargadas, lector.bytes_leidos, total_bytes)
+            except json.JSONDecodeError:
+                self.avisar(f"❌ Error al decodificar '{self.archivo}' (cartillas leídas: {cargadas})")
+                raise
+        
+        if invalidas:
+            self.avisar(f"⚠️  {invalidas} cartillas inválidas omitidas")
+        self.avisar(f"✅ Cartillas cargadas desde '{self.archivo}'")
+    
+    @staticmethod
+    def _cartilla_valida(datos):
+        """Verifica que una entrada tenga una matriz 5x5 de enteros (0-255, como Cartilla) y marcados 5x5 (opcional)"""
+        if not isinstance(datos, dict):
+            return False
+        matriz = datos.get("matriz")
+        if not isinstance(matriz, list) or len(matriz) != 5:
+            return False
+        for fila in matriz:
+            if not isinstance(fila, list) or len(fila) != 5:
+                return False
+            if not all(isinstance(n, int) and 0 <= n <= 255 for n in fila):
+                return False
+        marcados = datos.get("marcados")
+        if marcados is not None:
+            if not isinstance(marcados, list) or len(marcados) != 5:
+                return False
+            if not all(isinstance(fila, list) and len(fila) == 5 for fila in marcados):
+                return False
+        return True
+    
     def guardar_juego(self, juego, nombre_archivo="juego_guardado.json"):
         """Guarda el estado completo del juego"""
         datos_juego = {
             "timestamp": datetime.now().isoformat(),
             "patron_actual": juego.patron_actual,
-            "numeros_sorteados": juego.numeros_sorteados,
-            "cartillas_ganadoras": juego.cartillas_ganadoras,
+            "numeros_sorteados": list(juego.numeros_sorteados),
+            "cartillas_ganadoras": list(juego.cartillas_ganadoras),
+            "ronda_actual": juego.gestor_rondas.ronda_actual,
+            "ganadores_por_ronda": juego.gestor_rondas.ganadores_por_ronda,
             "cartillas": {}
         }
         
@@ -59,7 +156,28 @@ class GestorJSON:
         with open(nombre_archivo, 'w', encoding='utf-8') as f:
             json.dump(datos_juego, f, indent=2, ensure_ascii=False)
         
-        print(f"✅ Juego guardado en '{nombre_archivo}'")
+        self.avisar(f"✅ Juego guardado en '{nombre_archivo}'")
+    
+    def cargar_juego(self, nombre_archivo="juego_guardado.json"):
+        """
+        Carga un juego guardado con guardar_juego
+        
+        Returns:
+            dict: Datos del juego, o {} si no se pudo leer
+        """
+        if not os.path.exists(nombre_archivo):
+            self.avisar(f"⚠️  Archivo '{nombre_archivo}' no encontrado")
+            return {}
+        
+        try:
+            with open(nombre_archivo, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            self.avisar(f"❌ Error al decodificar '{nombre_archivo}'")
+            return {}
+        except OSError as error:
+            self.avisar(f"❌ No se pudo leer '{nombre_archivo}': {error}")
+            return {}
     
     def listar_archivos_json(self):
         """Lista todos los archivos JSON en el directorio"""
@@ -73,3 +191,68 @@ class GestorJSON:
         else:
             print("❌ No hay archivos JSON en el directorio")
             return []
+
+
+class _LectorIncremental:
+    """Recorre un objeto JSON {clave: valor, ...} de primer nivel leyendo el archivo por bloques"""
+    
+    def __init__(self, archivo, tamaño_bloque):
+        self.archivo = archivo
+        self.tamaño_bloque = tamaño_bloque
+        self.buffer = ""
+        self.pos = 0
+        self.fin = False
+        self.bytes_leidos = 0
+    
+    def _leer_bloque(self):
+        """Agrega un bloque al buffer descartando lo ya consumido"""
+        bloque = self.archivo.read(self.tamaño_bloque)
+        if not bloque:
+            self.fin = True
+            return False
+        self.bytes_leidos += len(bloque.encode('utf-8'))
+        self.buffer = self.buffer[self.pos:] + bloque
+        self.pos = 0
+        return True
+    
+    def _siguiente_caracter(self):
+        """Salta espacios y devuelve el siguiente carácter significativo (sin consumirlo)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._leer_bloque():
+                raise json.JSONDecodeError("Fin de archivo inesperado", self.buffer, self.pos)
+    
+    def _esperar(self, caracter):
+        if self._siguiente_caracter() != caracter:
+            raise json.JSONDecodeError(f"Se esperaba '{caracter}'", self.buffer, self.pos)
+        self.pos += 1
+    
+    def _valor(self):
+        """Decodifica el siguiente valor completo, leyendo más bloques si quedó cortado"""
+        self._siguiente_caracter()
+        while True:
+            try:
+                valor, self.pos = _decodificador.raw_decode(self.buffer, self.pos)
+                return valor
+            except json.JSONDecodeError:
+                if not self._leer_bloque():
+                    raise
+    
+    def pares_objeto(self):
+        """Genera los pares (clave, valor) del objeto de primer nivel uno a la vez"""
+        self._esperar('{')
+        if self._siguiente_caracter() == '}':
+            return
+        while True:
+            clave = self._valor()
+            self._esperar(':')
+            yield clave, self._valor()
+            separador = self._siguiente_caracter()
+            self.pos += 1
+            if separador == '}':
+                return
+            if separador != ',':
+                raise json.JSONDecodeError("Se esperaba ',' o '}'", self.buffer, self.pos - 1)
@@ -0,0 +1,169 @@
+import hashlib
+import sys
+from itertools import combinations
+
+from gestor_json import GestorJSON
+from gestor_rondas import GestorRondas
+from patrones import PATRONES
+
+
+def huella_posicional(numeros):
+    """Huella de 8 bytes de los números en su posición: iguales solo si la cartilla es idéntica"""
+    return hashlib.blake2b(bytes(numeros), digest_size=8).digest()
+
+
+def huella_conjunto(numeros):
+    """Huella de 8 bytes del conjunto de números, sin importar en qué celda están"""
+    return hashlib.blake2b(bytes(sorted(numeros)), digest_size=8).digest()
+
+
+class IndiceHuellas:
+    """
+    Índice de huellas de todas las cartillas del juego para detectar repetidas en O(1):
+    la huella posicional detecta cartillas idénticas (jugarían y ganarían igual) y la del
+    conjunto detecta cartillas con los mismos números en otro orden.
+    """
+
+    def __init__(self):
+        # huella -> código, o set de códigos si hay más de uno (casi nunca: guardar un set
+        # por cartilla costaría ~200 bytes cada una)
+        self.posicionales = {}
+        self.conjuntos = {}
+
+    @staticmethod
+    def _agregar_codigo(indice, huella, codigo):
+        """Anota un código bajo una huella sin perder los que ya estaban"""
+        codigos = indice.get(huella)
+        if codigos is None or codigos == codigo:
+            indice[huella] = codigo
+        elif isinstance(codigos, set):
+            codigos.add(codigo)
+        else:
+            indice[huella] = {codigos, codigo}
+
+    @staticmethod
+    def _quitar_codigo(indice, huella, codigo):
+        """Borra un código de una huella (si queda uno solo, vuelve a guardarse sin set)"""
+        codigos = indice.get(huella)
+        if codigos == codigo:
+            del indice[huella]
+        elif isinstance(codigos, set):
+            codigos.discard(codigo)
+            if len(codigos) == 1:
+                indice[huella] = codigos.pop()
+
+    def agregar(self, codigo, numeros):
+        """
+        Indexa una cartilla (numeros: 25 números fila por fila)
+
+        Returns:
+            str: Código de una cartilla idéntica que ya estaba indexada, o None
+        """
+        huella = huella_posicional(numeros)
+        repetida = self.posicionales.get(huella)
+        if isinstance(repetida, set):
+            repetida = min(repetida - {codigo}, default=None)
+        elif repetida == codigo:
+            repetida = None
+        self._agregar_codigo(self.posicionales, huella, codigo)
+        self._agregar_codigo(self.conjuntos, huella_conjunto(numeros), codigo)
+        return repetida
+
+    def quitar(self, codigo, numeros):
+        """Quita una cartilla del índice"""
+        self._quitar_codigo(self.posicionales, huella_posicional(numeros), codigo)
+        self._quitar_codigo(self.conjuntos, huella_conjunto(numeros), codigo)
+
+    def buscar_identica(self, numeros):
+        """
+        Returns:
+            str: Código de una cartilla con los mismos números en las mismas celdas, o None
+        """
+        codigos = self.posicionales.get(huella_posicional(numeros))
+        return min(codigos) if isinstance(codigos, set) else codigos
+
+    def buscar_mismos_numeros(self, numeros):
+        """
+        Returns:
+            set: Códigos de las cartillas con el mismo conjunto de números
+        """
+        codigos = self.conjuntos.get(huella_conjunto(numeros))
+        if codigos is None:
+            return set()
+        return set(codigos) if isinstance(codigos, set) else {codigos}
+
+    def reiniciar(self):
+        """Vacía el índice"""
+        self.posicionales = {}
+        self.conjuntos = {}
+
+
+def auditar_similares(cartillas, minimo=None, patrones=None):
+    """
+    Busca pares de cartillas que comparten al menos `minimo` números en las mismas celdas
+    de un patrón ganador, sin comparar todos los pares. Si una alternativa tiene n celdas,
+    dos cartillas que comparten `minimo` difieren en d = n - minimo celdas como mucho;
+    repartiendo las celdas en d + 1 bandas, coinciden por completo en al menos una banda.
+    Las cartillas se agrupan por los números de cada banda y solo se comparan las que
+    caen en el mismo grupo, así que ningún par se pierde.
+
+    Args:
+        cartillas: Iterable de (codigo, 25 números fila por fila)
+        minimo (int): Números compartidos a partir de los que se informa un par (None = todas
+            las celdas del patrón menos 2). Valores bajos forman grupos grandes y son lentos
+        patrones (list): Patrones a revisar (por defecto los de las 5 rondas)
+
+    Returns:
+        list: Tuplas (codigo1, codigo2, patron, compartidos) de más a menos compartidos
+    """
+    patrones = [p.upper() for p in (patrones or GestorRondas().patrones_orden)]
+    # Alternativas distintas de todos los patrones, como listas de posiciones (sin el centro)
+    alternativas = {}
+    for patron in patrones:
+        for mascara in PATRONES[patron]:
+            alternativas.setdefault(mascara, patron)
+    revisar = []
+    for mascara, patron in alternativas.items():
+        celdas = [p for p in range(25) if mascara >> p & 1 and p != 12]
+        minimo_alternativa = max(1, len(celdas) - 2) if minimo is None else minimo
+        if celdas and minimo_alternativa <= len(celdas):
+            diferencias = len(celdas) - minimo_alternativa
+            bandas = [celdas[b::diferencias + 1] for b in range(diferencias + 1)]
+            revisar.append((patron, celdas, minimo_alternativa, bandas))
+
+    numeros_de = {}
+    grupos = {}
+    for codigo, numeros in cartillas:
+        numeros_de[codigo] = numeros
+        for k, (_, _, _, bandas) in enumerate(revisar):
+            for b, celdas_banda in enumerate(bandas):
+                clave = (k, b, tuple(numeros[p] for p in celdas_banda))
+                grupos.setdefault(clave, []).append(codigo)
+
+    encontrados = {}
+    for (k, _, _), codigos in grupos.items():
+        if len(codigos) < 2:
+            continue
+        celdas = revisar[k][1]
+        for codigo1, codigo2 in combinations(codigos, 2):
+            par = (codigo1, codigo2, k)
+            if par not in encontrados:
+                numeros1, numeros2 = numeros_de[codigo1], numeros_de[codigo2]
+                encontrados[par] = sum(numeros1[p] == numeros2[p] for p in celdas)
+    resultado = [(c1, c2, revisar[k][0], compartidos)
+                 for (c1, c2, k), compartidos in encontrados.items() if compartidos >= revisar[k][2]]
+    resultado.sort(key=lambda par: par[3], reverse=True)
+    return resultado
+
+
+if __name__ == "__main__":
+    # Uso: python huellas_cartillas.py [cartillas.json] [minimo]
+    archivo = sys.argv[1] if len(sys.argv) > 1 else "cartillas.json"
+    minimo = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    cartillas = ((codigo, [n for fila in datos["matriz"] for n in fila])
+                 for codigo, datos in GestorJSON(archivo).iterar_cartillas())
+    similares = auditar_similares(cartillas, minimo)
+    criterio = f"{minimo} o más números" if minimo else "casi todos los números"
+    print(f"\n🔍 {len(similares)} pares de cartillas con {criterio} en las mismas celdas de un patrón")
+    for codigo1, codigo2, patron, compartidos in similares[:50]:
+        print(f"   {codigo1} ↔ {codigo2}: {compartidos} números en el patrón {patron}")
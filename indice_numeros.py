@@ -0,0 +1,130 @@
+class IndiceNumeros:
+    """Índice invertido: número sorteado → cartillas y posiciones que lo contienen"""
+
+    def __init__(self):
+        # numero -> cartillas que lo contienen, y en paralelo un bytearray con la posición
+        # (fila*5 + columna) en cada una: 9 bytes por celda en lugar de una tupla
+        self.cartillas = {}
+        self.posiciones = {}
+
+    def agregar_cartilla(self, cartilla):
+        """
+        Indexa todas las celdas de una cartilla
+
+        Args:
+            cartilla (Cartilla): Cartilla a indexar
+
+        Returns:
+            Cartilla: La misma cartilla (mismo contrato que MotorNumpy.agregar_cartilla)
+        """
+        for posicion, numero in enumerate(cartilla.numeros):
+            cartillas = self.cartillas.get(numero)
+            if cartillas is None:
+                self.cartillas[numero] = [cartilla]
+                self.posiciones[numero] = bytearray((posicion,))
+            else:
+                cartillas.append(cartilla)
+                self.posiciones[numero].append(posicion)
+        return cartilla
+
+    def quitar_cartilla(self, cartilla):
+        """
+        Elimina del índice todas las celdas de una cartilla
+
+        Args:
+            cartilla (Cartilla): Cartilla a quitar
+        """
+        for numero in set(cartilla.numeros):
+            cartillas = self.cartillas.get(numero)
+            if cartillas is None:
+                continue
+            entradas = [(c, p) for c, p in zip(cartillas, self.posiciones[numero]) if c is not cartilla]
+            if entradas:
+                self.cartillas[numero] = [c for c, _ in entradas]
+                self.posiciones[numero] = bytearray(p for _, p in entradas)
+            else:
+                del self.cartillas[numero]
+                del self.posiciones[numero]
+
+    def marcar(self, numero):
+        """
+        Marca un número solo en las cartillas que lo contienen
+
+        Args:
+            numero (int): Número sorteado
+
+        Returns:
+            list: Cartillas en las que aparece el número (sin repetir)
+        """
+        cartillas = self.cartillas.get(numero)
+        if cartillas is None:
+            return []
+        afectadas = []
+        ultima = None
+        for cartilla, posicion in zip(cartillas, self.posiciones[numero]):
+            cartilla.marcar_posicion(posicion)
+            if cartilla is not ultima:
+                afectadas.append(cartilla)
+                ultima = cartilla
+        return afectadas
+
+    def desmarcar(self, numero):
+        """
+        Desmarca un número solo en las cartillas que lo contienen
+
+        Args:
+            numero (int): Número eliminado
+
+        Returns:
+            list: Cartillas en las que aparece el número (sin repetir)
+        """
+        cartillas = self.cartillas.get(numero)
+        if cartillas is None:
+            return []
+        afectadas = []
+        ultima = None
+        for cartilla, posicion in zip(cartillas, self.posiciones[numero]):
+            cartilla.desmarcar_posicion(posicion)
+            if cartilla is not ultima:
+                afectadas.append(cartilla)
+                ultima = cartilla
+        return afectadas
+
+    def reiniciar_marcados(self, cartillas):
+        """
+        Desmarca todas las cartillas (excepto el centro)
+
+        No hay nada que escribir: JuegoBingo cambia antes la época de su ContextoRonda y
+        cada cartilla descarta sus marcas la próxima vez que se toca
+        """
+
+    def faltantes_cartillas(self, cartillas, patron):
+        """
+        Celdas faltantes de varias cartillas (cada cartilla lleva su propia cuenta)
+
+        Args:
+            cartillas (list): Cartillas a consultar
+            patron (str): Patrón actual del juego (las cartillas ya lo siguen)
+
+        Returns:
+            list: Faltantes de cada cartilla, en el mismo orden
+        """
+        return [cartilla.faltantes_patron() for cartilla in cartillas]
+
+    def cumplen_patron(self, patron, cartillas):
+        """
+        Revisa un patrón en todas las cartillas
+
+        Args:
+            patron (str): Patrón de Cartilla.verificar_patron
+            cartillas: Cartillas a revisar
+
+        Returns:
+            list: Cartillas que cumplen el patrón
+        """
+        return [cartilla for cartilla in cartillas if cartilla.verificar_patron(patron)]
+
+    def reiniciar(self):
+        """Vacía el índice"""
+        self.cartillas = {}
+        self.posiciones = {}
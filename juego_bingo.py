@@ -1,49 +1,179 @@
 from cartilla import Cartilla
 from gestor_json import GestorJSON
 from gestor_rondas import GestorRondas
+from indice_numeros import IndiceNumeros
+from ranking_cercania import RankingCercania
+from diario_juego import DiarioJuego
+from observador_juego import ObservadorJuego
+from probabilidades import TOTAL_BOLAS, probabilidad_cartilla
+from patrones import PATRONES, cargar_patrones
+from premios_simultaneos import PremiosSimultaneos
+from huellas_cartillas import IndiceHuellas
+from contexto_ronda import ContextoRonda
+from panel_cartillas import FILTROS, PanelCartillas
+from registro_sorteo import RegistroSorteo
+from conjunto_ordenado import ConjuntoOrdenado
+from itertools import islice
 import os
 
 class JuegoBingo:
     """Clase principal para gestionar el juego de bingo"""
     
-    def __init__(self):
+    def __init__(self, motor="python", observador=None, cargar_cartillas=True):
+        """
+        Args:
+            motor (str): 'python' (índice invertido, por defecto) o 'numpy' (arreglos vectorizados;
+                requiere NumPy)
+            observador (ObservadorJuego): Recibe los avisos y decide el paso de ronda.
+                Sin observador el juego no imprime ni pregunta nada (cargas y guardados
+                incluidos); solo imprimen los métodos mostrar_* cuando se los llama
+            cargar_cartillas (bool): Cargar cartillas.json al iniciar (False para simuladores y servidores)
+        """
+        self.observador = observador or ObservadorJuego()
         self.cartillas = {}
-        self.numeros_sorteados = []
+        # Números sorteados en orden de salida, con consulta y borrado en O(1)
+        self.numeros_sorteados = RegistroSorteo()
         self.patron_actual = None
-        self.cartillas_ganadoras = []
-        self.gestor_json = GestorJSON()
+        # Códigos ganadores en orden, con `in` en O(1)
+        self.cartillas_ganadoras = ConjuntoOrdenado()
+        # Los avisos de carga y guardado van al observador actual (servidor_red lo reemplaza)
+        self.gestor_json = GestorJSON(avisar=lambda texto: self.observador.mensaje(texto))
         self.gestor_rondas = GestorRondas()
+        # Motor de marcado: índice invertido número → (cartilla, posición) o arreglos NumPy
+        if motor == "python":
+            self.motor = IndiceNumeros()
+        elif motor == "numpy":
+            from motor_numpy import MotorNumpy
+            self.motor = MotorNumpy()
+        else:
+            raise ValueError(f"Motor no válido: '{motor}'. Opciones: python, numpy")
+        # Cartillas que ya cumplían el patrón sin que un número las tocara (se revisan con la próxima bola)
+        self._pendientes_verificacion = []
+        # Huellas de los números de cada cartilla para rechazar cartillas repetidas en O(1)
+        self.huellas = IndiceHuellas()
+        # Códigos de las cartillas idénticas a otra que entraron en la carga masiva en curso
+        self._repetidas = []
+        # Época de la ronda: reiniciar marcas entre rondas es O(1), cada cartilla se pone al día al tocarla
+        self.contexto_ronda = ContextoRonda()
+        # Cartillas agrupadas por celdas faltantes para el patrón actual ("¡Casi bingo!")
+        self.ranking = RankingCercania()
+        # Texto de las cartillas ya mostradas en el panel (solo se redibujan las filas que cambian)
+        self.panel = PanelCartillas()
+        # Diario de eventos para recuperar el juego tras una caída (desactivado por defecto)
+        self.diario = None
+        self.archivo_snapshot = "juego_snapshot.json"
+        # Evaluación de todos los patrones de ronda sobre un mismo sorteo (desactivada por defecto)
+        self.premios = None
+        # Patrones propios del operador (patrones.json), si existen
+        self._cargar_patrones_propios()
         # Establecer automáticamente el primer patrón (U)
         self.patron_actual = self.gestor_rondas.obtener_patron_actual()
         
         # Cargar cartillas automáticamente si existen
-        self._cargar_automatico()
+        if cargar_cartillas:
+            self._cargar_automatico()
     
     def _cargar_automatico(self):
         """Carga cartillas automáticamente si existe cartillas.json y comienza en RONDA 5"""
         if os.path.exists("cartillas.json"):
-            try:
-                datos = self.gestor_json.cargar_cartillas()
-                if datos:
-                    for codigo, datos_cartilla in datos.items():
-                        cartilla = Cartilla(codigo, [0]*25)
-                        cartilla.matriz = datos_cartilla["matriz"]
-                        cartilla.marcados = datos_cartilla["marcados"]
-                        self.cartillas[codigo] = cartilla
-                    
-                    # Automáticamente iniciar en RONDA 5 (patrón APAGON - Premio Mayor)
-                    # Hacer skip de las Rondas 1, 2, 3 y 4 directamente
-                    self.gestor_rondas.ronda_actual = 4  # Índice 4 = Ronda 5
-                    self.patron_actual = self.gestor_rondas.obtener_patron_actual()
-                    self.cartillas_ganadoras = []
-                    self.numeros_sorteados = []
-                    
-                    # Reiniciar marcados en todas las cartillas (excepto centro)
-                    for cartilla in self.cartillas.values():
-                        cartilla.marcados = [[False for _ in range(5)] for _ in range(5)]
-                        cartilla.marcados[2][2] = True  # Centro siempre marcado
-            except Exception as e:
-                pass  # Si hay error, continúa sin cargar
+            # Los marcados guardados se descartan: solo el centro queda marcado
+            cartillas = self._leer_cartillas_json(con_marcados=False)
+            if cartillas:
+                # Automáticamente iniciar en RONDA 5 (patrón APAGON - Premio Mayor)
+                # Hacer skip de las Rondas 1, 2, 3 y 4 directamente
+                self.gestor_rondas.ronda_actual = 4  # Índice 4 = Ronda 5
+                self.patron_actual = self.gestor_rondas.obtener_patron_actual()
+                self.cartillas_ganadoras.clear()
+                self.numeros_sorteados.clear()
+                for cartilla in cartillas:
+                    self._registrar_cartilla(cartilla)
+                self._avisar_repetidas()
+    
+    def _leer_cartillas_json(self, con_marcados=True):
+        """
+        Lee todas las cartillas de cartillas.json en streaming, sin registrarlas todavía
+        Si el archivo está dañado no se devuelve ninguna: la carga es todo o nada
+        
+        Returns:
+            list: Cartillas leídas (vacía si hubo un error)
+        """
+        try:
+            return [Cartilla.desde_json(codigo, datos_cartilla, con_marcados)
+                    for codigo, datos_cartilla in self.gestor_json.iterar_cartillas(self._mostrar_progreso_carga)]
+        except (OSError, ValueError) as e:
+            self.observador.mensaje(f"❌ No se cargó ninguna cartilla de '{self.gestor_json.archivo}': {e}")
+            return []
+    
+    def _cargar_patrones_propios(self, archivo="patrones.json"):
+        """Registra los patrones declarados en el archivo (ver patrones.cargar_patrones)"""
+        try:
+            registrados = cargar_patrones(archivo)
+        except (OSError, ValueError, TypeError) as e:
+            self.observador.mensaje(f"⚠️  No se pudieron cargar los patrones de {archivo}: {e}")
+            return
+        if registrados:
+            self.observador.mensaje(f"🎯 Patrones propios cargados: {', '.join(registrados)}")
+    
+    def _mostrar_progreso_carga(self, cartillas, bytes_leidos, bytes_totales):
+        """Informa al observador el avance de la carga cada 10000 cartillas"""
+        if cartillas % 10000 == 0:
+            self.observador.progreso_carga(cartillas, bytes_leidos, bytes_totales)
+    
+    def _registrar_cartilla(self, cartilla):
+        """
+        Guarda la cartilla en el juego y la indexa por número
+        Si ya existía una cartilla con el mismo código, la reemplaza también en el índice
+        
+        Args:
+            cartilla (Cartilla): Cartilla a registrar
+        """
+        anterior = self.cartillas.get(cartilla.codigo)
+        if anterior is not None:
+            self.motor.quitar_cartilla(anterior)
+            self.huellas.quitar(anterior.codigo, anterior.numeros)
+        # Las cargas masivas no pasan por agregar_cartilla: las idénticas se cuentan y se avisan al final
+        if self.huellas.agregar(cartilla.codigo, cartilla.numeros) is not None:
+            self._repetidas.append(cartilla.codigo)
+        # El motor puede devolver otra representación (vista NumPy) que reemplaza a la original
+        cartilla = self.motor.agregar_cartilla(cartilla)
+        cartilla.usar_contexto(self.contexto_ronda)
+        self.cartillas[cartilla.codigo] = cartilla
+        if self.premios is not None:
+            self.premios.agregar_cartilla(cartilla.codigo, cartilla.numeros)
+        cartilla.seguir_patron(self.patron_actual)
+        self.ranking.actualizar(cartilla.codigo, cartilla.faltantes_patron())
+        if cartilla.completo_patron():
+            self._pendientes_verificacion.append(cartilla)
+    
+    def _avisar_repetidas(self):
+        """Avisa cuántas cartillas idénticas a otra entraron en la última carga masiva"""
+        if self._repetidas:
+            self.observador.mensaje(f"⚠️  {len(self._repetidas)} cartillas cargadas son idénticas a otra "
+                                    f"(mismos números en las mismas celdas): se repartirían el premio")
+            self._repetidas = []
+    
+    def _seguir_patron_actual(self):
+        """Activa en todas las cartillas los contadores del patrón actual"""
+        self._pendientes_verificacion = []
+        self.ranking.reiniciar()
+        for cartilla in self.cartillas.values():
+            cartilla.seguir_patron(self.patron_actual)
+            self.ranking.actualizar(cartilla.codigo, cartilla.faltantes_patron())
+            if cartilla.completo_patron():
+                self._pendientes_verificacion.append(cartilla)
+    
+    def _reiniciar_cartillas(self):
+        """
+        Reinicia marcados (excepto centro) y contadores del patrón actual en todas las cartillas
+        No recorre las cartillas: cambia la época de la ronda y cada cartilla descarta sus
+        marcas la próxima vez que se toca; el ranking las cuenta a la distancia inicial
+        """
+        self._pendientes_verificacion = []
+        self.contexto_ronda.nueva_ronda(self.patron_actual)
+        self.motor.reiniciar_marcados(self.cartillas.values())  # Centro siempre marcado
+        self.ranking.reiniciar(self.contexto_ronda.distancia_inicial(), self.cartillas)
+        if self.premios is not None:
+            self.premios.reiniciar()
     
     def agregar_cartilla(self, codigo, numeros):
         """
@@ -58,24 +188,63 @@ class JuegoBingo:
             bool: True si se agregó correctamente
         """
         if codigo in self.cartillas:
-            print(f"❌ La cartilla con código '{codigo}' ya existe")
+            self.observador.cartilla_rechazada(codigo, f"La cartilla con código '{codigo}' ya existe")
             return False
         
+        # Dos códigos con los mismos números en las mismas celdas se repartirían el premio
+        if len(numeros) == 25 and all(isinstance(n, int) and 0 <= n <= 255 for n in numeros):
+            repetida = self.huellas.buscar_identica(numeros)
+            if repetida is not None:
+                self.observador.cartilla_rechazada(codigo, f"La cartilla tiene los mismos números que '{repetida}'")
+                return False
+            mismos_numeros = self.huellas.buscar_mismos_numeros(numeros)
+            if mismos_numeros:
+                self.observador.mensaje(f"⚠️  La cartilla '{codigo}' tiene los mismos números que "
+                                        f"{', '.join(sorted(mismos_numeros))} en otro orden")
+        
         try:
             nueva_cartilla = Cartilla(codigo, numeros)
             
             # Si ya hay números sorteados, marcarlos en la nueva cartilla
             if self.numeros_sorteados:
-                for numero in self.numeros_sorteados:
-                    nueva_cartilla.marcar_numero(numero)
+                for posicion, numero in enumerate(numeros):
+                    if numero in self.numeros_sorteados:
+                        nueva_cartilla.marcar_posicion(posicion)
             
-            self.cartillas[codigo] = nueva_cartilla
-            print(f"✅ Cartilla '{codigo}' agregada correctamente")
+            self._registrar_cartilla(nueva_cartilla)
+            self._evento("cartilla", codigo=codigo, numeros=list(numeros))
+            self.observador.cartilla_agregada(codigo)
             return True
         except ValueError as e:
-            print(f"❌ Error: {e}")
+            self.observador.cartilla_rechazada(codigo, f"Error: {e}")
             return False
     
+    def agregar_cartillas(self, cartillas):
+        """
+        Agrega de una vez las cartillas de un pozo existente (simuladores, salas, pruebas)
+        A diferencia de agregar_cartilla, las idénticas a otra se conservan (en un pozo real
+        se reparten el premio) y se informan al observador
+        
+        Args:
+            cartillas: Iterable de (codigo, numeros) con 25 números cada una
+            
+        Returns:
+            list: Códigos de las cartillas idénticas a otra ya cargada
+            
+        Raises:
+            ValueError: Si una cartilla no tiene 25 números entre 0 y 255
+        """
+        for codigo, numeros in cartillas:
+            cartilla = Cartilla(codigo, numeros)
+            if self.numeros_sorteados:
+                for posicion, numero in enumerate(cartilla.numeros):
+                    if numero in self.numeros_sorteados:
+                        cartilla.marcar_posicion(posicion)
+            self._registrar_cartilla(cartilla)
+        repetidas = self._repetidas
+        self._avisar_repetidas()
+        return repetidas
+    
     def ingresar_numero(self, numero):
         """
         Ingresa un número en el juego y lo marca en todas las cartillas
@@ -87,30 +256,67 @@ class JuegoBingo:
         Returns:
             tuple: (cartillas_afectadas, ganadores_nuevos)
         """
-        if numero in self.numeros_sorteados:
-            print(f"⚠️  El número {numero} ya fue sorteado")
+        resultado, afectadas = self._procesar_numero(numero)
+        if resultado["repetido"]:
             return [], []
+        return [cartilla.codigo for cartilla in afectadas], resultado["ganadores"]
+    
+    def ingresar_numeros(self, numeros, avanzar_rondas=None):
+        """
+        Ingresa varios números de una vez (API para servidores y simuladores)
+        Los avisos van al observador; sin observador no se imprime ni pregunta nada
         
-        self.numeros_sorteados.append(numero)
-        cartillas_afectadas = []
-        
-        for codigo, cartilla in self.cartillas.items():
-            if cartilla.marcar_numero(numero):
-                cartillas_afectadas.append(codigo)
-        
-        print(f"\n📌 Número {numero} ingresado")
-        print(f"   Total números sorteados: {len(self.numeros_sorteados)}")
-        print(f"   Números: {sorted(self.numeros_sorteados)}")
-        
-        if cartillas_afectadas:
-            print(f"   ✅ Marcado en cartillas: {', '.join(cartillas_afectadas)}")
-        else:
-            print(f"   ⊘ No aparece en ninguna cartilla")
+        Args:
+            numeros (iterable): Números sorteados en orden
+            avanzar_rondas (bool): True/False para decidir siempre el paso de ronda tras un
+                BINGO; None lo deja en manos del observador
+            
+        Returns:
+            list: Un diccionario por número con 'numero', 'repetido', 'afectadas' (cantidad),
+                'ganadores' (códigos), 'ronda', 'patron' y 'cambio_ronda'
+        """
+        return [self._procesar_numero(numero, avanzar_rondas)[0] for numero in numeros]
+    
+    def _procesar_numero(self, numero, avanzar_rondas=None):
+        """
+        Sortea un número: marca, verifica ganadores y resuelve el paso de ronda
         
-        # Verificar ganadores automáticamente
-        nuevos_ganadores = self._verificar_ganadores_automatico()
+        Returns:
+            tuple: (resultado, cartillas_afectadas) con el diccionario de ingresar_numeros
+        """
+        ronda_inicial = self.gestor_rondas.ronda_actual
+        resultado = {
+            "numero": numero,
+            "repetido": False,
+            "afectadas": 0,
+            "ganadores": [],
+            "ronda": ronda_inicial + 1,
+            "patron": self.patron_actual,
+            "cambio_ronda": False,
+        }
         
-        return cartillas_afectadas, nuevos_ganadores
+        if numero in self.numeros_sorteados:
+            resultado["repetido"] = True
+            self.observador.numero_repetido(numero)
+            return resultado, []
+        
+        afectadas = self._marcar_sorteado(numero)
+        resultado["afectadas"] = len(afectadas)
+        self._evento("numero", numero=numero)
+        self.observador.numero_ingresado(numero, afectadas, self)
+        
+        # Verificar ganadores automáticamente (solo entre las cartillas tocadas por esta bola)
+        candidatas = afectadas
+        if self._pendientes_verificacion:
+            candidatas = afectadas + self._pendientes_verificacion
+            self._pendientes_verificacion = []
+        resultado["ganadores"] = self._verificar_ganadores_automatico(candidatas, avanzar_rondas)
+        
+        if self.gestor_rondas.ronda_actual != ronda_inicial:
+            resultado["cambio_ronda"] = True
+            resultado["ronda"] = self.gestor_rondas.ronda_actual + 1
+            resultado["patron"] = self.patron_actual
+        return resultado, afectadas
     
     def eliminar_numero(self, numero):
         """
@@ -123,124 +329,230 @@ class JuegoBingo:
             bool: True si se eliminó correctamente, False si no existía
         """
         if numero not in self.numeros_sorteados:
-            print(f"⚠️  El número {numero} no fue sorteado")
+            self.observador.numero_no_sorteado(numero)
             return False
         
+        afectadas = self._desmarcar_sorteado(numero)
+        self._evento("eliminar", numero=numero)
+        self.observador.numero_eliminado(numero, afectadas, self)
+        
+        return True
+
+    def _marcar_sorteado(self, numero):
+        """
+        Registra un número sorteado y lo marca sin mostrar nada
+        
+        Returns:
+            list: Cartillas que contienen el número
+        """
+        self.numeros_sorteados.append(numero)
+        # Solo se tocan las cartillas que contienen el número
+        afectadas = self.motor.marcar(numero)
+        self._actualizar_ranking(afectadas)
+        if self.premios is not None:
+            completados = self.premios.marcar(numero)
+            if completados:
+                self.observador.premios_completados(completados, self)
+        return afectadas
+    
+    def _desmarcar_sorteado(self, numero):
+        """
+        Quita un número sorteado y lo desmarca sin mostrar nada
+        
+        Returns:
+            list: Cartillas que contienen el número
+        """
         self.numeros_sorteados.remove(numero)
-        cartillas_afectadas = []
+        # Desmarcar usando el mismo índice (el centro nunca se desmarca)
+        afectadas = self.motor.desmarcar(numero)
+        self._actualizar_ranking(afectadas)
+        if self.premios is not None:
+            self.premios.eliminar_numero(numero)
+        return afectadas
+    
+    def _registrar_ganador(self, codigo):
+        """Anota una cartilla ganadora en el juego y en la ronda actual"""
+        self.cartillas_ganadoras.append(codigo)
+        self.gestor_rondas.agregar_ganador_ronda(codigo)
+        self._evento("ganador", codigo=codigo)
+    
+    def _ir_a_ronda(self, indice_ronda):
+        """Cambia de ronda reiniciando números, ganadores y marcados (sin mostrar nada)"""
+        self.gestor_rondas.ronda_actual = indice_ronda
+        self.patron_actual = self.gestor_rondas.obtener_patron_actual()
+        self.cartillas_ganadoras.clear()
+        self.numeros_sorteados.clear()
+        # Reiniciar marcados en todas las cartillas (excepto centro)
+        self._reiniciar_cartillas()
+        self._evento("ronda", ronda=indice_ronda)
+    
+    def _actualizar_ranking(self, cartillas):
+        """Mueve las cartillas tocadas a la cubeta de sus celdas faltantes (calculadas en bloque por el motor)"""
+        faltantes = self.motor.faltantes_cartillas(cartillas, self.patron_actual)
+        for cartilla, distancia in zip(cartillas, faltantes):
+            self.ranking.actualizar(cartilla.codigo, distancia)
+    
+    def activar_premios_simultaneos(self, patrones=None):
+        """
+        Evalúa varios patrones a la vez sobre el sorteo actual (formato de premios simultáneos)
+        Cada bola anota la primera bola con la que cada cartilla completa cada patrón
         
+        Args:
+            patrones (list): Patrones a evaluar (por defecto los de las 5 rondas)
+        """
+        self.premios = PremiosSimultaneos(patrones)
+        for numero in self.numeros_sorteados:
+            self.premios.marcar(numero)
         for codigo, cartilla in self.cartillas.items():
-            # Buscar el número en la cartilla y desmarcarlo
-            for i in range(5):
-                for j in range(5):
-                    if cartilla.matriz[i][j] == numero:
-                        # Solo desmarcar si no es el centro (comodín)
-                        if not (i == 2 and j == 2):
-                            cartilla.marcados[i][j] = False
-                        cartillas_afectadas.append(codigo)
-        
-        print(f"\n❌ Número {numero} eliminado")
-        print(f"   Total números sorteados: {len(self.numeros_sorteados)}")
-        print(f"   Números: {sorted(self.numeros_sorteados)}")
-        
-        if cartillas_afectadas:
-            print(f"   ✅ Desmarcado en cartillas: {', '.join(set(cartillas_afectadas))}")
+            self.premios.agregar_cartilla(codigo, cartilla.numeros)
+        self.observador.mensaje(f"🏅 Premios simultáneos: {', '.join(self.premios.patrones)}")
+    
+    def desactivar_premios_simultaneos(self):
+        """Vuelve a evaluar solo el patrón de la ronda actual"""
+        self.premios = None
+    
+    def obtener_premios(self):
+        """
+        Ganadores de cada patrón en modo de premios simultáneos
         
-        return True
-
-    def _verificar_ganadores_automatico(self):
+        Returns:
+            dict: patron -> (bola, [codigos]) o None; vacío si el modo no está activo
+        """
+        return self.premios.ganadores() if self.premios is not None else {}
+    
+    def obtener_casi_ganadores(self, cantidad=10, max_faltantes=2):
+        """
+        Obtiene las cartillas más cercanas a completar el patrón actual
+        
+        Args:
+            cantidad (int): Máximo de cartillas a devolver
+            max_faltantes (int): Máximo de celdas faltantes
+            
+        Returns:
+            list: Tuplas (codigo, faltantes) ordenadas de menor a mayor distancia
+        """
+        return self.ranking.mejores(cantidad, max_faltantes)
+    
+    def obtener_probabilidades(self, bolas=5, cantidad=None):
+        """
+        Probabilidad de cada cartilla de completar el patrón actual en las próximas bolas
+        Las cartillas a las que les faltan más números que bolas se omiten (probabilidad 0)
+        
+        Args:
+            bolas (int): Bolas que se van a sortear
+            cantidad (int): Máximo de cartillas a devolver (None = todas)
+            
+        Returns:
+            list: Tuplas (codigo, probabilidad) de mayor a menor probabilidad
+        """
+        if not self.patron_actual:
+            return []
+        restantes = TOTAL_BOLAS - len(self.numeros_sorteados)
+        probabilidades = []
+        for codigo, cartilla in self.cartillas.items():
+            faltantes = cartilla.faltantes_patron()
+            if faltantes is None or faltantes > bolas or codigo in self.cartillas_ganadoras:
+                continue
+            probabilidad = probabilidad_cartilla(cartilla, self.patron_actual, restantes, bolas)
+            if probabilidad > 0:
+                probabilidades.append((codigo, probabilidad))
+        probabilidades.sort(key=lambda par: par[1], reverse=True)
+        return probabilidades[:cantidad] if cantidad is not None else probabilidades
+    
+    def mostrar_casi_ganadores(self, cantidad=10, max_faltantes=2):
+        """Muestra las cartillas a las que les faltan pocos números ("¡Casi bingo!")"""
+        casi_ganadores = self.obtener_casi_ganadores(cantidad, max_faltantes)
+        
+        print("\n" + "="*80)
+        print(f"🔥 ¡CASI BINGO! - Patrón: {self.patron_actual or 'No establecido'}")
+        print("="*80)
+        
+        if not casi_ganadores:
+            print(f"   Ninguna cartilla a {max_faltantes} números o menos")
+            return
+        
+        restantes = TOTAL_BOLAS - len(self.numeros_sorteados)
+        for codigo, faltantes in casi_ganadores:
+            texto = "número" if faltantes == 1 else "números"
+            probabilidad = probabilidad_cartilla(self.cartillas[codigo], self.patron_actual, restantes, 5)
+            print(f"   {codigo}: falta{'' if faltantes == 1 else 'n'} {faltantes} {texto}"
+                  f" ({probabilidad:.1%} en las próximas 5 bolas)")
+    
+    def _preguntar_siguiente_ronda(self):
+        """Pregunta al observador si se pasa de ronda (puede esperar al operador)"""
+        return self.observador.continuar_siguiente_ronda(self)
+    
+    def _verificar_ganadores_automatico(self, cartillas_tocadas=None, avanzar_rondas=None):
         """
         Verifica automáticamente si hay nuevos ganadores
         Se llama cada vez que se ingresa un número
         Maneja el sistema de rondas progresivas
+        
+        Args:
+            cartillas_tocadas (list): Cartillas a revisar (por defecto todas). El ranking ya
+                tiene sus celdas faltantes, así que revisarla es O(1)
+            avanzar_rondas (bool): Decisión fija de pasar de ronda tras un BINGO
+                (None pregunta al observador)
         """
         if not self.patron_actual:
             return []
         
+        if cartillas_tocadas is None:
+            cartillas_tocadas = self.cartillas.values()
+        
         nuevos_ganadores = []
+        cartillas_ganadoras = []
         
-        for codigo, cartilla in self.cartillas.items():
-            if codigo not in self.cartillas_ganadoras:
-                if cartilla.verificar_patron(self.patron_actual):
-                    nuevos_ganadores.append(codigo)
-                    self.cartillas_ganadoras.append(codigo)
-                    self.gestor_rondas.agregar_ganador_ronda(codigo)
+        distancia = self.ranking.distancia
+        for cartilla in cartillas_tocadas:
+            codigo = cartilla.codigo
+            if distancia(codigo) == 0 and codigo not in self.cartillas_ganadoras:
+                nuevos_ganadores.append(codigo)
+                cartillas_ganadoras.append(cartilla)
+                self._registrar_ganador(codigo)
         
         if nuevos_ganadores:
-            self._mostrar_bingo_ganador(nuevos_ganadores)
+            self.observador.bingo(cartillas_ganadoras, self)
             
-            # Preguntar si continuar a siguiente ronda
-            if self.gestor_rondas.hay_siguiente_ronda():
-                print("\n" + "="*80)
-                respuesta_valida = False
-                while not respuesta_valida:
-                    respuesta = input("¿Continuar a la siguiente ronda? (s/n): ").strip().lower()
-                    if respuesta == 's':
-                        self._avanzar_a_siguiente_ronda()
-                        respuesta_valida = True
-                    elif respuesta == 'n':
-                        print("\n⏹️  Juego finalizado. Gracias por jugar.")
-                        respuesta_valida = True
-                    else:
-                        print("❌ Respuesta inválida. Por favor ingresa 's' (sí) o 'n' (no)")
+            # Decidir si continuar a siguiente ronda. Con premios simultáneos todos los
+            # patrones se juegan en el mismo sorteo, así que no se cambia de ronda
+            if self.premios is None and self.gestor_rondas.hay_siguiente_ronda():
+                if avanzar_rondas is None:
+                    avanzar_rondas = self._preguntar_siguiente_ronda()
+                if avanzar_rondas:
+                    self._avanzar_a_siguiente_ronda()
+                else:
+                    self.observador.juego_detenido()
         
         return nuevos_ganadores
     
     def _avanzar_a_siguiente_ronda(self):
         """Avanza a la siguiente ronda del juego"""
-        if self.gestor_rondas.avanzar_ronda():
-            self.patron_actual = self.gestor_rondas.obtener_patron_actual()
-            self.cartillas_ganadoras = []  # Reiniciar ganadores para nueva ronda
-            self.numeros_sorteados = []     # Reiniciar números sorteados
-            
-            # Reiniciar marcados en todas las cartillas (excepto centro)
-            for cartilla in self.cartillas.values():
-                cartilla.marcados = [[False for _ in range(5)] for _ in range(5)]
-                cartilla.marcados[2][2] = True  # Centro siempre marcado
-            
-            print(f"\n🎯 NUEVA RONDA - Ronda {self.gestor_rondas.obtener_numero_ronda()}")
-            print(f"   Nuevo patrón: {self.patron_actual}")
-            print(f"   Números reiniciados para nueva ronda")
+        if self.gestor_rondas.hay_siguiente_ronda():
+            # Reiniciar ganadores, números sorteados y marcados para la nueva ronda
+            self._ir_a_ronda(self.gestor_rondas.ronda_actual + 1)
+            self.observador.nueva_ronda(self.gestor_rondas.obtener_numero_ronda(), self.patron_actual)
         else:
-            print("\n✅ ¡JUEGO FINALIZADO! No hay más rondas disponibles")
-    
-    def _mostrar_bingo_ganador(self, ganadores):
-        """Muestra mensaje de BINGO formateado"""
-        print("\n" + "🎉" * 35)
-        print("🎉" + " " * 66 + "🎉")
-        print("🎉" + "  ¡¡¡BINGO!!!".center(66) + "🎉")
-        print("🎉" + " " * 66 + "🎉")
-        print("🎉" * 35)
-        
-        for codigo in ganadores:
-            cartilla = self.cartillas[codigo]
-            print(f"\n✅ CARTILLA GANADORA: {codigo}")
-            print(f"   Patrón: {self.patron_actual}")
-            print(f"   Números ingresados para ganar: {sorted(self.numeros_sorteados)}")
-            print(f"   Total de números: {len(self.numeros_sorteados)}")
-            
-            # Mostrar la cartilla ganadora
-            print(f"\n   Cartilla ganadora:")
-            self._mostrar_cartilla_detalle(cartilla)
-        
-        print("\n" + "🎉" * 35)
+            self.observador.sin_mas_rondas()
     
     def establecer_patron(self, patron):
         """
         Establece el patrón ganador para esta ronda
         
         Args:
-            patron (str): Patrón a buscar ('LINEA', 'COLUMNA', 'X', 'L', 'Z', 'B', 'U', 'T', 'E', 'C', 'APAGON')
+            patron (str): Patrón registrado en patrones.PATRONES ('LINEA', 'COLUMNA', 'X', 'L',
+                'Z', 'B', 'U', 'T', 'E', 'C', 'APAGON' o uno propio de patrones.json)
         """
-        patrones_validos = ['LINEA', 'COLUMNA', 'DIAGONAL', 'X', 'L', 'Z', 'B', 'U', 'T', 'E', 'C', 'APAGON']
         patron = patron.upper()
         
-        if patron not in patrones_validos:
-            print(f"❌ Patrón no válido. Opciones: {', '.join(patrones_validos)}")
+        if patron not in PATRONES:
+            self.observador.mensaje(f"❌ Patrón no válido. Opciones: {', '.join(PATRONES)}")
             return False
         
         self.patron_actual = patron
-        print(f"🎯 Patrón establecido: {patron}")
+        self._seguir_patron_actual()
+        self._evento("patron", patron=patron)
+        self.observador.mensaje(f"🎯 Patrón establecido: {patron}")
         return True
     
     def verificar_ganadores(self):
@@ -251,34 +563,111 @@ class JuegoBingo:
             list: Lista de códigos de cartillas ganadoras
         """
         if not self.patron_actual:
-            print("⚠️  No hay patrón establecido")
+            self.observador.mensaje("⚠️  No hay patrón establecido")
             return []
         
         nuevos_ganadores = []
         
-        for codigo, cartilla in self.cartillas.items():
+        # El motor evalúa el patrón sobre todas las cartillas (vectorizado con NumPy)
+        for cartilla in self.motor.cumplen_patron(self.patron_actual, self.cartillas.values()):
+            codigo = cartilla.codigo
             if codigo not in self.cartillas_ganadoras:
-                if cartilla.verificar_patron(self.patron_actual):
-                    nuevos_ganadores.append(codigo)
-                    self.cartillas_ganadoras.append(codigo)
+                nuevos_ganadores.append(codigo)
+                # Igual que en la verificación automática: queda en la ronda y en el diario
+                self._registrar_ganador(codigo)
         
         if nuevos_ganadores:
-            print(f"\n🎉 ¡BINGO! Cartillas ganadoras: {', '.join(nuevos_ganadores)}")
+            lineas = [f"\n🎉 ¡BINGO! Cartillas ganadoras: {', '.join(nuevos_ganadores)}"]
             for codigo in nuevos_ganadores:
-                print(f"   ✅ Cartilla {codigo} completó patrón {self.patron_actual}")
+                lineas.append(f"   ✅ Cartilla {codigo} completó patrón {self.patron_actual}")
+            self.observador.mensaje("\n".join(lineas))
         
         return nuevos_ganadores
     
-    def mostrar_panel(self):
-        """Muestra el panel con todas las cartillas"""
-        print("\n" + "="*80)
-        print(f"PANEL DE BINGO - Patrón: {self.patron_actual or 'No establecido'}")
-        print(f"Números sorteados: {len(self.numeros_sorteados)} - {sorted(self.numeros_sorteados)}")
-        print("="*80)
+    def _codigos_panel(self, filtro="todas", desde=None, hasta=None, max_faltantes=2, limite=None):
+        """Códigos que pasan el filtro del panel, en el orden en que se muestran (hasta `limite`)"""
+        if filtro == "ganadoras":
+            codigos = (codigo for codigo in self.cartillas_ganadoras if codigo in self.cartillas)
+        elif filtro == "casi":
+            cantidad = len(self.cartillas) if limite is None else limite
+            codigos = (codigo for codigo, _ in self.ranking.mejores(cantidad, max_faltantes))
+        else:
+            codigos = iter(self.cartillas)
+        if desde is not None:
+            codigos = (codigo for codigo in codigos if codigo >= desde)
+        if hasta is not None:
+            codigos = (codigo for codigo in codigos if codigo <= hasta)
+        return codigos
+    
+    def _total_panel(self, filtro="todas", max_faltantes=2):
+        """Cantidad de cartillas de un filtro sin rango, sin recorrer las cartillas"""
+        if filtro == "ganadoras":
+            return sum(1 for codigo in self.cartillas_ganadoras if codigo in self.cartillas)
+        if filtro == "casi":
+            # Las cubetas del ranking ya saben cuántas cartillas tienen (ver RankingCercania.mejores)
+            maximo = min(max_faltantes, len(self.ranking.cubetas) - 1)
+            return sum(self.ranking.contar(distancia) for distancia in range(1, maximo + 1))
+        return len(self.cartillas)
+    
+    def pagina_panel(self, pagina=1, tamaño=50, filtro="todas", desde=None, hasta=None, max_faltantes=2):
+        """
+        Una página de cartillas del panel, sin dibujar las demás
         
-        for codigo, cartilla in self.cartillas.items():
+        Args:
+            pagina (int): Página a mostrar (desde 1)
+            tamaño (int): Cartillas por página
+            filtro (str): 'todas', 'ganadoras' o 'casi' (a max_faltantes celdas o menos)
+            desde (str): Primer código a incluir (orden alfabético; None = sin límite)
+            hasta (str): Último código a incluir (None = sin límite)
+            max_faltantes (int): Distancia máxima del filtro 'casi'
+            
+        Returns:
+            tuple: (códigos de la página, total de cartillas que pasan el filtro)
+        """
+        if filtro not in FILTROS:
+            raise ValueError(f"Filtro no válido: '{filtro}'. Opciones: {', '.join(FILTROS)}")
+        if pagina < 1 or tamaño < 1:
+            raise ValueError("La página y el tamaño deben ser mayores que 0")
+        omitidas = (pagina - 1) * tamaño
+        if desde is None and hasta is None:
+            # Sin rango el total sale de contadores: la página cuesta lo que mide, no O(N)
+            codigos = self._codigos_panel(filtro, max_faltantes=max_faltantes, limite=omitidas + tamaño)
+            return list(islice(codigos, omitidas, omitidas + tamaño)), self._total_panel(filtro, max_faltantes)
+        # Con rango hay que filtrar: una sola pasada arma la página y cuenta el resto
+        pagina_codigos = []
+        total = 0
+        for codigo in self._codigos_panel(filtro, desde, hasta, max_faltantes):
+            if omitidas <= total < omitidas + tamaño:
+                pagina_codigos.append(codigo)
+            total += 1
+        return pagina_codigos, total
+    
+    def mostrar_panel(self, pagina=1, tamaño=50, filtro="todas", desde=None, hasta=None, max_faltantes=2):
+        """
+        Muestra una página del panel de cartillas (ver pagina_panel para los filtros)
+        Todo el texto se arma con join y se imprime de una vez
+        """
+        try:
+            codigos, total = self.pagina_panel(pagina, tamaño, filtro, desde, hasta, max_faltantes)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+        paginas = max(1, -(-total // tamaño))
+        lineas = [
+            "\n" + "="*80,
+            f"PANEL DE BINGO - Patrón: {self.patron_actual or 'No establecido'}",
+            f"Números sorteados: {len(self.numeros_sorteados)} - {self.numeros_sorteados.ordenados()}",
+            f"Filtro: {filtro} - Página {pagina}/{paginas} - {total} cartillas",
+            "="*80,
+        ]
+        for codigo in codigos:
             estado = "🏆 GANADOR" if codigo in self.cartillas_ganadoras else "En juego"
-            print(f"\n{cartilla} [{estado}]")
+            lineas.append(f"\n{self.panel.texto_cartilla(self.cartillas[codigo])} [{estado}]")
+        if not codigos:
+            lineas.append("   (sin cartillas en esta página)")
+        elif pagina < paginas:
+            lineas.append(f"\n   ... página {pagina + 1} de {paginas} para ver más")
+        print("\n".join(lineas))
     
     def mostrar_resumen(self):
         """Muestra un resumen del juego"""
@@ -293,20 +682,6 @@ class JuegoBingo:
         if self.cartillas_ganadoras:
             print(f"   Ganadores: {', '.join(self.cartillas_ganadoras)}")
     
-    def _mostrar_cartilla_detalle(self, cartilla):
-        """Muestra una cartilla con detalle de marcados"""
-        print("   ┌───────────────────────────────┐")
-        for i in range(5):
-            print("   │ ", end="")
-            for j in range(5):
-                num = cartilla.matriz[i][j]
-                if cartilla.marcados[i][j]:
-                    print(f"✓{num:2d} ", end="")
-                else:
-                    print(f" {num:2d} ", end="")
-            print("│")
-        print("   └───────────────────────────────┘")
-    
     def cambiar_ronda(self, numero_ronda):
         """
         Cambia a una ronda específica
@@ -318,35 +693,37 @@ class JuegoBingo:
             bool: True si el cambio fue exitoso
         """
         if numero_ronda < 1 or numero_ronda > 5:
-            print("❌ El número de ronda debe estar entre 1 y 5")
+            self.observador.mensaje("❌ El número de ronda debe estar entre 1 y 5")
             return False
         
-        ronda_index = numero_ronda - 1
-        self.gestor_rondas.ronda_actual = ronda_index
-        self.patron_actual = self.gestor_rondas.obtener_patron_actual()
-        self.numeros_sorteados = []
-        self.cartillas_ganadoras = []
-        
-        # Reiniciar marcados en todas las cartillas
-        for cartilla in self.cartillas.values():
-            cartilla.marcados = [[False for _ in range(5)] for _ in range(5)]
-            cartilla.marcados[2][2] = True  # Centro siempre marcado
+        # Reiniciar números, ganadores y marcados en todas las cartillas
+        self._ir_a_ronda(numero_ronda - 1)
         
-        print(f"\n✅ Cambiado a Ronda {numero_ronda} - Patrón: {self.patron_actual}")
+        self.observador.mensaje(f"\n✅ Cambiado a Ronda {numero_ronda} - Patrón: {self.patron_actual}")
         return True
     
     def reset_juego(self):
         """Reinicia el juego completamente"""
-        self.numeros_sorteados = []
-        self.cartillas_ganadoras = []
+        self._reiniciar_juego()
+        
+        self.observador.mensaje("\n🔄 Juego reiniciado - Volviendo a Ronda 1 (Patrón U)")
+    
+    def reiniciar_sorteo(self):
+        """Borra números sorteados, ganadores y marcados sin cambiar la ronda ni el patrón"""
+        self.numeros_sorteados.clear()
+        self.cartillas_ganadoras.clear()
+        self._reiniciar_cartillas()
+        self._evento("reinicio_sorteo")
+    
+    def _reiniciar_juego(self):
+        """Vuelve a la Ronda 1 sin números, ganadores ni marcados (sin mostrar nada)"""
+        self.numeros_sorteados.clear()
+        self.cartillas_ganadoras.clear()
         self.gestor_rondas.reiniciar()
         self.patron_actual = self.gestor_rondas.obtener_patron_actual()
         
-        for cartilla in self.cartillas.values():
-            cartilla.marcados = [[False for _ in range(5)] for _ in range(5)]
-            cartilla.marcados[2][2] = True  # Centro marcado
-        
-        print("\n🔄 Juego reiniciado - Volviendo a Ronda 1 (Patrón U)")
+        self._reiniciar_cartillas()
+        self._evento("reinicio")
     
     def mostrar_estado_rondas(self):
         """Muestra el estado de todas las rondas progresivas"""
@@ -361,19 +738,282 @@ class JuegoBingo:
         self.gestor_json.guardar_cartillas(self.cartillas)
     
     def cargar_cartillas_desde_json(self, nombre_archivo="cartillas.json"):
-        """Carga cartillas desde JSON"""
-        from cartilla import Cartilla
-        datos = self.gestor_json.cargar_cartillas()
-        
-        for codigo, datos_cartilla in datos.items():
-            cartilla = Cartilla(codigo, [0]*25)
-            cartilla.matriz = datos_cartilla["matriz"]
-            cartilla.marcados = datos_cartilla["marcados"]
-            self.cartillas[codigo] = cartilla
-        
-        print(f"✅ {len(self.cartillas)} cartillas cargadas")
+        """Carga cartillas desde JSON (en streaming, conservando sus marcados; todo o nada)"""
+        cartillas = self._leer_cartillas_json()
+        if not cartillas:
+            return
+        for cartilla in cartillas:
+            self._registrar_cartilla(cartilla)
+        
+        self.observador.mensaje(f"✅ {len(self.cartillas)} cartillas cargadas")
+        self._avisar_repetidas()
+        # Una carga masiva no se anota cartilla por cartilla: se toma un snapshot nuevo
+        self._tomar_snapshot()
 
     
+    def guardar_cartillas_binario(self, nombre_archivo="cartillas.bin"):
+        """Guarda las cartillas en el almacén binario compacto"""
+        from almacen_binario import AlmacenBinario
+        total = AlmacenBinario(nombre_archivo).guardar(self.cartillas.values())
+        self.observador.mensaje(f"✅ {total} cartillas guardadas en '{nombre_archivo}'")
+    
+    def cargar_cartillas_desde_binario(self, nombre_archivo="cartillas.bin"):
+        """Carga cartillas desde el almacén binario (mmap, conservando sus marcados)"""
+        from almacen_binario import AlmacenBinario
+        if not os.path.exists(nombre_archivo):
+            self.observador.mensaje(f"⚠️  Archivo '{nombre_archivo}' no encontrado")
+            return
+        
+        # Se lee todo antes de registrar: un archivo dañado no deja el juego a medias
+        try:
+            with AlmacenBinario(nombre_archivo) as almacen:
+                cartillas = [Cartilla.desde_registro(codigo, numeros, marcas)
+                             for codigo, numeros, marcas in almacen]
+        except (OSError, ValueError) as e:
+            self.observador.mensaje(f"❌ No se cargó ninguna cartilla de '{nombre_archivo}': {e}")
+            return
+        for cartilla in cartillas:
+            self._registrar_cartilla(cartilla)
+        
+        self.observador.mensaje(f"✅ {len(self.cartillas)} cartillas cargadas desde '{nombre_archivo}'")
+        self._avisar_repetidas()
+        self._tomar_snapshot()
+    
     def guardar_juego(self, nombre_archivo="juego_guardado.json"):
         """Guarda el estado completo del juego"""
         self.gestor_json.guardar_juego(self, nombre_archivo)
+    
+    def cargar_juego(self, nombre_archivo="juego_guardado.json"):
+        """
+        Retoma un juego guardado con guardar_juego (o un archivo como demo_juego.json)
+        Restaura patrón, números sorteados, ganadores y el estado de las rondas
+        
+        Args:
+            nombre_archivo (str): Archivo del juego guardado
+            
+        Returns:
+            bool: True si se cargó el juego
+        """
+        datos = self.gestor_json.cargar_juego(nombre_archivo)
+        if not datos:
+            return False
+        
+        # Se valida todo antes de tocar el juego actual: si el archivo no sirve, nada cambia
+        error = self._validar_juego(datos)
+        if error:
+            self.observador.mensaje(f"❌ No se pudo cargar '{nombre_archivo}': {error}")
+            return False
+        
+        self._restaurar_snapshot(datos)
+        # El diario (si está activo) sigue a partir del juego recién cargado
+        self._tomar_snapshot()
+        
+        lineas = [
+            f"✅ Juego cargado desde '{nombre_archivo}'",
+            f"   Ronda {self.obtener_numero_ronda()} - Patrón: {self.patron_actual}",
+            f"   Cartillas: {len(self.cartillas)} - Números sorteados: {len(self.numeros_sorteados)}",
+        ]
+        if self.cartillas_ganadoras:
+            lineas.append(f"   Ganadores: {', '.join(self.cartillas_ganadoras)}")
+        self.observador.mensaje("\n".join(lineas))
+        self._avisar_repetidas()
+        return True
+    
+    # ---------- Diario de eventos y recuperación ----------
+    
+    def activar_diario(self, archivo="juego_diario.log", archivo_snapshot="juego_snapshot.json"):
+        """
+        Empieza a anotar cada cambio de estado en un diario de solo escritura al final
+        Se toma primero un snapshot completo; el diario guarda solo lo ocurrido después
+        
+        Args:
+            archivo (str): Archivo del diario
+            archivo_snapshot (str): Archivo donde se guarda el snapshot (formato de guardar_juego)
+        """
+        self.archivo_snapshot = archivo_snapshot
+        if self.diario is not None:
+            self.diario.cerrar()
+        self.diario = DiarioJuego(archivo)
+        self._tomar_snapshot()
+    
+    def desactivar_diario(self):
+        """Deja de anotar eventos (sincronizando los pendientes)"""
+        if self.diario is not None:
+            self.diario.cerrar()
+            self.diario = None
+    
+    def _evento(self, evento, **datos):
+        """Anota un evento en el diario si está activo"""
+        if self.diario is not None:
+            self.diario.registrar(evento, **datos)
+    
+    def _tomar_snapshot(self):
+        """Guarda el estado completo y reinicia el diario apuntando a ese snapshot"""
+        if self.diario is None:
+            return
+        self.gestor_json.guardar_juego(self, self.archivo_snapshot)
+        archivo = self.diario.archivo
+        self.diario.cerrar()
+        self.diario = DiarioJuego(archivo)
+        self.diario.registrar("snapshot", archivo=self.archivo_snapshot)
+        self.diario.sincronizar()
+    
+    def _validar_juego(self, datos):
+        """
+        Revisa que un juego guardado se pueda restaurar sin dejar el juego a medias
+        
+        Args:
+            datos: Contenido leído del archivo
+            
+        Returns:
+            str: Descripción del problema, o None si el juego es válido
+        """
+        if not isinstance(datos, dict):
+            return "el archivo no contiene un juego guardado"
+        cartillas = datos.get("cartillas")
+        if not isinstance(cartillas, dict):
+            return "faltan las cartillas"
+        invalidas = [codigo for codigo, datos_cartilla in cartillas.items()
+                     if not GestorJSON._cartilla_valida(datos_cartilla)]
+        if invalidas:
+            return f"{len(invalidas)} cartillas inválidas (por ejemplo {invalidas[0]})"
+        if not isinstance(datos.get("numeros_sorteados", []), list):
+            return "'numeros_sorteados' debe ser una lista"
+        ganadoras = datos.get("cartillas_ganadoras", [])
+        if not isinstance(ganadoras, list) or not all(isinstance(codigo, str) for codigo in ganadoras):
+            return "'cartillas_ganadoras' debe ser una lista de códigos"
+        patron = datos.get("patron_actual")
+        if patron is not None and not isinstance(patron, str):
+            return "'patron_actual' debe ser un texto"
+        ronda = datos.get("ronda_actual")
+        if ronda is not None and (not isinstance(ronda, int)
+                                  or not 0 <= ronda < len(self.gestor_rondas.patrones_orden)):
+            return f"ronda no válida: {ronda!r}"
+        ganadores = datos.get("ganadores_por_ronda", {})
+        if not isinstance(ganadores, dict) or not all(isinstance(v, list) for v in ganadores.values()):
+            return "'ganadores_por_ronda' debe asociar cada patrón a una lista"
+        return None
+    
+    def _restaurar_snapshot(self, datos):
+        """
+        Reconstruye el juego desde un diccionario en formato de guardar_juego
+        Los marcados no se leen celda por celda: se rehacen pasando los números sorteados
+        por el motor, así que solo se tocan las cartillas que contienen cada número
+        
+        Args:
+            datos (dict): Contenido del juego guardado (ya revisado con _validar_juego)
+        """
+        # Las cartillas nuevas se construyen antes de descartar las actuales
+        nuevas = [Cartilla.desde_json(codigo, datos_cartilla, con_marcados=False)
+                  for codigo, datos_cartilla in datos["cartillas"].items()]
+        
+        self.cartillas = {}
+        self.motor.reiniciar()
+        self.huellas.reiniciar()
+        if self.premios is not None:
+            self.premios = PremiosSimultaneos(self.premios.patrones)
+        self.ranking.reiniciar()
+        self._pendientes_verificacion = []
+        self.gestor_rondas.reiniciar()
+        
+        patron = datos.get("patron_actual")
+        ronda = datos.get("ronda_actual")
+        if ronda is None:
+            # Archivos anteriores (como demo_juego.json) no guardan la ronda: se deduce del patrón
+            orden = self.gestor_rondas.patrones_orden
+            ronda = orden.index(patron) if patron in orden else 0
+        self.gestor_rondas.ronda_actual = ronda
+        self.patron_actual = patron or self.gestor_rondas.obtener_patron_actual()
+        self.numeros_sorteados.clear()
+        self.cartillas_ganadoras = ConjuntoOrdenado(datos.get("cartillas_ganadoras", []))
+        
+        if "ganadores_por_ronda" in datos:
+            for patron_ronda, ganadores in datos["ganadores_por_ronda"].items():
+                self.gestor_rondas.ganadores_por_ronda[patron_ronda] = list(ganadores)
+        elif self.patron_actual in self.gestor_rondas.ganadores_por_ronda:
+            self.gestor_rondas.ganadores_por_ronda[self.patron_actual] = list(self.cartillas_ganadoras)
+        
+        for cartilla in nuevas:
+            self._registrar_cartilla(cartilla)
+        
+        ganadoras = set(self.cartillas_ganadoras)
+        for numero in datos.get("numeros_sorteados", []):
+            if not isinstance(numero, int) or not 1 <= numero <= 90 or numero in self.numeros_sorteados:
+                continue
+            for cartilla in self._marcar_sorteado(numero):
+                # Completaron el patrón pero no figuran como ganadoras: se revisan con la próxima bola
+                if self.ranking.distancia(cartilla.codigo) == 0 and cartilla.codigo not in ganadoras:
+                    self._pendientes_verificacion.append(cartilla)
+                    ganadoras.add(cartilla.codigo)
+    
+    def _aplicar_evento(self, evento):
+        """Aplica un evento del diario sin mostrar nada ni preguntar"""
+        tipo = evento["evento"]
+        if tipo == "cartilla":
+            cartilla = Cartilla(evento["codigo"], evento["numeros"])
+            for posicion, numero in enumerate(evento["numeros"]):
+                if numero in self.numeros_sorteados:
+                    cartilla.marcar_posicion(posicion)
+            self._registrar_cartilla(cartilla)
+        elif tipo == "numero":
+            self._marcar_sorteado(evento["numero"])
+        elif tipo == "eliminar":
+            self._desmarcar_sorteado(evento["numero"])
+        elif tipo == "ganador":
+            self._registrar_ganador(evento["codigo"])
+        elif tipo == "ronda":
+            self._ir_a_ronda(evento["ronda"])
+        elif tipo == "patron":
+            self.patron_actual = evento["patron"]
+            self._seguir_patron_actual()
+        elif tipo == "reinicio":
+            self._reiniciar_juego()
+        elif tipo == "reinicio_sorteo":
+            self.reiniciar_sorteo()
+    
+    def recuperar_diario(self, archivo="juego_diario.log"):
+        """
+        Reconstruye el juego tras una caída: carga el último snapshot y reaplica el diario
+        Al terminar el diario queda activo y sigue anotando a continuación
+        
+        Args:
+            archivo (str): Archivo del diario
+            
+        Returns:
+            bool: True si se recuperó el juego
+        """
+        if not os.path.exists(archivo):
+            self.observador.mensaje(f"⚠️  Archivo '{archivo}' no encontrado")
+            return False
+        
+        self.desactivar_diario()
+        eventos = DiarioJuego.leer(archivo)
+        inicio = next(eventos, None)
+        if inicio is None or inicio["evento"] != "snapshot":
+            self.observador.mensaje(f"❌ El diario '{archivo}' no empieza con un snapshot")
+            return False
+        
+        datos = self.gestor_json.cargar_juego(inicio["archivo"])
+        error = self._validar_juego(datos)
+        if error:
+            self.observador.mensaje(f"❌ No se pudo usar el snapshot '{inicio['archivo']}': {error}")
+            return False
+        
+        self.archivo_snapshot = inicio["archivo"]
+        # La partida ya se jugó: al reaplicarla no se repiten sus avisos (BINGO, premios, rondas)
+        observador, self.observador = self.observador, ObservadorJuego()
+        try:
+            self._restaurar_snapshot(datos)
+            aplicados = 0
+            for evento in eventos:
+                self._aplicar_evento(evento)
+                aplicados += 1
+            
+            # Cartillas que completaron el patrón sin llegar a anotarse como ganadoras
+            self._seguir_patron_actual()
+        finally:
+            self.observador = observador
+        self.diario = DiarioJuego(archivo, continuar=True)
+        self.observador.mensaje(f"✅ Juego recuperado: snapshot '{self.archivo_snapshot}' + {aplicados} eventos")
+        self._avisar_repetidas()
+        return True
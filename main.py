@@ -1,5 +1,150 @@
+import os
+import sys
 from juego_bingo import JuegoBingo
+from cartilla import BORDE_INFERIOR, BORDE_SUPERIOR
 from gestor_json import GestorJSON
+from observador_juego import ObservadorJuego
+from patrones import DESCRIPCIONES
+from escritor_consola import EscritorConsola
+
+
+# Partes fijas del anuncio de BINGO (se arman una sola vez)
+_CABECERA_BINGO = "\n".join((
+    "\n" + "🎉" * 35,
+    "🎉" + " " * 66 + "🎉",
+    "🎉" + "  ¡¡¡BINGO!!!".center(66) + "🎉",
+    "🎉" + " " * 66 + "🎉",
+    "🎉" * 35,
+)) + "\n"
+_PIE_BINGO = "\n" + "🎉" * 35 + "\n"
+_PLANTILLA_GANADOR = (
+    "\n✅ CARTILLA GANADORA: {codigo}\n"
+    "   Patrón: {patron}\n"
+    "   Números ingresados para ganar: {numeros}\n"
+    "   Total de números: {total}\n"
+    "\n   Cartilla ganadora:\n"
+    "{recuadro}"
+)
+
+
+class ObservadorConsola(ObservadorJuego):
+    """
+    Muestra en consola los avisos del juego y pregunta al operador el paso de ronda
+    Cada aviso sale en una sola escritura; con segundo_plano=True las escrituras las hace
+    un hilo aparte y el sorteo no espera a la terminal
+    """
+    
+    def __init__(self, segundo_plano=False):
+        """
+        Args:
+            segundo_plano (bool): Escribir desde un hilo aparte (EscritorConsola)
+        """
+        self.escritor = EscritorConsola() if segundo_plano else None
+    
+    def _escribir(self, texto):
+        """Escribe un aviso completo (con su salto de línea final)"""
+        if self.escritor is not None:
+            self.escritor.escribir(texto)
+        else:
+            sys.stdout.write(texto)
+    
+    def esperar(self):
+        """Espera a que se escriban los avisos pendientes (antes de mostrar el menú o preguntar)"""
+        if self.escritor is not None:
+            self.escritor.esperar()
+    
+    def mensaje(self, texto):
+        self._escribir(f"{texto}\n")
+    
+    def progreso_carga(self, cartillas, bytes_leidos, bytes_totales):
+        porcentaje = 100 * bytes_leidos // bytes_totales if bytes_totales else 100
+        self._escribir(f"   ⏳ {cartillas} cartillas leídas ({porcentaje}%)\n")
+    
+    def cartilla_agregada(self, codigo):
+        self._escribir(f"✅ Cartilla '{codigo}' agregada correctamente\n")
+    
+    def cartilla_rechazada(self, codigo, motivo):
+        self._escribir(f"❌ {motivo}\n")
+    
+    def numero_ingresado(self, numero, afectadas, juego):
+        lineas = [
+            f"\n📌 Número {numero} ingresado",
+            f"   Total números sorteados: {len(juego.numeros_sorteados)}",
+            f"   Números: {juego.numeros_sorteados.ordenados()}",
+        ]
+        if afectadas:
+            lineas.append(f"   ✅ Marcado en cartillas: {', '.join(cartilla.codigo for cartilla in afectadas)}")
+        else:
+            lineas.append(f"   ⊘ No aparece en ninguna cartilla")
+        self._escribir("\n".join(lineas) + "\n")
+    
+    def numero_repetido(self, numero):
+        self._escribir(f"⚠️  El número {numero} ya fue sorteado\n")
+    
+    def numero_eliminado(self, numero, afectadas, juego):
+        lineas = [
+            f"\n❌ Número {numero} eliminado",
+            f"   Total números sorteados: {len(juego.numeros_sorteados)}",
+            f"   Números: {juego.numeros_sorteados.ordenados()}",
+        ]
+        if afectadas:
+            lineas.append(f"   ✅ Desmarcado en cartillas: {', '.join(cartilla.codigo for cartilla in afectadas)}")
+        self._escribir("\n".join(lineas) + "\n")
+    
+    def numero_no_sorteado(self, numero):
+        self._escribir(f"⚠️  El número {numero} no fue sorteado\n")
+    
+    def premios_completados(self, completados, juego):
+        bola = len(juego.numeros_sorteados)
+        self._escribir("".join(f"   🏅 Cartilla {codigo} completó {patron} con la bola {bola}\n"
+                               for codigo, patron in completados))
+    
+    def bingo(self, ganadores, juego):
+        """Muestra mensaje de BINGO formateado (todas las ganadoras de la bola en una escritura)"""
+        # Lo común a todas las ganadoras se calcula una vez por bola
+        comunes = {
+            "patron": juego.patron_actual,
+            "numeros": juego.numeros_sorteados.ordenados(),
+            "total": len(juego.numeros_sorteados),
+        }
+        self._escribir("".join((
+            _CABECERA_BINGO,
+            *(_PLANTILLA_GANADOR.format(codigo=cartilla.codigo, recuadro=self._recuadro(cartilla), **comunes)
+              for cartilla in ganadores),
+            _PIE_BINGO,
+        )))
+    
+    def _recuadro(self, cartilla):
+        """Recuadro de la cartilla con sus marcados (las mismas filas que str(cartilla))"""
+        numeros = cartilla.numeros
+        marcas = cartilla.obtener_mascara()
+        return "".join((f"   {BORDE_SUPERIOR}\n",
+                        *(f"   {cartilla.texto_fila(i, marcas, numeros)}\n" for i in range(5)),
+                        f"   {BORDE_INFERIOR}\n"))
+    
+    def continuar_siguiente_ronda(self, juego):
+        self._escribir("\n" + "="*80 + "\n")
+        self.esperar()
+        while True:
+            respuesta = input("¿Continuar a la siguiente ronda? (s/n): ").strip().lower()
+            if respuesta == 's':
+                return True
+            elif respuesta == 'n':
+                return False
+            else:
+                print("❌ Respuesta inválida. Por favor ingresa 's' (sí) o 'n' (no)")
+    
+    def juego_detenido(self):
+        self._escribir("\n⏹️  Juego finalizado. Gracias por jugar.\n")
+    
+    def nueva_ronda(self, numero_ronda, patron):
+        self._escribir(f"\n🎯 NUEVA RONDA - Ronda {numero_ronda}\n"
+                       f"   Nuevo patrón: {patron}\n"
+                       f"   Números reiniciados para nueva ronda\n")
+    
+    def sin_mas_rondas(self):
+        self._escribir("\n✅ ¡JUEGO FINALIZADO! No hay más rondas disponibles\n")
+
 
 def agregar_cartilla_fila_por_fila(juego):
     """Agrega una cartilla ingresando fila por fila"""
@@ -73,30 +218,69 @@ def agregar_cartilla_manual(juego):
         print("❌ Error: debes ingresar exactamente 25 números enteros")
 
 def mostrar_patrones():
-    """Muestra todos los patrones disponibles"""
+    """Muestra todos los patrones disponibles (incluidos los de patrones.json)"""
     print("\n🎯 Patrones disponibles:")
-    print("   U  - U (columna izq + fila inferior + columna der)")
-    print("   T  - T (fila superior + columna central)")
-    print("   E  - E (columna izq + 3 líneas horizontales)")
-    print("   C  - C (columna izq + fila superior + inferior)")
-    print("   L  - L (última fila + última columna)")
-    print("   Z  - Z (primera fila + última fila + diagonal)")
-    print("   B  - B (primera columna + línea media)")
-    print("   X  - X (ambas diagonales)")
-    print("   LINEA      - Fila completa")
-    print("   COLUMNA    - Columna completa")
-    print("   DIAGONAL   - Una diagonal")
-    print("   APAGON     - Cartilla completamente llena")
+    for nombre, descripcion in DESCRIPCIONES.items():
+        print(f"   {nombre:<{2 if len(nombre) == 1 else 10}} - {descripcion or nombre}")
+
+def mostrar_premios(juego):
+    """Muestra el primer ganador de cada patrón en modo de premios simultáneos"""
+    print("\n" + "="*70)
+    print("🏅 PREMIOS SIMULTÁNEOS")
+    print("="*70)
+    for patron, ganador in juego.obtener_premios().items():
+        if ganador is None:
+            print(f"   {patron:<8} - Sin ganador todavía")
+        else:
+            bola, codigos = ganador
+            print(f"   {patron:<8} - Bola {bola}: {', '.join(codigos)}")
+
+def mostrar_panel(juego):
+    """Pregunta filtro y página y muestra esa parte del panel"""
+    filtro = input("Filtro (todas/ganadoras/casi/rango, Enter = todas): ").strip().lower() or "todas"
+    desde = hasta = None
+    if filtro == "rango":
+        filtro = "todas"
+        desde = input("Desde el código (Enter = primero): ").strip() or None
+        hasta = input("Hasta el código (Enter = último): ").strip() or None
+    try:
+        pagina = int(input("Página (Enter = 1): ").strip() or 1)
+        tamaño = int(input("Cartillas por página (Enter = 20): ").strip() or 20)
+    except ValueError:
+        print("❌ Entrada inválida. Debes ingresar un número entero.")
+        return
+    juego.mostrar_panel(pagina, tamaño, filtro, desde, hasta)
 
-def menu_principal():
-    """Menú principal del juego"""
-    juego = JuegoBingo()
+
+def menu_principal(motor="python", segundo_plano=False, diario=False):
+    """
+    Menú principal del juego
+    
+    Args:
+        motor (str): Motor de marcado de JuegoBingo ('python' o 'numpy')
+        segundo_plano (bool): Escribir los avisos del juego desde un hilo aparte
+        diario (bool): Anotar la partida en juego_diario.log para recuperarla tras una caída
+    """
+    observador = ObservadorConsola(segundo_plano)
+    juego = JuegoBingo(motor, observador)
+    observador.esperar()
+    
+    # Si quedó un diario de una sesión que no terminó bien, ofrecer recuperarla
+    if os.path.exists("juego_diario.log"):
+        respuesta = input("⚠️  Se encontró un juego sin terminar. ¿Recuperarlo? (s/n): ").strip().lower()
+        if respuesta == 's':
+            juego.recuperar_diario("juego_diario.log")
+    # El diario empieza con un snapshot de todas las cartillas: solo si se pidió
+    if diario and juego.diario is None:
+        juego.activar_diario("juego_diario.log")
     
     print("\n" + "🎰"*35)
     print("🎰" + " BINGO PROGRESIVO - RONDAS: U → T → E → C → APAGON ".center(68) + "🎰")
     print("🎰"*35)
     
     while True:
+        # Que terminen de salir los avisos antes de mostrar el menú
+        observador.esperar()
         # Mostrar ronda actual
         ronda = juego.obtener_numero_ronda()
         patron = juego.patron_actual or "No establecido"
@@ -113,14 +297,17 @@ def menu_principal():
         print("   5. Ver números sorteados")
         print("   5.5. Eliminar número sorteado")
         print("📊 PANEL Y DATOS")
-        print("   6. Mostrar panel completo")
+        print("   6. Mostrar panel (por páginas y filtros)")
         print("   7. Mostrar resumen")
+        print("   7.5. Ver cartillas casi ganadoras")
         print("   8. Ver estado de rondas (U→T→E→C→APAGON)")
         print("   8.5. Cambiar a otra ronda")
+        print("   8.7. Premios simultáneos (todas las rondas a la vez)")
         print("💾 PERSISTENCIA")
         print("   9. Guardar cartillas en JSON")
         print("   10. Cargar cartillas desde JSON")
         print("   11. Guardar juego actual")
+        print("   12. Cargar juego guardado")
         print("🔄 OTROS")
         print("   0. Salir")
         print("="*70)
@@ -162,7 +349,7 @@ def menu_principal():
                 print("❌ No hay números sorteados aún")
             else:
                 print(f"\n📌 Números sorteados: {len(juego.numeros_sorteados)}")
-                print(f"   {sorted(juego.numeros_sorteados)}")
+                print(f"   {juego.numeros_sorteados.ordenados()}")
         
         elif opcion == '5.5':
             if not juego.numeros_sorteados:
@@ -184,11 +371,14 @@ def menu_principal():
             if not juego.cartillas:
                 print("❌ No hay cartillas para mostrar")
             else:
-                juego.mostrar_panel()
+                mostrar_panel(juego)
         
         elif opcion == '7':
             juego.mostrar_resumen()
         
+        elif opcion == '7.5':
+            juego.mostrar_casi_ganadores()
+        
         elif opcion == '8':
             juego.mostrar_estado_rondas()
         
@@ -215,6 +405,12 @@ def menu_principal():
                     except ValueError:
                         print("❌ Entrada inválida. Debes ingresar un número entero. Intenta de nuevo.")
         
+        elif opcion == '8.7':
+            if juego.premios is None:
+                juego.activar_premios_simultaneos()
+            else:
+                mostrar_premios(juego)
+        
         elif opcion == '9':
             if not juego.cartillas:
                 print("❌ No hay cartillas para guardar")
@@ -233,14 +429,34 @@ def menu_principal():
                     nombre = "juego_guardado.json"
                 juego.guardar_juego(nombre)
         
+        elif opcion == '12':
+            nombre = input("Nombre del archivo (default: juego_guardado.json): ").strip()
+            if not nombre:
+                nombre = "juego_guardado.json"
+            juego.cargar_juego(nombre)
+        
         elif opcion == '0':
+            # Salida normal: el diario ya no hace falta para recuperar nada
+            if juego.diario is not None:
+                juego.desactivar_diario()
+                os.remove("juego_diario.log")
+            observador.esperar()
             print("\n👋 ¡Gracias por jugar! Hasta pronto...")
             break
         
         else:
-            print("❌ Opción no válida. Ingresa un número del 0 al 11 (o 5.5, 8.5 para opciones adicionales)")
+            print("❌ Opción no válida. Ingresa un número del 0 al 12 (o 5.5, 7.5, 8.5, 8.7 para opciones adicionales)")
             print("   Presiona Enter para continuar...")
             input()
 
 if __name__ == "__main__":
-    menu_principal()
+    # Uso: python main.py [python|numpy] [puerto de métricas] [--segundo-plano] [--diario]
+    segundo_plano = "--segundo-plano" in sys.argv
+    diario = "--diario" in sys.argv
+    argumentos = [a for a in sys.argv[1:] if a not in ("--segundo-plano", "--diario")]
+    if len(argumentos) > 1:
+        import metricas
+        metricas.activar(ObservadorConsola)
+        metricas.servir_http(int(argumentos[1]))
+        print(f"📈 Métricas en http://127.0.0.1:{argumentos[1]}/metrics")
+    menu_principal(argumentos[0] if argumentos else "python", segundo_plano, diario)
@@ -0,0 +1,307 @@
+"""
+Registro de métricas del camino crítico (tiempos por llamada e histogramas).
+Desactivado, no cuesta nada: las funciones originales no se tocan. Al activarlo se
+reemplazan los métodos instrumentados por versiones que miden cada llamada, y al
+desactivarlo se restauran. Las esperas del operador (la pregunta de pasar de ronda)
+se miden aparte y se descuentan de las llamadas que las contienen.
+
+    import metricas
+    metricas.activar()
+    metricas.servir_http(9100)        # http://localhost:9100/metrics
+    metricas.guardar_prometheus("metricas.prom")
+"""
+import functools
+import inspect
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter
+
+# Límites de los histogramas en segundos (de 10 µs a 10 s)
+LIMITES = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+
+class Histograma:
+    """Histograma acumulado de duraciones en el formato de Prometheus"""
+
+    def __init__(self, limites=LIMITES):
+        self.limites = limites
+        self.cubetas = [0] * (len(limites) + 1)
+        self.suma = 0.0
+        self.cantidad = 0
+        self.maximo = 0.0
+
+    def observar(self, segundos):
+        self.cubetas[bisect_left(self.limites, segundos)] += 1
+        self.suma += segundos
+        self.cantidad += 1
+        if segundos > self.maximo:
+            self.maximo = segundos
+
+    def percentil(self, p):
+        """Percentil aproximado (límite superior de la cubeta que lo contiene)"""
+        if not self.cantidad:
+            return None
+        objetivo = p / 100 * self.cantidad
+        acumulado = 0
+        for limite, cantidad in zip(self.limites, self.cubetas):
+            acumulado += cantidad
+            if acumulado >= objetivo:
+                return limite
+        return self.maximo
+
+
+class RegistroMetricas:
+    """Contadores e histogramas con nombre"""
+
+    def __init__(self, prefijo="bingo"):
+        self.prefijo = prefijo
+        self.histogramas = {}
+        self.contadores = {}
+
+    def histograma(self, nombre):
+        """Histograma con ese nombre (se crea la primera vez)"""
+        if nombre not in self.histogramas:
+            self.histogramas[nombre] = Histograma()
+        return self.histogramas[nombre]
+
+    def contar(self, nombre, cantidad=1):
+        """Suma a un contador"""
+        self.contadores[nombre] = self.contadores.get(nombre, 0) + cantidad
+
+    def reiniciar(self):
+        """Borra todas las métricas"""
+        self.histogramas = {}
+        self.contadores = {}
+
+    def instantanea(self):
+        """
+        Estado actual de todas las métricas
+
+        Returns:
+            dict: 'contadores' y 'tiempos' (nombre -> llamadas, total, media, p50, p95 y máximo en ms)
+        """
+        tiempos = {}
+        for nombre, histograma in self.histogramas.items():
+            if not histograma.cantidad:
+                continue
+            tiempos[nombre] = {
+                "llamadas": histograma.cantidad,
+                "total_ms": 1000 * histograma.suma,
+                "media_ms": 1000 * histograma.suma / histograma.cantidad,
+                "p50_ms": 1000 * histograma.percentil(50),
+                "p95_ms": 1000 * histograma.percentil(95),
+                "max_ms": 1000 * histograma.maximo,
+            }
+        return {"contadores": dict(self.contadores), "tiempos": tiempos}
+
+    def exportar_prometheus(self):
+        """Todas las métricas en el formato de texto de Prometheus"""
+        lineas = []
+        for nombre, valor in sorted(self.contadores.items()):
+            metrica = f"{self.prefijo}_{nombre}_total"
+            lineas.append(f"# TYPE {metrica} counter")
+            lineas.append(f"{metrica} {valor}")
+        for nombre, histograma in sorted(self.histogramas.items()):
+            metrica = f"{self.prefijo}_{nombre}_segundos"
+            lineas.append(f"# TYPE {metrica} histogram")
+            acumulado = 0
+            for limite, cantidad in zip(histograma.limites, histograma.cubetas):
+                acumulado += cantidad
+                lineas.append(f'{metrica}_bucket{{le="{limite}"}} {acumulado}')
+            lineas.append(f'{metrica}_bucket{{le="+Inf"}} {histograma.cantidad}')
+            lineas.append(f"{metrica}_sum {histograma.suma}")
+            lineas.append(f"{metrica}_count {histograma.cantidad}")
+        return "\n".join(lineas) + "\n"
+
+
+METRICAS = RegistroMetricas()
+
+# Puntos instrumentados: (módulo, clase, método, nombre de la métrica)
+PUNTOS = (
+    ("juego_bingo", "JuegoBingo", "ingresar_numero", "ingresar_numero"),
+    ("juego_bingo", "JuegoBingo", "eliminar_numero", "eliminar_numero"),
+    ("juego_bingo", "JuegoBingo", "_marcar_sorteado", "marcar_sorteado"),
+    ("juego_bingo", "JuegoBingo", "_verificar_ganadores_automatico", "verificar_ganadores"),
+    ("indice_numeros", "IndiceNumeros", "marcar", "motor_marcar"),
+    ("motor_numpy", "MotorNumpy", "marcar", "motor_marcar"),
+    ("gestor_json", "GestorJSON", "guardar_cartillas", "json_guardar_cartillas"),
+    ("gestor_json", "GestorJSON", "escribir_cartillas", "json_escribir_cartillas"),
+    ("gestor_json", "GestorJSON", "iterar_cartillas", "json_leer_cartillas"),
+    ("gestor_json", "GestorJSON", "guardar_juego", "json_guardar_juego"),
+    ("gestor_json", "GestorJSON", "cargar_juego", "json_cargar_juego"),
+    ("diario_juego", "DiarioJuego", "registrar", "diario_registrar"),
+)
+
+# Esperas del operador: se miden en su propio histograma y no cuentan en las demás
+PAUSAS = (
+    ("juego_bingo", "JuegoBingo", "_preguntar_siguiente_ronda", "espera_operador"),
+)
+
+
+def _contar_sorteo(resultado):
+    """Contadores de una bola procesada a partir de (resultado, afectadas) de _procesar_numero"""
+    datos, _ = resultado
+    if datos["repetido"]:
+        return (("bolas_repetidas", 1),)
+    return (("bolas", 1), ("cartillas_tocadas", datos["afectadas"]), ("ganadores", len(datos["ganadores"])))
+
+
+# Contadores: (módulo, clase, método, función que convierte el resultado en (nombre, cantidad))
+CONTADORES = (
+    ("juego_bingo", "JuegoBingo", "_procesar_numero", _contar_sorteo),
+)
+
+# Métodos originales reemplazados mientras las métricas están activas
+_originales = []
+
+# Llamadas medidas en curso en cada hilo: cada una acumula las pausas que debe descontar
+_hilo = threading.local()
+
+
+def _en_curso():
+    """Pila de llamadas medidas abiertas en el hilo actual"""
+    try:
+        return _hilo.pila
+    except AttributeError:
+        _hilo.pila = []
+        return _hilo.pila
+
+
+def _medir(funcion, histograma):
+    """Versión de la función que anota la duración de cada llamada (sin las pausas internas)"""
+    if inspect.isgeneratorfunction(funcion):
+        @functools.wraps(funcion)
+        def medida_generador(*args, **kwargs):
+            # Solo cuenta el tiempo dentro del generador, no el de quien lo consume
+            generador = funcion(*args, **kwargs)
+            pila = _en_curso()
+            pausas = [0.0]
+            total = 0.0
+            while True:
+                pila.append(pausas)
+                inicio = perf_counter()
+                try:
+                    valor = next(generador)
+                except StopIteration:
+                    histograma.observar(total + perf_counter() - inicio - pausas[0])
+                    return
+                finally:
+                    pila.pop()
+                total += perf_counter() - inicio
+                yield valor
+        return medida_generador
+
+    @functools.wraps(funcion)
+    def medida(*args, **kwargs):
+        pila = _en_curso()
+        pausas = [0.0]
+        pila.append(pausas)
+        inicio = perf_counter()
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            histograma.observar(perf_counter() - inicio - pausas[0])
+            pila.pop()
+    return medida
+
+
+def _medir_pausa(funcion, histograma):
+    """Versión de la función que anota su duración y la descuenta de las llamadas abiertas"""
+    @functools.wraps(funcion)
+    def pausa(*args, **kwargs):
+        inicio = perf_counter()
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            espera = perf_counter() - inicio
+            histograma.observar(espera)
+            for pausas in _en_curso():
+                pausas[0] += espera
+    return pausa
+
+
+def _contar(funcion, cantidades):
+    """Versión de la función que suma a los contadores según lo que devuelve"""
+    @functools.wraps(funcion)
+    def contada(*args, **kwargs):
+        resultado = funcion(*args, **kwargs)
+        for nombre, cantidad in cantidades(resultado):
+            METRICAS.contar(nombre, cantidad)
+        return resultado
+    return contada
+
+
+def _instrumentar(clase, metodo, envoltura, dato):
+    original = clase.__dict__[metodo]
+    _originales.append((clase, metodo, original))
+    setattr(clase, metodo, envoltura(original, dato))
+
+
+def activar(observador=None):
+    """
+    Empieza a medir los puntos de PUNTOS y PAUSAS y a llevar los CONTADORES
+
+    Args:
+        observador (type): Clase de observador cuyos avisos de bola y BINGO también se miden
+            (por ejemplo ObservadorConsola, para separar el tiempo de impresión)
+    """
+    if _originales:
+        return
+    import importlib
+    for modulo, clase, metodo, nombre in PUNTOS:
+        _instrumentar(getattr(importlib.import_module(modulo), clase), metodo, _medir, METRICAS.histograma(nombre))
+    for modulo, clase, metodo, nombre in PAUSAS:
+        _instrumentar(getattr(importlib.import_module(modulo), clase), metodo, _medir_pausa, METRICAS.histograma(nombre))
+    for modulo, clase, metodo, cantidades in CONTADORES:
+        _instrumentar(getattr(importlib.import_module(modulo), clase), metodo, _contar, cantidades)
+    if observador is not None:
+        for metodo in ("numero_ingresado", "bingo"):
+            if metodo in observador.__dict__:
+                _instrumentar(observador, metodo, _medir, METRICAS.histograma(f"observador_{metodo}"))
+
+
+def desactivar():
+    """Restaura los métodos originales (las métricas acumuladas se conservan)"""
+    while _originales:
+        clase, metodo, original = _originales.pop()
+        setattr(clase, metodo, original)
+
+
+def activo():
+    """Indica si las métricas están activas"""
+    return bool(_originales)
+
+
+def guardar_prometheus(archivo="metricas.prom"):
+    """Escribe las métricas en un archivo de texto (para el recolector de archivos de Prometheus)"""
+    with open(archivo, 'w', encoding='utf-8') as f:
+        f.write(METRICAS.exportar_prometheus())
+
+
+class _ManejadorMetricas(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        cuerpo = METRICAS.exportar_prometheus().encode('utf-8')
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, formato, *args):
+        pass  # Sin registro por cada consulta
+
+
+def servir_http(puerto=9100, host="127.0.0.1"):
+    """
+    Publica las métricas en http://host:puerto/metrics desde un hilo en segundo plano
+
+    Returns:
+        ThreadingHTTPServer: Servidor (llamar a shutdown() para detenerlo)
+    """
+    servidor = ThreadingHTTPServer((host, puerto), _ManejadorMetricas)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor
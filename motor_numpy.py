@@ -0,0 +1,264 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: solo lo necesita este motor
+    np = None
+
+from cartilla import RONDA_LIBRE, Cartilla
+from patrones import PATRONES
+
+
+class CartillaNumpy(Cartilla):
+    """Cartilla que no guarda datos propios: lee y escribe una fila de los arreglos del motor"""
+
+    __slots__ = ("_motor", "_fila")
+
+    def __init__(self, motor, fila, codigo):
+        """
+        Crea la vista de una fila del motor
+
+        Args:
+            motor (MotorNumpy): Motor dueño de los arreglos
+            fila (int): Fila de la cartilla en los arreglos
+            codigo (str): Identificador de la cartilla
+        """
+        self._motor = motor
+        self._fila = fila
+        self.codigo = codigo
+        self._patron = None
+        self._faltantes = None
+        self._celdas_patron = None
+        self._contexto = RONDA_LIBRE
+        self._epoca = 0
+
+    def _ponerse_al_dia(self):
+        """Adopta el patrón de la ronda; las marcas ya las borró el motor en una sola escritura"""
+        contexto = self._contexto
+        self._epoca = contexto.epoca
+        self._patron = contexto.patron
+        self._celdas_patron = contexto.celdas
+
+    @property
+    def numeros(self):
+        """Los 25 números leídos de la fila del motor (bytes)"""
+        return self._motor.numeros[self._fila].tobytes()
+
+    @property
+    def _marcas(self):
+        return self._motor.leer_mascara(self._fila)
+
+    @_marcas.setter
+    def _marcas(self, mascara):
+        self._motor.escribir_mascara(self._fila, mascara)
+
+    @property
+    def marcados(self):
+        """Matriz 5x5 de booleanos leída de la fila del motor (el motor la modifica sin avisar)"""
+        return self._motor.marcados[self._fila].reshape(5, 5).tolist()
+
+    @marcados.setter
+    def marcados(self, matriz):
+        self._motor.marcados[self._fila] = np.asarray(matriz, dtype=bool).reshape(25)
+
+    def marcar_posicion(self, posicion):
+        """Marca una celda directamente en el arreglo del motor"""
+        fila = self._motor.marcados[self._fila]
+        if fila[posicion]:
+            return False
+        fila[posicion] = True
+        return True
+
+    def desmarcar_posicion(self, posicion):
+        """Desmarca una celda directamente en el arreglo del motor (nunca el centro)"""
+        fila = self._motor.marcados[self._fila]
+        if posicion == 12 or not fila[posicion]:
+            return False
+        fila[posicion] = False
+        return True
+
+    def _recalcular_faltantes(self):
+        """Las celdas faltantes se calculan al consultarlas, no hay contadores que mantener"""
+
+    def completo_patron(self):
+        """Indica si el patrón seguido está completo según la fila del motor"""
+        if self._epoca != self._contexto.epoca:
+            self._ponerse_al_dia()
+        return self._patron is not None and self._cumple(PATRONES[self._patron])
+
+    def faltantes_patron(self):
+        """Celdas que faltan para el patrón seguido según la fila del motor"""
+        if self._epoca != self._contexto.epoca:
+            self._ponerse_al_dia()
+        if self._patron is None:
+            return None
+        libres = ~self._marcas
+        return min(bin(mascara & libres).count('1') for mascara in PATRONES[self._patron])
+
+
+class CartillasMarcadas(list):
+    """Vistas tocadas por una bola que además recuerdan sus filas en los arreglos del motor"""
+
+    __slots__ = ("filas",)
+
+
+class MotorNumpy:
+    """
+    Motor vectorizado: todas las cartillas viven en un arreglo (N, 25) de números y
+    otro (N, 25) de marcados. Marcar un número es una sola comparación sobre el arreglo
+    y un patrón se evalúa para todas las cartillas con una reducción enmascarada.
+    """
+
+    def __init__(self, capacidad=1024):
+        if np is None:
+            raise ImportError("El motor 'numpy' requiere instalar NumPy (pip install numpy)")
+        self.numeros = np.zeros((capacidad, 25), dtype=np.uint8)
+        self.marcados = np.zeros((capacidad, 25), dtype=bool)
+        self.vistas = []
+        self.total = 0
+        self._potencias = np.left_shift(1, np.arange(25, dtype=np.int64))
+        self._mascaras = {}
+
+    def _asegurar_capacidad(self):
+        """Duplica los arreglos cuando se llenan"""
+        if self.total < len(self.numeros):
+            return
+        nueva = max(1, 2 * len(self.numeros))
+        for nombre in ('numeros', 'marcados'):
+            viejo = getattr(self, nombre)
+            arreglo = np.zeros((nueva, 25), dtype=viejo.dtype)
+            arreglo[:self.total] = viejo[:self.total]
+            setattr(self, nombre, arreglo)
+
+    def agregar_cartilla(self, cartilla):
+        """
+        Copia una cartilla a una nueva fila de los arreglos
+
+        Args:
+            cartilla (Cartilla): Cartilla con sus números y marcados
+
+        Returns:
+            CartillaNumpy: Vista sobre la fila que debe usarse en lugar de la cartilla original
+        """
+        self._asegurar_capacidad()
+        fila = self.total
+        self.numeros[fila] = np.frombuffer(cartilla.numeros, dtype=np.uint8)
+        vista = CartillaNumpy(self, fila, cartilla.codigo)
+        vista._marcas = cartilla.obtener_mascara()
+        self.vistas.append(vista)
+        self.total += 1
+        return vista
+
+    def quitar_cartilla(self, cartilla):
+        """Deja la fila sin números ni marcas (el 0 nunca se sortea) para que no vuelva a tocarse"""
+        self.numeros[cartilla._fila] = 0
+        self.marcados[cartilla._fila] = False
+
+    def leer_mascara(self, fila):
+        """Convierte la fila de marcados en un entero de 25 bits"""
+        return int(self.marcados[fila] @ self._potencias)
+
+    def escribir_mascara(self, fila, mascara):
+        """Escribe un entero de 25 bits en la fila de marcados"""
+        self.marcados[fila] = (mascara >> np.arange(25)) & 1
+
+    def marcar(self, numero):
+        """
+        Marca un número en todas las cartillas con una comparación vectorizada
+
+        Args:
+            numero (int): Número sorteado
+
+        Returns:
+            CartillasMarcadas: Vistas de las cartillas que contienen el número, con sus
+                índices de fila en el atributo `filas`
+        """
+        filas, columnas = np.nonzero(self.numeros[:self.total] == numero)
+        self.marcados[filas, columnas] = True
+        filas = np.unique(filas)
+        afectadas = CartillasMarcadas(self.vistas[fila] for fila in filas)
+        afectadas.filas = filas
+        return afectadas
+
+    def desmarcar(self, numero):
+        """
+        Desmarca un número en todas las cartillas (el centro nunca se desmarca)
+
+        Args:
+            numero (int): Número eliminado
+
+        Returns:
+            list: Vistas de las cartillas que contienen el número
+        """
+        filas, columnas = np.nonzero(self.numeros[:self.total] == numero)
+        fuera_del_centro = columnas != 12
+        self.marcados[filas[fuera_del_centro], columnas[fuera_del_centro]] = False
+        return [self.vistas[fila] for fila in np.unique(filas)]
+
+    def reiniciar_marcados(self, cartillas=None):
+        """Desmarca todas las cartillas (excepto el centro) en una sola escritura"""
+        self.marcados[:self.total] = False
+        self.marcados[:self.total, 12] = True
+
+    def _mascaras_patron(self, patron):
+        """Alternativas del patrón como arreglo traspuesto (25, A) de enteros, calculado una vez"""
+        if patron not in self._mascaras:
+            self._mascaras[patron] = np.array(
+                [[mascara >> posicion & 1 for posicion in range(25)] for mascara in PATRONES[patron]],
+                dtype=np.int32,
+            ).T
+        return self._mascaras[patron]
+
+    def faltantes_patron(self, patron, filas=None):
+        """
+        Celdas faltantes de cada cartilla para completar el patrón
+
+        Args:
+            patron (str): Patrón de Cartilla.verificar_patron
+            filas (numpy.ndarray): Filas a evaluar (por defecto todas)
+
+        Returns:
+            numpy.ndarray: Arreglo (N,) con el mínimo de celdas faltantes entre alternativas
+        """
+        marcados = self.marcados[:self.total] if filas is None else self.marcados[filas]
+        libres = (~marcados).astype(np.int32)
+        return (libres @ self._mascaras_patron(patron.upper())).min(axis=1)
+
+    def faltantes_cartillas(self, cartillas, patron):
+        """
+        Celdas faltantes de varias cartillas con una sola multiplicación de matrices
+
+        Args:
+            cartillas (list): Vistas a evaluar (las de marcar() ya traen sus filas)
+            patron (str): Patrón actual del juego (None si no hay)
+
+        Returns:
+            list: Faltantes de cada cartilla, en el mismo orden
+        """
+        if patron is None:
+            return [None] * len(cartillas)
+        filas = getattr(cartillas, "filas", None)
+        if filas is None:
+            filas = np.fromiter((cartilla._fila for cartilla in cartillas), dtype=np.intp, count=len(cartillas))
+        return self.faltantes_patron(patron, filas).tolist()
+
+    def cumplen_patron(self, patron, cartillas=None):
+        """
+        Evalúa un patrón para todas las cartillas a la vez
+
+        Args:
+            patron (str): Patrón de Cartilla.verificar_patron
+            cartillas: Se ignora, siempre se evalúan todas las filas
+
+        Returns:
+            list: Vistas de las cartillas que cumplen el patrón
+        """
+        if patron.upper() not in PATRONES:
+            return []
+        filas = np.nonzero(self.faltantes_patron(patron) == 0)[0]
+        return [self.vistas[fila] for fila in filas]
+
+    def reiniciar(self):
+        """Elimina todas las cartillas del motor"""
+        self.numeros[:] = 0
+        self.marcados[:] = False
+        self.vistas = []
+        self.total = 0
@@ -0,0 +1,73 @@
+class ObservadorJuego:
+    """
+    Recibe los avisos del motor del juego. Esta clase base no hace nada, así que un
+    JuegoBingo sin observador es silencioso (servidores, simuladores, pruebas).
+    La interfaz de consola (main.py) hereda de aquí e imprime cada aviso.
+    """
+
+    def mensaje(self, texto):
+        """Aviso general (cargas, guardados, cambios manuales de ronda, errores de uso)"""
+
+    def progreso_carga(self, cartillas, bytes_leidos, bytes_totales):
+        """Avance de la lectura de un archivo grande de cartillas"""
+
+    def cartilla_agregada(self, codigo):
+        """Se agregó una cartilla"""
+
+    def cartilla_rechazada(self, codigo, motivo):
+        """No se pudo agregar una cartilla"""
+
+    def numero_ingresado(self, numero, afectadas, juego):
+        """
+        Se sorteó un número
+
+        Args:
+            numero (int): Número sorteado
+            afectadas (list): Cartillas que contienen el número
+            juego (JuegoBingo): Juego (para consultar los números sorteados)
+        """
+
+    def numero_repetido(self, numero):
+        """Se intentó ingresar un número ya sorteado"""
+
+    def numero_eliminado(self, numero, afectadas, juego):
+        """Se eliminó un número sorteado"""
+
+    def numero_no_sorteado(self, numero):
+        """Se intentó eliminar un número que no fue sorteado"""
+
+    def bingo(self, ganadores, juego):
+        """
+        Una o más cartillas completaron el patrón con la última bola
+
+        Args:
+            ganadores (list): Cartillas ganadoras nuevas
+            juego (JuegoBingo): Juego (patrón y números sorteados)
+        """
+
+    def premios_completados(self, completados, juego):
+        """
+        En modo de premios simultáneos, cartillas que completaron un patrón por primera vez
+
+        Args:
+            completados (list): Tuplas (codigo, patron)
+            juego (JuegoBingo): Juego (para consultar los números sorteados)
+        """
+
+    def continuar_siguiente_ronda(self, juego):
+        """
+        Decide si pasar a la siguiente ronda después de un BINGO
+
+        Returns:
+            bool: True para avanzar (por defecto se queda en la ronda actual)
+        """
+        return False
+
+    def juego_detenido(self):
+        """Se decidió no pasar a la siguiente ronda"""
+
+    def nueva_ronda(self, numero_ronda, patron):
+        """Empezó una nueva ronda"""
+
+    def sin_mas_rondas(self):
+        """Se intentó avanzar pero ya no quedan rondas"""
@@ -0,0 +1,54 @@
+from cartilla import BORDE_INFERIOR, BORDE_SUPERIOR
+
+# Filtros del panel
+FILTROS = ("todas", "ganadoras", "casi")
+
+
+class PanelCartillas:
+    """
+    Texto de las cartillas para el panel, con caché: cada cartilla mostrada guarda sus
+    cinco filas y las marcas con las que se dibujaron. Al volver a mostrarla solo se
+    redibujan las filas en las que cambió alguna marca.
+    """
+
+    def __init__(self, limite_cache=10000):
+        """
+        Args:
+            limite_cache (int): Cartillas recordadas (se olvidan primero las más antiguas)
+        """
+        self.limite_cache = limite_cache
+        # codigo -> [cartilla, marcas dibujadas, filas de texto]
+        self._cache = {}
+
+    def texto_cartilla(self, cartilla):
+        """
+        Mismo texto que str(cartilla), reutilizando las filas que no cambiaron
+
+        Args:
+            cartilla (Cartilla): Cartilla a mostrar
+
+        Returns:
+            str: Recuadro de la cartilla
+        """
+        marcas = cartilla.obtener_mascara()
+        entrada = self._cache.get(cartilla.codigo)
+        if entrada is None or entrada[0] is not cartilla:
+            # Primera vez (o la cartilla se reemplazó con el mismo código)
+            numeros = cartilla.numeros
+            entrada = [cartilla, marcas, [cartilla.texto_fila(i, marcas, numeros) for i in range(5)]]
+            if len(self._cache) >= self.limite_cache:
+                del self._cache[next(iter(self._cache))]
+            self._cache[cartilla.codigo] = entrada
+        elif entrada[1] != marcas:
+            cambios = entrada[1] ^ marcas
+            numeros = cartilla.numeros
+            filas = entrada[2]
+            for i in range(5):
+                if cambios >> (i * 5) & 0x1F:
+                    filas[i] = cartilla.texto_fila(i, marcas, numeros)
+            entrada[1] = marcas
+        return "\n".join((f"\n╔ Cartilla {cartilla.codigo} ╗", BORDE_SUPERIOR, *entrada[2], BORDE_INFERIOR))
+
+    def reiniciar(self):
+        """Olvida todas las cartillas dibujadas"""
+        self._cache = {}
@@ -0,0 +1,165 @@
+# Registro de patrones de ganancia compilados a máscaras de bits.
+# La celda (fila i, columna j) de una cartilla corresponde al bit i*5 + j.
+# Cada patrón es una tupla de máscaras alternativas: se cumple cuando
+# alguna de ellas está completamente marcada. Los patrones propios se
+# declaran en un archivo JSON y pasan por el mismo registro.
+
+import json
+import os
+
+
+def _celda(i, j):
+    """Bit de la celda (i, j)"""
+    return 1 << (i*5 + j)
+
+
+def _fila(i):
+    """Máscara de una fila completa"""
+    return sum(_celda(i, j) for j in range(5))
+
+
+def _columna(j):
+    """Máscara de una columna completa"""
+    return sum(_celda(i, j) for i in range(5))
+
+
+CENTRO = _celda(2, 2)
+TODAS = (1 << 25) - 1
+DIAGONAL_PRINCIPAL = sum(_celda(i, i) for i in range(5))
+DIAGONAL_SECUNDARIA = sum(_celda(i, 4-i) for i in range(5))
+
+# patron -> tupla de máscaras alternativas
+PATRONES = {}
+# patron -> (por cada celda) alternativas que dependen de ella
+CELDAS_PATRONES = {}
+# patron -> descripción para mostrar al operador
+DESCRIPCIONES = {}
+
+
+def _celdas_por_alternativa(alternativas):
+    """Para cada una de las 25 celdas, índices de las alternativas que la incluyen"""
+    return tuple(
+        tuple(k for k, mascara in enumerate(alternativas) if mascara >> posicion & 1)
+        for posicion in range(25)
+    )
+
+
+def compilar_alternativa(alternativa):
+    """
+    Convierte la declaración de una alternativa en su máscara de bits
+
+    Args:
+        alternativa: Máscara entera, 5 filas de texto ("X...X", marcada = cualquier
+            carácter distinto de '.', '-', '0' o espacio) o lista de celdas [fila, columna]
+
+    Returns:
+        int: Máscara de 25 bits
+    """
+    if isinstance(alternativa, int) and not isinstance(alternativa, bool):
+        mascara = alternativa
+    elif len(alternativa) == 5 and all(isinstance(fila, str) for fila in alternativa):
+        mascara = 0
+        for i, fila in enumerate(alternativa):
+            if len(fila) != 5:
+                raise ValueError(f"Cada fila debe tener 5 caracteres: '{fila}'")
+            for j, caracter in enumerate(fila):
+                if caracter not in ".-0 ":
+                    mascara |= _celda(i, j)
+    else:
+        mascara = 0
+        for celda in alternativa:
+            i, j = celda
+            if not (0 <= i < 5 and 0 <= j < 5):
+                raise ValueError(f"Celda fuera de la cartilla: {celda}")
+            mascara |= _celda(i, j)
+    if not 0 < mascara <= TODAS:
+        raise ValueError("Una alternativa debe marcar al menos una celda de la cartilla")
+    return mascara
+
+
+def registrar_patron(nombre, alternativas, descripcion=""):
+    """
+    Compila y registra un patrón
+
+    Args:
+        nombre (str): Nombre del patrón (se guarda en mayúsculas)
+        alternativas (list): Declaraciones aceptadas por compilar_alternativa
+        descripcion (str): Texto para el operador
+
+    Returns:
+        str: Nombre registrado
+    """
+    nombre = str(nombre).upper()
+    mascaras = tuple(dict.fromkeys(compilar_alternativa(alternativa) for alternativa in alternativas))
+    if not mascaras:
+        raise ValueError(f"El patrón '{nombre}' no tiene alternativas")
+    if nombre in PATRONES:
+        # Volver a cargar la misma declaración no es un error; redefinir un patrón sí
+        if PATRONES[nombre] != mascaras:
+            raise ValueError(f"El patrón '{nombre}' ya existe con otras celdas")
+        return nombre
+    PATRONES[nombre] = mascaras
+    CELDAS_PATRONES[nombre] = _celdas_por_alternativa(mascaras)
+    DESCRIPCIONES[nombre] = descripcion
+    return nombre
+
+
+def cargar_patrones(archivo="patrones.json"):
+    """
+    Registra los patrones propios de un archivo JSON con el formato
+    {"NOMBRE": {"descripcion": "...", "alternativas": [["X...X", ".....", ...], ...]}}
+    (también se acepta "NOMBRE": [alternativas] sin descripción)
+
+    Args:
+        archivo (str): Archivo de patrones
+
+    Returns:
+        list: Nombres registrados (vacía si el archivo no existe)
+    """
+    if not os.path.exists(archivo):
+        return []
+    with open(archivo, 'r', encoding='utf-8') as f:
+        declaraciones = json.load(f)
+    registrados = []
+    for nombre, declaracion in declaraciones.items():
+        if isinstance(declaracion, dict):
+            registrados.append(registrar_patron(nombre, declaracion.get("alternativas", []),
+                                                declaracion.get("descripcion", "")))
+        else:
+            registrados.append(registrar_patron(nombre, declaracion))
+    return registrados
+
+
+# Patrones de fábrica (en el orden en que se muestran al operador)
+registrar_patron('U', [_columna(0) | _fila(4) | _columna(4)], "U (columna izq + fila inferior + columna der)")
+registrar_patron('T', [_fila(0) | _columna(2)], "T (fila superior + columna central)")
+registrar_patron('E', [_columna(0) | _fila(0) | _fila(2) | _fila(4)], "E (columna izq + 3 líneas horizontales)")
+registrar_patron('C', [_columna(0) | _fila(0) | _fila(4)], "C (columna izq + fila superior + inferior)")
+registrar_patron('L', [_fila(4) | _columna(4)], "L (última fila + última columna)")
+registrar_patron('Z', [_fila(0) | _fila(4) | DIAGONAL_SECUNDARIA], "Z (primera fila + última fila + diagonal)")
+registrar_patron('B', [_columna(0) | _fila(2) | _columna(4)], "B (primera columna + línea media)")
+registrar_patron('X', [DIAGONAL_PRINCIPAL | DIAGONAL_SECUNDARIA], "X (ambas diagonales)")
+registrar_patron('LINEA', [_fila(i) for i in range(5)], "Fila completa")
+registrar_patron('COLUMNA', [_columna(j) for j in range(5)], "Columna completa")
+registrar_patron('DIAGONAL', [DIAGONAL_PRINCIPAL, DIAGONAL_SECUNDARIA], "Una diagonal")
+registrar_patron('APAGON', [TODAS], "Cartilla completamente llena")
+
+
+def mascara_desde_matriz(marcados):
+    """Convierte una matriz 5x5 de booleanos en un entero de 25 bits"""
+    mascara = 0
+    for i in range(5):
+        for j in range(5):
+            if marcados[i][j]:
+                mascara |= _celda(i, j)
+    return mascara
+
+
+def matriz_desde_mascara(mascara):
+    """Convierte un entero de 25 bits en una matriz 5x5 de booleanos"""
+    return [[bool(mascara >> (i*5 + j) & 1) for j in range(5)] for i in range(5)]
+
+
+def contar_bits(mascara):
+    """Cantidad de bits en 1 de una máscara"""
+    return bin(mascara).count('1')
@@ -0,0 +1,181 @@
+from gestor_rondas import GestorRondas
+from patrones import PATRONES, CENTRO, contar_bits
+
+
+class PremiosSimultaneos:
+    """
+    Evalúa varios patrones a la vez sobre un mismo sorteo (formato de "premios simultáneos").
+    Las alternativas de todos los patrones se juntan en una sola lista de contadores por
+    cartilla y cada celda sabe qué contadores la incluyen, así que una bola recorre una
+    sola vez las celdas que toca. Se anota la primera bola con la que cada cartilla
+    completa cada patrón.
+    """
+
+    def __init__(self, patrones=None):
+        """
+        Args:
+            patrones (list): Patrones a evaluar (por defecto los de las rondas: U, T, E, C, APAGON)
+        """
+        self.patrones = [p.upper() for p in (patrones or GestorRondas().patrones_orden)]
+        for patron in self.patrones:
+            if patron not in PATRONES:
+                raise ValueError(f"Patrón no válido: '{patron}'")
+        # Alternativas de todos los patrones en una sola lista, con el patrón de cada una
+        self._mascaras = []
+        self._patron_de = []
+        for indice, patron in enumerate(self.patrones):
+            for mascara in PATRONES[patron]:
+                self._mascaras.append(mascara)
+                self._patron_de.append(indice)
+        # Por cada celda, contadores (alternativas) que dependen de ella
+        self._celdas = tuple(
+            tuple(k for k, mascara in enumerate(self._mascaras) if mascara >> posicion & 1)
+            for posicion in range(25)
+        )
+        self.numeros_sorteados = []
+        self._sorteados = set()
+        # codigo -> [numeros, marcas, contadores, primeras bolas por patrón]
+        self._cartillas = {}
+        # numero -> lista de (codigo, estado de la cartilla, posición)
+        self._posiciones = {}
+
+    def _estado_inicial(self, numeros):
+        """Estado de una cartilla sin más marcas que el centro"""
+        libres = ~CENTRO
+        return [numeros, CENTRO,
+                [contar_bits(mascara & libres) for mascara in self._mascaras],
+                [None] * len(self.patrones)]
+
+    def agregar_cartilla(self, codigo, numeros):
+        """
+        Agrega una cartilla aplicándole los números ya sorteados
+
+        Args:
+            codigo (str): Identificador de la cartilla
+            numeros (list): 25 números en orden fila por fila (o matriz 5x5)
+        """
+        if numeros and isinstance(numeros[0], list):
+            numeros = [n for fila in numeros for n in fila]
+        if codigo in self._cartillas:
+            self.quitar_cartilla(codigo)
+        estado = self._estado_inicial(list(numeros))
+        self._cartillas[codigo] = estado
+        for posicion, numero in enumerate(estado[0]):
+            if posicion != 12:
+                self._posiciones.setdefault(numero, []).append((codigo, estado, posicion))
+        self._verificar_completos(codigo, estado, 0, [])
+        # Las bolas anteriores cuentan con su número de orden
+        bolas = {numero: bola for bola, numero in enumerate(self.numeros_sorteados, 1)}
+        for bola, posicion in sorted((bolas[numero], posicion) for posicion, numero in enumerate(estado[0])
+                                     if numero in bolas and posicion != 12):
+            self._marcar_celda(codigo, estado, posicion, bola, [])
+
+    def quitar_cartilla(self, codigo):
+        """Elimina una cartilla y sus resultados"""
+        estado = self._cartillas.pop(codigo, None)
+        if estado is None:
+            return
+        for numero in set(estado[0]):
+            entradas = [e for e in self._posiciones.get(numero, ()) if e[1] is not estado]
+            if entradas:
+                self._posiciones[numero] = entradas
+            else:
+                self._posiciones.pop(numero, None)
+
+    def _verificar_completos(self, codigo, estado, bola, completados):
+        """Anota los patrones que ya están completos (alternativas sin celdas, como el centro)"""
+        for k, faltan in enumerate(estado[2]):
+            indice = self._patron_de[k]
+            if faltan == 0 and estado[3][indice] is None:
+                estado[3][indice] = bola
+                completados.append((codigo, self.patrones[indice]))
+
+    def _marcar_celda(self, codigo, estado, posicion, bola, completados):
+        bit = 1 << posicion
+        if estado[1] & bit:
+            return
+        estado[1] |= bit
+        contadores = estado[2]
+        primeras = estado[3]
+        for k in self._celdas[posicion]:
+            contadores[k] -= 1
+            if contadores[k] == 0:
+                indice = self._patron_de[k]
+                if primeras[indice] is None:
+                    primeras[indice] = bola
+                    completados.append((codigo, self.patrones[indice]))
+
+    def marcar(self, numero):
+        """
+        Procesa una bola en todos los patrones a la vez
+
+        Args:
+            numero (int): Número sorteado
+
+        Returns:
+            list: Tuplas (codigo, patron) completadas por primera vez con esta bola
+        """
+        if numero in self._sorteados:
+            return []
+        self._sorteados.add(numero)
+        self.numeros_sorteados.append(numero)
+        bola = len(self.numeros_sorteados)
+        completados = []
+        for codigo, estado, posicion in self._posiciones.get(numero, ()):
+            self._marcar_celda(codigo, estado, posicion, bola, completados)
+        return completados
+
+    def eliminar_numero(self, numero):
+        """
+        Quita una bola sorteada por error y recalcula los resultados
+        (las bolas siguientes cambian de número de orden, así que se vuelve a jugar el sorteo)
+
+        Returns:
+            bool: True si el número estaba sorteado
+        """
+        if numero not in self._sorteados:
+            return False
+        numeros = [n for n in self.numeros_sorteados if n != numero]
+        self.reiniciar()
+        for n in numeros:
+            self.marcar(n)
+        return True
+
+    def reiniciar(self):
+        """Borra el sorteo y deja todas las cartillas solo con el centro marcado"""
+        self.numeros_sorteados = []
+        self._sorteados = set()
+        for codigo, estado in self._cartillas.items():
+            estado[1:] = self._estado_inicial(estado[0])[1:]
+            self._verificar_completos(codigo, estado, 0, [])
+
+    def primeras_bolas(self, codigo):
+        """
+        Bola con la que la cartilla completó cada patrón
+
+        Returns:
+            dict: patron -> número de bola (1 = primera), o None si aún no lo completa
+        """
+        return dict(zip(self.patrones, self._cartillas[codigo][3]))
+
+    def ganadores(self):
+        """
+        Ganadores de cada patrón: las cartillas que lo completaron antes que nadie
+
+        Returns:
+            dict: patron -> (bola, [codigos]), o None si nadie lo completó
+        """
+        resultado = {}
+        for indice, patron in enumerate(self.patrones):
+            mejor = None
+            codigos = []
+            for codigo, estado in self._cartillas.items():
+                bola = estado[3][indice]
+                if bola is None or (mejor is not None and bola > mejor):
+                    continue
+                if bola != mejor:
+                    mejor = bola
+                    codigos = []
+                codigos.append(codigo)
+            resultado[patron] = (mejor, codigos) if mejor is not None else None
+        return resultado
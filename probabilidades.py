@@ -0,0 +1,83 @@
+# Probabilidad exacta de que una cartilla complete un patrón en las próximas bolas.
+# Si quedan R bolas en el bombo y a una alternativa del patrón le faltan m números,
+# la probabilidad de que salgan todos en las próximas k bolas es hipergeométrica:
+# C(R-m, k-m) / C(R, k). Los patrones con varias alternativas (LINEA, COLUMNA,
+# DIAGONAL) se combinan por inclusión-exclusión sobre la unión de sus faltantes.
+
+from functools import lru_cache
+from itertools import combinations
+from math import comb
+
+from patrones import PATRONES
+
+TOTAL_BOLAS = 90
+
+
+@lru_cache(maxsize=None)
+def probabilidad_faltantes(faltantes, restantes, bolas):
+    """
+    Probabilidad de que `faltantes` números concretos salgan en las próximas `bolas` bolas
+
+    Args:
+        faltantes (int): Números que aún deben salir
+        restantes (int): Bolas que quedan en el bombo
+        bolas (int): Bolas que se van a sortear
+
+    Returns:
+        float: Probabilidad entre 0 y 1
+    """
+    bolas = min(bolas, restantes)
+    if faltantes > bolas:
+        return 0.0
+    return comb(restantes - faltantes, bolas - faltantes) / comb(restantes, bolas)
+
+
+def numeros_faltantes(cartilla, patron):
+    """
+    Números que le faltan a cada alternativa del patrón
+
+    Args:
+        cartilla (Cartilla): Cartilla a evaluar
+        patron (str): Patrón de Cartilla.verificar_patron
+
+    Returns:
+        list: Un frozenset de números por alternativa
+    """
+    numeros = cartilla.numeros
+    libres = ~cartilla.obtener_mascara()
+    return [frozenset(numeros[posicion] for posicion in range(25) if (mascara & libres) >> posicion & 1)
+            for mascara in PATRONES[patron.upper()]]
+
+
+def probabilidad_cartilla(cartilla, patron, restantes, bolas):
+    """
+    Probabilidad de que la cartilla complete el patrón en las próximas bolas
+
+    Args:
+        cartilla (Cartilla): Cartilla a evaluar
+        patron (str): Patrón de Cartilla.verificar_patron
+        restantes (int): Bolas que quedan en el bombo
+        bolas (int): Bolas que se van a sortear
+
+    Returns:
+        float: Probabilidad entre 0 y 1
+    """
+    bolas = min(bolas, restantes)
+    # Las alternativas imposibles (faltan más números que bolas) no aportan a la unión
+    alternativas = {faltan for faltan in numeros_faltantes(cartilla, patron) if len(faltan) <= bolas}
+    if not alternativas:
+        return 0.0
+    if frozenset() in alternativas:
+        return 1.0
+    alternativas = list(alternativas)
+    if len(alternativas) == 1:
+        return probabilidad_faltantes(len(alternativas[0]), restantes, bolas)
+
+    # P(A1 ∪ ... ∪ An) = Σ (-1)^(|S|+1) P(salen todos los faltantes de las alternativas de S)
+    probabilidad = 0.0
+    for tamaño in range(1, len(alternativas) + 1):
+        signo = 1 if tamaño % 2 else -1
+        for grupo in combinations(alternativas, tamaño):
+            union = len(frozenset().union(*grupo))
+            probabilidad += signo * probabilidad_faltantes(union, restantes, bolas)
+    return min(1.0, max(0.0, probabilidad))
@@ -0,0 +1,99 @@
+class RankingCercania:
+    """Cola por cubetas: agrupa las cartillas según cuántas celdas les faltan para el patrón"""
+
+    def __init__(self, max_faltantes=25):
+        # cubetas[d] es un conjunto ordenado (dict sin valores) de códigos a los que les faltan d celdas
+        self.cubetas = [{} for _ in range(max_faltantes + 1)]
+        self.faltantes = {}
+        # Cartillas reiniciadas que aún no se tocaron en la ronda: están a `inicial` celdas
+        # sin figurar en las cubetas (así reiniciar no recorre todas las cartillas)
+        self.sin_tocar = None
+        self.inicial = None
+
+    def actualizar(self, codigo, faltantes):
+        """
+        Mueve una cartilla a la cubeta de su nueva distancia (O(1))
+
+        Args:
+            codigo (str): Código de la cartilla
+            faltantes (int): Celdas que le faltan (None para sacarla del ranking)
+        """
+        anterior = self.faltantes.get(codigo)
+        if anterior == faltantes:
+            return
+        if anterior is not None:
+            del self.cubetas[anterior][codigo]
+        if faltantes is None:
+            del self.faltantes[codigo]
+            return
+        self.cubetas[faltantes][codigo] = None
+        self.faltantes[codigo] = faltantes
+
+    def distancia(self, codigo):
+        """
+        Celdas que le faltan a una cartilla según el ranking
+
+        Args:
+            codigo (str): Código de la cartilla
+
+        Returns:
+            int: Distancia anotada (o la inicial si no se tocó en la ronda); None si no figura
+        """
+        faltantes = self.faltantes.get(codigo)
+        if faltantes is None and self.sin_tocar is not None and codigo in self.sin_tocar:
+            return self.inicial
+        return faltantes
+
+    def quitar(self, codigo):
+        """Saca una cartilla del ranking"""
+        if codigo in self.faltantes:
+            self.actualizar(codigo, None)
+
+    def mejores(self, cantidad=10, max_faltantes=2, min_faltantes=1):
+        """
+        Obtiene las cartillas más cercanas a completar el patrón
+
+        Args:
+            cantidad (int): Máximo de cartillas a devolver
+            max_faltantes (int): Distancia máxima a considerar
+            min_faltantes (int): Distancia mínima (1 excluye a las que ya completaron)
+
+        Returns:
+            list: Tuplas (codigo, faltantes) de menor a mayor distancia
+        """
+        resultado = []
+        for distancia in range(min_faltantes, min(max_faltantes, len(self.cubetas) - 1) + 1):
+            for codigo in self.cubetas[distancia]:
+                if len(resultado) >= cantidad:
+                    return resultado
+                resultado.append((codigo, distancia))
+            if distancia == self.inicial and self.sin_tocar is not None:
+                for codigo in self.sin_tocar:
+                    if codigo in self.faltantes:
+                        continue
+                    if len(resultado) >= cantidad:
+                        return resultado
+                    resultado.append((codigo, distancia))
+        return resultado
+
+    def contar(self, faltantes):
+        """Cantidad de cartillas a las que les faltan exactamente esas celdas"""
+        cantidad = len(self.cubetas[faltantes])
+        if faltantes == self.inicial and self.sin_tocar is not None:
+            # Toda cartilla con distancia anotada también está en sin_tocar
+            cantidad += len(self.sin_tocar) - len(self.faltantes)
+        return cantidad
+
+    def reiniciar(self, inicial=None, sin_tocar=None):
+        """
+        Vacía el ranking
+
+        Args:
+            inicial (int): Distancia de las cartillas recién reiniciadas
+            sin_tocar: Códigos de todas las cartillas (por ejemplo el dict del juego), que
+                quedan a `inicial` celdas hasta que se anote otra distancia
+        """
+        self.cubetas = [{} for _ in self.cubetas]
+        self.faltantes = {}
+        self.inicial = inicial
+        self.sin_tocar = sin_tocar if inicial is not None else None
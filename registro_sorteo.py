@@ -0,0 +1,65 @@
+class RegistroSorteo:
+    """
+    Números sorteados de la ronda: un conjunto de bits (bit n = número n sorteado) para
+    saber en O(1) si un número salió y listarlos ordenados sin ordenar, más el orden de
+    salida como conjunto ordenado (dict sin valores) para poder quitar cualquiera en O(1).
+    Se recorre, se mide y se compara con `in` igual que la lista que reemplaza.
+    """
+
+    def __init__(self, numeros=()):
+        """
+        Args:
+            numeros (iterable): Números ya sorteados, en orden de salida
+        """
+        self.mascara = 0
+        self._orden = {}
+        for numero in numeros:
+            self.append(numero)
+
+    def append(self, numero):
+        """Anota un número sorteado (los repetidos se ignoran)"""
+        if numero < 0:
+            raise ValueError(f"Número no válido: {numero}")
+        if not self.mascara >> numero & 1:
+            self.mascara |= 1 << numero
+            self._orden[numero] = None
+
+    def remove(self, numero):
+        """Quita un número sorteado (ValueError si no había salido, como list.remove)"""
+        if numero not in self:
+            raise ValueError(f"El número {numero} no fue sorteado")
+        self.mascara &= ~(1 << numero)
+        del self._orden[numero]
+
+    def clear(self):
+        """Vacía el registro"""
+        self.mascara = 0
+        self._orden = {}
+
+    def ordenados(self):
+        """
+        Returns:
+            list: Números sorteados de menor a mayor (recorriendo los bits, sin sorted)
+        """
+        numeros = []
+        mascara = self.mascara
+        while mascara:
+            bit = mascara & -mascara
+            numeros.append(bit.bit_length() - 1)
+            mascara ^= bit
+        return numeros
+
+    def __contains__(self, numero):
+        return isinstance(numero, int) and numero >= 0 and bool(self.mascara >> numero & 1)
+
+    def __iter__(self):
+        return iter(self._orden)
+
+    def __len__(self):
+        return len(self._orden)
+
+    def __getitem__(self, indice):
+        return list(self._orden)[indice]
+
+    def __repr__(self):
+        return repr(list(self._orden))
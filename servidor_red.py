@@ -0,0 +1,203 @@
+import asyncio
+import json
+import sys
+
+from juego_bingo import JuegoBingo
+from observador_juego import ObservadorJuego
+
+
+class ObservadorRed(ObservadorJuego):
+    """Junta los avisos de cada bola para que el servidor los envíe en un solo paquete"""
+
+    def __init__(self, avanzar_rondas=True):
+        self.avanzar_rondas = avanzar_rondas
+        self.pendientes = []
+
+    def numero_ingresado(self, numero, afectadas, juego):
+        self.pendientes.append({
+            "tipo": "numero",
+            "numero": numero,
+            "afectadas": len(afectadas),
+            "sorteados": len(juego.numeros_sorteados),
+        })
+
+    def numero_eliminado(self, numero, afectadas, juego):
+        self.pendientes.append({"tipo": "eliminado", "numero": numero, "afectadas": len(afectadas)})
+
+    def bingo(self, ganadores, juego):
+        self.pendientes.append({
+            "tipo": "bingo",
+            "ganadores": [cartilla.codigo for cartilla in ganadores],
+            "patron": juego.patron_actual,
+            "ronda": juego.obtener_numero_ronda(),
+            "numeros": list(juego.numeros_sorteados),
+        })
+
+    def continuar_siguiente_ronda(self, juego):
+        return self.avanzar_rondas
+
+    def nueva_ronda(self, numero_ronda, patron):
+        self.pendientes.append({"tipo": "ronda", "ronda": numero_ronda, "patron": patron})
+
+    def sin_mas_rondas(self):
+        self.pendientes.append({"tipo": "fin"})
+
+    def tomar_pendientes(self):
+        """Devuelve y vacía los avisos acumulados"""
+        pendientes, self.pendientes = self.pendientes, []
+        return pendientes
+
+
+class ServidorBingo:
+    """
+    Servidor TCP (asyncio) de un juego de bingo. Protocolo de líneas JSON:
+    los clientes conectados reciben cada bola, los BINGO y los cambios de ronda;
+    quien conoce la clave de control puede enviar {"orden": "numero", "numero": 17, "clave": "..."}.
+    Los avisos de una bola se convierten a bytes una sola vez y el mismo paquete se
+    escribe en todos los sockets, sin esperar a cada cliente.
+    """
+
+    def __init__(self, juego=None, clave=None, avanzar_rondas=True, limite_buffer=1 << 20):
+        """
+        Args:
+            juego (JuegoBingo): Juego a publicar (por defecto uno nuevo con cartillas.json)
+            clave (str): Clave requerida para sortear y eliminar números (None = cualquiera)
+            avanzar_rondas (bool): Pasar de ronda automáticamente tras un BINGO
+            limite_buffer (int): Bytes sin enviar a partir de los que se desconecta a un cliente lento
+        """
+        self.observador = ObservadorRed(avanzar_rondas)
+        self.juego = juego or JuegoBingo()
+        self.juego.observador = self.observador
+        self.clave = clave
+        self.limite_buffer = limite_buffer
+        self.clientes = set()
+        self._tareas = set()
+        self._servidor = None
+
+    # ---------- Difusión ----------
+
+    def _difundir(self, mensajes):
+        """Serializa los mensajes una vez y los escribe en todos los clientes"""
+        if not mensajes or not self.clientes:
+            return
+        paquete = "".join(json.dumps(m, ensure_ascii=False) + "\n" for m in mensajes).encode('utf-8')
+        for cliente in list(self.clientes):
+            if cliente.is_closing() or cliente.transport.get_write_buffer_size() > self.limite_buffer:
+                # Cliente caído o que no lee: se descarta en lugar de frenar a los demás
+                self.clientes.discard(cliente)
+                cliente.close()
+                continue
+            cliente.write(paquete)
+
+    def sortear(self, numero):
+        """
+        Ingresa un número y avisa a todos los clientes
+
+        Returns:
+            dict: Resultado de JuegoBingo.ingresar_numeros para el número
+        """
+        resultado = self.juego.ingresar_numeros([numero])[0]
+        self._difundir(self.observador.tomar_pendientes())
+        return resultado
+
+    def eliminar(self, numero):
+        """Elimina un número sorteado y avisa a todos los clientes"""
+        eliminado = self.juego.eliminar_numero(numero)
+        self._difundir(self.observador.tomar_pendientes())
+        return eliminado
+
+    def estado(self):
+        """Estado del juego que se envía a un cliente al conectarse o al pedirlo"""
+        return {
+            "tipo": "estado",
+            "ronda": self.juego.obtener_numero_ronda(),
+            "patron": self.juego.patron_actual,
+            "numeros": list(self.juego.numeros_sorteados),
+            "ganadores": list(self.juego.cartillas_ganadoras),
+        }
+
+    # ---------- Conexiones ----------
+
+    def _responder(self, escritor, mensaje):
+        escritor.write((json.dumps(mensaje, ensure_ascii=False) + "\n").encode('utf-8'))
+
+    def _atender(self, pedido):
+        """Ejecuta la orden de un cliente y devuelve la respuesta para él"""
+        orden = pedido.get("orden")
+        if orden == "estado":
+            return self.estado()
+        if orden in ("numero", "eliminar"):
+            if self.clave is not None and pedido.get("clave") != self.clave:
+                return {"tipo": "error", "detalle": "Clave de control incorrecta"}
+            numero = pedido.get("numero")
+            # bool es subclase de int: un JSON true no debe sortear la bola 1
+            if type(numero) is not int or not 1 <= numero <= 90:
+                return {"tipo": "error", "detalle": "El número debe estar entre 1 y 90"}
+            if orden == "numero":
+                resultado = self.sortear(numero)
+                return {"tipo": "respuesta", "repetido": resultado["repetido"],
+                        "ganadores": resultado["ganadores"]}
+            return {"tipo": "respuesta", "eliminado": self.eliminar(numero)}
+        return {"tipo": "error", "detalle": f"Orden desconocida: {orden}"}
+
+    async def _cliente(self, lector, escritor):
+        """Atiende a un cliente: le envía el estado y procesa sus órdenes hasta que se desconecta"""
+        self.clientes.add(escritor)
+        self._tareas.add(asyncio.current_task())
+        self._responder(escritor, self.estado())
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                try:
+                    pedido = json.loads(linea)
+                except ValueError:
+                    respuesta = {"tipo": "error", "detalle": "JSON inválido"}
+                else:
+                    respuesta = self._atender(pedido) if isinstance(pedido, dict) else \
+                        {"tipo": "error", "detalle": "Se esperaba un objeto JSON"}
+                self._responder(escritor, respuesta)
+                await escritor.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass  # Cliente desconectado o servidor detenido
+        finally:
+            self._tareas.discard(asyncio.current_task())
+            self.clientes.discard(escritor)
+            escritor.close()
+
+    async def iniciar(self, host="127.0.0.1", puerto=8765):
+        """Empieza a aceptar conexiones"""
+        self._servidor = await asyncio.start_server(self._cliente, host, puerto)
+        return self._servidor
+
+    async def servir(self, host="127.0.0.1", puerto=8765):
+        """Atiende conexiones hasta que se cancele"""
+        servidor = await self.iniciar(host, puerto)
+        async with servidor:
+            await servidor.serve_forever()
+
+    async def detener(self):
+        """Cierra el servidor y desconecta a los clientes"""
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+            self._servidor = None
+        tareas = list(self._tareas)
+        for tarea in tareas:
+            tarea.cancel()
+        await asyncio.gather(*tareas, return_exceptions=True)
+        for cliente in list(self.clientes):
+            cliente.close()
+        self.clientes.clear()
+
+
+if __name__ == "__main__":
+    # Uso: python servidor_red.py [puerto] [clave]
+    puerto = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    clave = sys.argv[2] if len(sys.argv) > 2 else None
+    print(f"🌐 Servidor de bingo en el puerto {puerto}")
+    try:
+        asyncio.run(ServidorBingo(clave=clave).servir(puerto=puerto))
+    except KeyboardInterrupt:
+        print("\n👋 Servidor detenido")
@@ -0,0 +1,288 @@
+import os
+import time
+from collections import deque
+from multiprocessing import Pipe, Process
+
+from juego_bingo import JuegoBingo
+
+
+# ---------- Lado del proceso trabajador ----------
+
+def _crear_sala(salas, sala, cartillas, motor):
+    juego = JuegoBingo(motor, cargar_cartillas=False)
+    rechazadas = [codigo for codigo, numeros in cartillas.items()
+                  if not juego.agregar_cartilla(codigo, numeros)]
+    salas[sala] = juego
+    return rechazadas
+
+
+def _sortear(salas, pedidos):
+    """
+    Sortea en varias salas del proceso; un error en una sala no afecta a las demás
+
+    Returns:
+        dict: sala -> (True, (resultados, segundos de proceso)) o (False, descripción del error)
+    """
+    respuestas = {}
+    for sala, numeros, avanzar_rondas in pedidos:
+        inicio = time.perf_counter()
+        try:
+            resultados = salas[sala].ingresar_numeros(numeros, avanzar_rondas)
+        except Exception as e:
+            respuestas[sala] = (False, f"{type(e).__name__}: {e}")
+            continue
+        respuestas[sala] = (True, (resultados, time.perf_counter() - inicio))
+    return respuestas
+
+
+def _cambiar_ronda(salas, sala, numero_ronda):
+    return salas[sala].cambiar_ronda(numero_ronda)
+
+
+def _estado(salas, sala):
+    juego = salas[sala]
+    return {
+        "ronda": juego.obtener_numero_ronda(),
+        "patron": juego.patron_actual,
+        "cartillas": len(juego.cartillas),
+        "numeros_sorteados": list(juego.numeros_sorteados),
+        "cartillas_ganadoras": list(juego.cartillas_ganadoras),
+        "ganadores_por_ronda": {ronda: list(codigos)
+                                for ronda, codigos in juego.gestor_rondas.ganadores_por_ronda.items()},
+    }
+
+
+def _cerrar_sala(salas, sala):
+    del salas[sala]
+
+
+_ORDENES = {
+    "crear": _crear_sala,
+    "sortear": _sortear,
+    "ronda": _cambiar_ronda,
+    "estado": _estado,
+    "cerrar_sala": _cerrar_sala,
+}
+
+
+def _trabajador(conexion):
+    """Bucle de un proceso: atiende órdenes de una en una para sus salas"""
+    salas = {}
+    while True:
+        orden, *argumentos = conexion.recv()
+        if orden == "cerrar":
+            break
+        try:
+            conexion.send((True, _ORDENES[orden](salas, *argumentos)))
+        except Exception as e:
+            conexion.send((False, f"{type(e).__name__}: {e}"))
+    conexion.close()
+
+
+# ---------- Lado del controlador ----------
+
+class ServidorSalas:
+    """
+    Aloja muchas salas de bingo independientes (cada una es un JuegoBingo silencioso
+    con sus cartillas y sus rondas) repartidas entre procesos trabajadores.
+    El controlador envía las bolas a una o varias salas y recibe los ganadores;
+    la comunicación es por tuberías locales, sin servicios externos.
+    """
+
+    def __init__(self, procesos=None, historial_latencias=1000):
+        """
+        Args:
+            procesos (int): Procesos trabajadores (None = uno por núcleo)
+            historial_latencias (int): Mediciones guardadas por sala para las métricas
+        """
+        self.procesos = procesos or os.cpu_count() or 1
+        self._conexiones = []
+        self._trabajadores = []
+        for _ in range(self.procesos):
+            controlador, trabajador = Pipe()
+            proceso = Process(target=_trabajador, args=(trabajador,), daemon=True)
+            proceso.start()
+            trabajador.close()
+            self._conexiones.append(controlador)
+            self._trabajadores.append(proceso)
+        self.salas = {}  # sala -> índice del proceso que la aloja
+        self._historial_latencias = historial_latencias
+        self._latencias = {}
+        self._tiempos_proceso = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.cerrar()
+
+    def _pedir(self, indice, *mensaje):
+        """Envía una orden a un proceso y espera su respuesta"""
+        conexion = self._conexiones[indice]
+        conexion.send(mensaje)
+        return self._respuesta(conexion)
+
+    @staticmethod
+    def _respuesta(conexion):
+        exito, valor = conexion.recv()
+        if not exito:
+            raise RuntimeError(valor)
+        return valor
+
+    def _proceso_de(self, sala):
+        if sala not in self.salas:
+            raise KeyError(f"La sala '{sala}' no existe")
+        return self.salas[sala]
+
+    def crear_sala(self, sala, cartillas, motor="python"):
+        """
+        Crea una sala en el proceso con menos salas
+
+        Args:
+            sala (str): Nombre de la sala
+            cartillas (dict): codigo -> lista de 25 números
+            motor (str): Motor de JuegoBingo de la sala
+
+        Returns:
+            list: Códigos de las cartillas rechazadas
+        """
+        if sala in self.salas:
+            raise ValueError(f"La sala '{sala}' ya existe")
+        cargas = [0] * self.procesos
+        for indice in self.salas.values():
+            cargas[indice] += 1
+        indice = cargas.index(min(cargas))
+        rechazadas = self._pedir(indice, "crear", sala, dict(cartillas), motor)
+        self.salas[sala] = indice
+        self._latencias[sala] = deque(maxlen=self._historial_latencias)
+        self._tiempos_proceso[sala] = deque(maxlen=self._historial_latencias)
+        return rechazadas
+
+    def cerrar_sala(self, sala):
+        """Elimina una sala y sus métricas"""
+        self._pedir(self._proceso_de(sala), "cerrar_sala", sala)
+        del self.salas[sala]
+        del self._latencias[sala]
+        del self._tiempos_proceso[sala]
+
+    def sortear(self, sala, numeros, avanzar_rondas=True):
+        """
+        Envía bolas a una sala
+
+        Args:
+            sala (str): Nombre de la sala
+            numeros (iterable): Números sorteados en orden
+            avanzar_rondas (bool): Pasar de ronda automáticamente tras un BINGO
+
+        Returns:
+            list: Resultados de JuegoBingo.ingresar_numeros
+
+        Raises:
+            RuntimeError: Si el sorteo falló en la sala
+        """
+        resultados, errores = self.sortear_en_salas({sala: numeros}, avanzar_rondas)
+        if sala in errores:
+            raise RuntimeError(errores[sala])
+        return resultados[sala]
+
+    def sortear_en_salas(self, sorteos, avanzar_rondas=True):
+        """
+        Envía bolas a varias salas a la vez: cada proceso recibe un solo mensaje con
+        todas sus salas y los procesos trabajan en paralelo. Cada sala responde por su
+        cuenta: si una falla, las demás igual devuelven sus resultados
+
+        Args:
+            sorteos (dict): sala -> números sorteados en orden
+            avanzar_rondas (bool): Pasar de ronda automáticamente tras un BINGO
+
+        Returns:
+            tuple: (resultados, errores) con sala -> resultados de JuegoBingo.ingresar_numeros
+                y sala -> descripción del error de las salas que fallaron
+        """
+        pedidos = {}
+        for sala, numeros in sorteos.items():
+            pedidos.setdefault(self._proceso_de(sala), []).append((sala, list(numeros), avanzar_rondas))
+
+        inicio = time.perf_counter()
+        for indice, pedidos_proceso in pedidos.items():
+            self._conexiones[indice].send(("sortear", pedidos_proceso))
+
+        resultados = {}
+        errores = {}
+        for indice, pedidos_proceso in pedidos.items():
+            try:
+                respuestas = self._respuesta(self._conexiones[indice])
+            except RuntimeError as e:
+                # Falló el pedido completo del proceso: todas sus salas quedan con ese error
+                for sala, _, _ in pedidos_proceso:
+                    errores[sala] = str(e)
+                continue
+            latencia = time.perf_counter() - inicio
+            for sala, (exito, valor) in respuestas.items():
+                if not exito:
+                    errores[sala] = valor
+                    continue
+                resultados_sala, segundos = valor
+                resultados[sala] = resultados_sala
+                self._latencias[sala].append(latencia)
+                self._tiempos_proceso[sala].append(segundos)
+        return resultados, errores
+
+    def cambiar_ronda(self, sala, numero_ronda):
+        """Cambia la ronda de una sala (1-5)"""
+        return self._pedir(self._proceso_de(sala), "ronda", sala, numero_ronda)
+
+    def estado(self, sala):
+        """
+        Estado de una sala
+
+        Returns:
+            dict: 'ronda', 'patron', 'cartillas', 'numeros_sorteados',
+                'cartillas_ganadoras' y 'ganadores_por_ronda'
+        """
+        return self._pedir(self._proceso_de(sala), "estado", sala)
+
+    def ganadores(self, sala):
+        """Cartillas ganadoras de la ronda actual de una sala"""
+        return self.estado(sala)["cartillas_ganadoras"]
+
+    def metricas(self, sala=None):
+        """
+        Latencias de los sorteos en milisegundos
+
+        Args:
+            sala (str): Sala a consultar (None = todas)
+
+        Returns:
+            dict: Métricas de la sala ('pedidos', 'media_ms', 'p50_ms', 'p95_ms',
+                'max_ms', 'proceso_ms'), o sala -> métricas si no se indica sala
+        """
+        if sala is None:
+            return {nombre: self.metricas(nombre) for nombre in self.salas}
+        self._proceso_de(sala)
+        latencias = sorted(self._latencias[sala])
+        if not latencias:
+            return {"pedidos": 0}
+        tiempos_proceso = self._tiempos_proceso[sala]
+        return {
+            "pedidos": len(latencias),
+            "media_ms": 1000 * sum(latencias) / len(latencias),
+            "p50_ms": 1000 * latencias[len(latencias) // 2],
+            "p95_ms": 1000 * latencias[min(len(latencias) - 1, int(len(latencias) * 0.95))],
+            "max_ms": 1000 * latencias[-1],
+            "proceso_ms": 1000 * sum(tiempos_proceso) / len(tiempos_proceso),
+        }
+
+    def cerrar(self):
+        """Detiene los procesos trabajadores"""
+        for conexion in self._conexiones:
+            try:
+                conexion.send(("cerrar",))
+                conexion.close()
+            except (BrokenPipeError, OSError):
+                pass
+        for proceso in self._trabajadores:
+            proceso.join(timeout=5)
+        self._conexiones = []
+        self._trabajadores = []
+        self.salas = {}
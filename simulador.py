@@ -0,0 +1,191 @@
+import random
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from gestor_json import GestorJSON
+from gestor_rondas import GestorRondas
+from huellas_cartillas import IndiceHuellas
+from juego_bingo import JuegoBingo
+
+# Juego de cada proceso trabajador (se arma una sola vez con las cartillas)
+_juego_trabajador = None
+
+
+def _iniciar_trabajador(cartillas, motor):
+    """Crea el juego silencioso del proceso con todas las cartillas (también las repetidas)"""
+    global _juego_trabajador
+    _juego_trabajador = JuegoBingo(motor, cargar_cartillas=False)
+    _juego_trabajador.agregar_cartillas(cartillas)
+
+
+def _simular_lote(patron, semilla, cantidad):
+    """
+    Simula `cantidad` sorteos completos en el juego del proceso
+
+    Returns:
+        tuple: (Counter bolas→veces, Counter ganadores simultáneos→veces, sorteos sin ganador)
+    """
+    juego = _juego_trabajador
+    if juego.patron_actual != patron:
+        juego.establecer_patron(patron)
+    generador = random.Random(semilla)
+    bolas = Counter()
+    simultaneos = Counter()
+    sin_ganador = 0
+    numeros = list(range(1, 91))
+
+    for _ in range(cantidad):
+        juego.reiniciar_sorteo()
+        generador.shuffle(numeros)
+        for numero in numeros:
+            ganadores = juego.ingresar_numeros([numero], avanzar_rondas=False)[0]["ganadores"]
+            if ganadores:
+                bolas[len(juego.numeros_sorteados)] += 1
+                simultaneos[len(ganadores)] += 1
+                break
+        else:
+            sin_ganador += 1
+    return bolas, simultaneos, sin_ganador
+
+
+class SimuladorBingo:
+    """
+    Simulación Monte Carlo de "bolas hasta el primer ganador" para un grupo de cartillas.
+    Cada lote de sorteos tiene su propia semilla derivada de la semilla general, así que
+    los resultados son reproducibles sin importar cuántos procesos se usen.
+    """
+
+    def __init__(self, cartillas, motor="python", tamaño_lote=1000):
+        """
+        Args:
+            cartillas (dict): codigo -> lista de 25 números
+            motor (str): Motor de JuegoBingo a usar en cada proceso
+            tamaño_lote (int): Sorteos por tarea enviada a un proceso
+        """
+        self.cartillas = list(cartillas.items())
+        self.motor = motor
+        self.tamaño_lote = tamaño_lote
+        # Las cartillas idénticas a otra se simulan igual (se reparten el premio) y se informan
+        huellas = IndiceHuellas()
+        self.repetidas = [codigo for codigo, numeros in self.cartillas
+                          if huellas.agregar(codigo, numeros) is not None]
+
+    @classmethod
+    def desde_json(cls, archivo="cartillas.json", **opciones):
+        """Crea el simulador leyendo las cartillas de un archivo JSON (en streaming)"""
+        cartillas = {codigo: [n for fila in datos["matriz"] for n in fila]
+                     for codigo, datos in GestorJSON(archivo, avisar=None).iterar_cartillas()}
+        return cls(cartillas, **opciones)
+
+    def _lotes(self, simulaciones, semilla):
+        """Divide las simulaciones en lotes con semilla propia (semilla, número de lote)"""
+        lotes = []
+        for indice, inicio in enumerate(range(0, simulaciones, self.tamaño_lote)):
+            cantidad = min(self.tamaño_lote, simulaciones - inicio)
+            lotes.append((semilla * 1000003 + indice, cantidad))
+        return lotes
+
+    def simular(self, patron, simulaciones=10000, semilla=0, procesos=None):
+        """
+        Simula muchos sorteos aleatorios para un patrón
+
+        Args:
+            patron (str): Patrón de Cartilla.verificar_patron
+            simulaciones (int): Cantidad de sorteos
+            semilla (int): Semilla general (mismo valor → mismos resultados)
+            procesos (int): Procesos a usar (1 = en este mismo proceso; None = todos los núcleos)
+
+        Returns:
+            dict: Estadísticas del patrón (ver _resumir)
+        """
+        return self.simular_patrones([patron], simulaciones, semilla, procesos)[patron.upper()]
+
+    def simular_patrones(self, patrones=None, simulaciones=10000, semilla=0, procesos=None):
+        """
+        Simula varios patrones (por defecto las rondas U → T → E → C → APAGON)
+
+        Returns:
+            dict: patron -> estadísticas
+        """
+        patrones = [p.upper() for p in (patrones or GestorRondas().patrones_orden)]
+        lotes = self._lotes(simulaciones, semilla)
+        resultados = {}
+
+        if procesos == 1:
+            _iniciar_trabajador(self.cartillas, self.motor)
+            for patron in patrones:
+                parciales = [_simular_lote(patron, s, c) for s, c in lotes]
+                resultados[patron] = self._resumir(parciales, simulaciones)
+            return resultados
+
+        with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_trabajador,
+                                 initargs=(self.cartillas, self.motor)) as ejecutor:
+            for patron in patrones:
+                futuros = [ejecutor.submit(_simular_lote, patron, s, c) for s, c in lotes]
+                resultados[patron] = self._resumir([f.result() for f in futuros], simulaciones)
+        return resultados
+
+    @staticmethod
+    def _resumir(parciales, simulaciones):
+        """
+        Combina los resultados de los lotes
+
+        Returns:
+            dict: 'simulaciones', 'sin_ganador', 'percentiles' (5, 25, 50, 75, 95 de bolas
+                hasta el primer ganador), 'media_bolas', 'ganadores_simultaneos' (esperado),
+                'distribucion_bolas' y 'distribucion_ganadores'
+        """
+        bolas = Counter()
+        simultaneos = Counter()
+        sin_ganador = 0
+        for lote_bolas, lote_simultaneos, lote_sin_ganador in parciales:
+            bolas.update(lote_bolas)
+            simultaneos.update(lote_simultaneos)
+            sin_ganador += lote_sin_ganador
+
+        con_ganador = simulaciones - sin_ganador
+        percentiles = {}
+        if con_ganador:
+            acumulado = 0
+            objetivos = [(p, p / 100 * con_ganador) for p in (5, 25, 50, 75, 95)]
+            for cantidad_bolas in sorted(bolas):
+                acumulado += bolas[cantidad_bolas]
+                while objetivos and acumulado >= objetivos[0][1]:
+                    percentiles[objetivos.pop(0)[0]] = cantidad_bolas
+
+        return {
+            "simulaciones": simulaciones,
+            "sin_ganador": sin_ganador,
+            "percentiles": percentiles,
+            "media_bolas": sum(b * v for b, v in bolas.items()) / con_ganador if con_ganador else None,
+            "ganadores_simultaneos": sum(g * v for g, v in simultaneos.items()) / con_ganador if con_ganador else None,
+            "distribucion_bolas": dict(sorted(bolas.items())),
+            "distribucion_ganadores": dict(sorted(simultaneos.items())),
+        }
+
+
+def mostrar_resultados(resultados):
+    """Muestra una tabla con las estadísticas por patrón"""
+    print("\n" + "="*80)
+    print("📈 SIMULACIÓN - BOLAS HASTA EL PRIMER GANADOR")
+    print("="*80)
+    print(f"{'Patrón':<8} {'P5':>4} {'P25':>4} {'P50':>4} {'P75':>4} {'P95':>4} {'Media':>7} {'Ganad.':>7} {'Sin gan.':>9}")
+    for patron, datos in resultados.items():
+        p = datos["percentiles"]
+        media = f"{datos['media_bolas']:.2f}" if datos["media_bolas"] is not None else "-"
+        ganadores = f"{datos['ganadores_simultaneos']:.2f}" if datos["ganadores_simultaneos"] is not None else "-"
+        columnas = " ".join(f"{p.get(k, '-'):>4}" for k in (5, 25, 50, 75, 95))
+        print(f"{patron:<8} {columnas} {media:>7} {ganadores:>7} {datos['sin_ganador']:>9}")
+
+
+if __name__ == "__main__":
+    # Uso: python simulador.py [cartillas.json] [simulaciones] [semilla] [procesos]
+    archivo = sys.argv[1] if len(sys.argv) > 1 else "cartillas.json"
+    simulaciones = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    semilla = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    procesos = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    simulador = SimuladorBingo.desde_json(archivo)
+    if simulador.repetidas:
+        print(f"⚠️  {len(simulador.repetidas)} cartillas idénticas a otra (se simulan igual: se reparten el premio)")
+    mostrar_resultados(simulador.simular_patrones(simulaciones=simulaciones, semilla=semilla, procesos=procesos))
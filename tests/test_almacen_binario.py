@@ -0,0 +1,45 @@
+import pytest
+
+from almacen_binario import AlmacenBinario
+from cartilla import Cartilla
+from juego_bingo import JuegoBingo
+from observador_juego import ObservadorJuego
+
+
+class _Avisos(ObservadorJuego):
+    def __init__(self):
+        self.mensajes = []
+
+    def mensaje(self, texto):
+        self.mensajes.append(texto)
+
+
+def _guardar(archivo, cantidad=3):
+    cartillas = [Cartilla(f"C{i}", [(i + n) % 90 + 1 for n in range(25)]) for i in range(cantidad)]
+    AlmacenBinario(str(archivo)).guardar(cartillas)
+    return archivo.read_bytes()
+
+
+@pytest.mark.parametrize("contenido", [b"", b"BN", b"XXXX" + bytes(40), "truncado"])
+def test_archivo_danado_se_informa_sin_cargar_nada(tmp_path, contenido):
+    archivo = tmp_path / "cartillas.bin"
+    if contenido == "truncado":
+        contenido = _guardar(archivo)[:-10]
+    archivo.write_bytes(contenido)
+    avisos = _Avisos()
+    juego = JuegoBingo(observador=avisos, cargar_cartillas=False)
+
+    juego.cargar_cartillas_desde_binario(str(archivo))
+
+    assert juego.cartillas == {}
+    assert avisos.mensajes and avisos.mensajes[-1].startswith("❌")
+
+
+def test_archivo_valido_se_carga(tmp_path):
+    archivo = tmp_path / "cartillas.bin"
+    _guardar(archivo)
+    juego = JuegoBingo(cargar_cartillas=False)
+
+    juego.cargar_cartillas_desde_binario(str(archivo))
+
+    assert sorted(juego.cartillas) == ["C0", "C1", "C2"]
@@ -0,0 +1,51 @@
+import random
+
+from generador_cartillas import GeneradorCartillas
+from juego_bingo import JuegoBingo
+from observador_juego import ObservadorJuego
+
+
+class ObservadorAnotador(ObservadorJuego):
+    """Anota cada aviso que recibe"""
+
+    def __init__(self):
+        self.avisos = []
+
+    def mensaje(self, texto):
+        self.avisos.append(("mensaje", texto))
+
+    def numero_ingresado(self, numero, afectadas, juego):
+        self.avisos.append(("numero", numero))
+
+    def bingo(self, ganadores, juego):
+        self.avisos.append(("bingo", len(ganadores)))
+
+    def premios_completados(self, completados, juego):
+        self.avisos.append(("premios", len(completados)))
+
+    def nueva_ronda(self, numero_ronda, patron):
+        self.avisos.append(("ronda", numero_ronda))
+
+
+def test_recuperar_diario_no_repite_los_avisos_de_la_partida(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    original = JuegoBingo(cargar_cartillas=False)
+    original.agregar_cartillas((codigo, list(numeros)) for codigo, numeros in GeneradorCartillas(5).generar(200))
+    original.activar_premios_simultaneos()
+    original.activar_diario("juego_diario.log")
+    resultados = original.ingresar_numeros(random.Random(5).sample(range(1, 91), 80), avanzar_rondas=True)
+    original.diario.cerrar()
+    assert any(resultado["ganadores"] for resultado in resultados)
+
+    observador = ObservadorAnotador()
+    recuperado = JuegoBingo(observador=observador, cargar_cartillas=False)
+    recuperado.activar_premios_simultaneos()
+    observador.avisos.clear()
+
+    assert recuperado.recuperar_diario("juego_diario.log")
+    assert [tipo for tipo, _ in observador.avisos] == ["mensaje"]
+    assert observador.avisos[0][1].startswith("✅ Juego recuperado")
+    assert list(recuperado.numeros_sorteados) == list(original.numeros_sorteados)
+    assert recuperado.obtener_numero_ronda() == original.obtener_numero_ronda()
+    assert list(recuperado.cartillas_ganadoras) == list(original.cartillas_ganadoras)
+    recuperado.desactivar_diario()
@@ -0,0 +1,33 @@
+import random
+
+import pytest
+
+from generador_cartillas import GeneradorCartillas
+from juego_bingo import JuegoBingo
+
+
+@pytest.fixture(scope="module")
+def juego():
+    juego = JuegoBingo(cargar_cartillas=False)
+    juego.agregar_cartillas((codigo, list(numeros)) for codigo, numeros in GeneradorCartillas(2).generar(3000))
+    juego.cambiar_ronda(2)
+    juego.ingresar_numeros(random.Random(4).sample(range(1, 91), 40), avanzar_rondas=False)
+    return juego
+
+
+def _esperado(juego, filtro, desde, hasta, max_faltantes):
+    """Todas las cartillas del filtro, recorriéndolas una por una"""
+    codigos = list(juego._codigos_panel(filtro, desde, hasta, max_faltantes))
+    return codigos
+
+
+@pytest.mark.parametrize("filtro", ["todas", "ganadoras", "casi"])
+@pytest.mark.parametrize("desde,hasta", [(None, None), ("G0500", None), ("G1000", "G1999")])
+@pytest.mark.parametrize("pagina", [1, 3, 1000])
+def test_pagina_y_total_coinciden_con_el_recorrido_completo(juego, filtro, desde, hasta, pagina):
+    esperado = _esperado(juego, filtro, desde, hasta, 3)
+
+    codigos, total = juego.pagina_panel(pagina, 20, filtro, desde, hasta, max_faltantes=3)
+
+    assert total == len(esperado)
+    assert codigos == esperado[(pagina - 1) * 20:pagina * 20]
@@ -0,0 +1,38 @@
+import asyncio
+import json
+
+from juego_bingo import JuegoBingo
+from servidor_red import ServidorBingo
+
+
+async def _conversar(servidor, pedidos):
+    """Conecta un cliente, envía los pedidos y devuelve la respuesta a cada uno"""
+    sockets = (await servidor.iniciar(puerto=0)).sockets
+    lector, escritor = await asyncio.open_connection(*sockets[0].getsockname()[:2])
+    respuestas = []
+    try:
+        json.loads(await lector.readline())  # Estado inicial
+        for pedido in pedidos:
+            escritor.write((json.dumps(pedido) + "\n").encode('utf-8'))
+            await escritor.drain()
+            while True:
+                mensaje = json.loads(await lector.readline())
+                if mensaje["tipo"] in ("respuesta", "error"):
+                    respuestas.append(mensaje)
+                    break
+    finally:
+        escritor.close()
+        await servidor.detener()
+    return respuestas
+
+
+def test_numero_booleano_se_rechaza():
+    servidor = ServidorBingo(JuegoBingo(cargar_cartillas=False))
+    pedidos = [{"orden": "numero", "numero": True}, {"orden": "eliminar", "numero": False},
+               {"orden": "numero", "numero": 1}]
+
+    respuestas = asyncio.run(_conversar(servidor, pedidos))
+
+    assert [r["tipo"] for r in respuestas] == ["error", "error", "respuesta"]
+    assert list(servidor.juego.numeros_sorteados) == [1]
+    assert type(list(servidor.juego.numeros_sorteados)[0]) is int
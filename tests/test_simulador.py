@@ -0,0 +1,43 @@
+from generador_cartillas import GeneradorCartillas
+from juego_bingo import JuegoBingo
+from simulador import SimuladorBingo
+
+
+def _pozo(cantidad, semilla=1):
+    return {codigo: list(numeros) for codigo, numeros in GeneradorCartillas(semilla).generar(cantidad)}
+
+
+def test_cartilla_repetida_se_simula_y_se_informa():
+    cartillas = _pozo(1)
+    (codigo, numeros), = cartillas.items()
+    cartillas["COPIA"] = list(numeros)
+
+    simulador = SimuladorBingo(cartillas)
+    resultado = simulador.simular("U", simulaciones=50, semilla=3, procesos=1)
+
+    assert simulador.repetidas == ["COPIA"]
+    # La copia gana siempre junto con la original: se reparten cada premio
+    assert resultado["ganadores_simultaneos"] == 2
+
+
+def test_repetidas_aumentan_los_ganadores_simultaneos():
+    cartillas = _pozo(200)
+    sin_copias = SimuladorBingo(cartillas).simular("U", simulaciones=200, semilla=5, procesos=1)
+    con_copias = dict(cartillas)
+    for codigo, numeros in list(cartillas.items()):
+        con_copias[codigo + "-COPIA"] = list(numeros)
+    duplicado = SimuladorBingo(con_copias).simular("U", simulaciones=200, semilla=5, procesos=1)
+
+    assert duplicado["ganadores_simultaneos"] == 2 * sin_copias["ganadores_simultaneos"]
+
+
+def test_agregar_cartillas_conserva_las_identicas():
+    juego = JuegoBingo(cargar_cartillas=False)
+    (codigo, numeros), = _pozo(1).items()
+
+    repetidas = juego.agregar_cartillas([(codigo, numeros), ("COPIA", numeros)])
+
+    assert repetidas == ["COPIA"]
+    assert set(juego.cartillas) == {codigo, "COPIA"}
+    # agregar_cartilla sigue rechazando una tercera copia
+    assert not juego.agregar_cartilla("OTRA", numeros)